@@ -0,0 +1,157 @@
+"""
+Per-session agent pool for the AgentCore entrypoint.
+
+A Strands `Agent` holds its conversation history and refuses concurrent
+invocations, so one shared agent caps a container at one conversation. The
+pool keeps one agent per AgentCore session ID, created on first use by a
+factory (typically a cheap clone of a prebuilt template agent), so sessions run
+in parallel while requests within one session are serialized.
+
+- Sessions idle for longer than `idle_ttl` seconds are dropped, and beyond
+  `max_sessions` the least recently used idle session is evicted.
+- At most `max_concurrency` invocations run at once; further requests wait up
+  to `queue_timeout` seconds for a slot and then fail with `AgentPoolBusy`.
+  A request first waits for its session's agent and only then for a slot, so
+  requests queued behind their own session never hold slots other sessions need.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator
+
+
+class AgentPoolBusy(RuntimeError):
+    """The session's agent or an invocation slot did not become free within the queue timeout."""
+
+
+class _Session:
+    __slots__ = ("agent", "lock", "active", "last_used")
+
+    def __init__(self, agent: Any, now: float):
+        self.agent = agent
+        self.lock = threading.Lock()
+        self.active = 0
+        self.last_used = now
+
+
+class AgentPool:
+    """LRU/idle-evicting pool of agents keyed by session ID, with bounded concurrency."""
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_sessions: int = 256,
+        idle_ttl: float = 900.0,
+        max_concurrency: int = 8,
+        queue_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._factory = factory
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.max_concurrency = max_concurrency
+        self.queue_timeout = queue_timeout
+        self._clock = clock
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._counters: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _evict(self, now: float) -> None:
+        """Drop idle-expired sessions, then LRU idle sessions over capacity (lock held)."""
+        for session_id, session in list(self._sessions.items()):
+            if session.active == 0 and now - session.last_used > self.idle_ttl:
+                del self._sessions[session_id]
+                self._counters["evicted_idle"] += 1
+        for session_id, session in list(self._sessions.items()):
+            if len(self._sessions) <= self.max_sessions:
+                break
+            if session.active == 0:
+                del self._sessions[session_id]
+                self._counters["evicted_lru"] += 1
+
+    def _checkout(self, session_id: str) -> _Session:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                return self._reuse(session_id, session)
+        # Built outside the lock so other sessions are not held up by the factory;
+        # if a concurrent request for the same session won the race, its agent is kept
+        candidate = _Session(self._factory(), self._clock())
+        with self._lock:
+            session = self._sessions.setdefault(session_id, candidate)
+            if session is not candidate:
+                return self._reuse(session_id, session)
+            self._counters["created"] += 1
+            session.active += 1
+            self._evict(self._clock())
+        return session
+
+    def _reuse(self, session_id: str, session: _Session) -> _Session:
+        """Mark a pooled session in use (lock held)."""
+        self._sessions.move_to_end(session_id)
+        self._counters["reused"] += 1
+        session.active += 1
+        self._evict(self._clock())
+        return session
+
+    def _checkin(self, session: _Session) -> None:
+        with self._lock:
+            session.active -= 1
+            session.last_used = self._clock()
+            self._evict(session.last_used)
+
+    @contextmanager
+    def lease(self, session_id: str) -> Iterator[Any]:
+        """
+        Yield the agent of `session_id` for one invocation, holding the session's lock
+        and then a concurrency slot.
+
+        Raises:
+            AgentPoolBusy: The session's agent or a slot did not become free within
+                `queue_timeout` seconds in total.
+        """
+        deadline = time.monotonic() + self.queue_timeout
+        session = self._checkout(session_id)
+        try:
+            if not session.lock.acquire(timeout=self.queue_timeout):
+                self._reject(f"Session {session_id} busy for {self.queue_timeout:g}s.")
+            try:
+                if not self._slots.acquire(timeout=max(0.0, deadline - time.monotonic())):
+                    self._reject(
+                        f"All {self.max_concurrency} agent slots busy for {self.queue_timeout:g}s."
+                    )
+                try:
+                    yield session.agent
+                finally:
+                    self._slots.release()
+            finally:
+                session.lock.release()
+        finally:
+            self._checkin(session)
+
+    def _reject(self, message: str) -> None:
+        with self._lock:
+            self._counters["rejected"] += 1
+        raise AgentPoolBusy(message)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pooled and active sessions, and created/reused/evicted/rejected counters."""
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "active": sum(1 for s in self._sessions.values() if s.active),
+                "max_sessions": self.max_sessions,
+                "max_concurrency": self.max_concurrency,
+                **{
+                    name: self._counters[name]
+                    for name in ("created", "reused", "evicted_idle", "evicted_lru", "rejected")
+                },
+            }
@@ -1,14 +1,21 @@
 import logging
 import argparse
 import os
-from typing import Any, Dict
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
 
-from bedrock_agentcore.runtime import BedrockAgentCoreApp
+from bedrock_agentcore.runtime import BedrockAgentCoreApp, PingStatus, RequestContext
+from starlette.responses import JSONResponse, PlainTextResponse
 
-from econflux_agent import build_agent
+from agent_pool import AgentPool, AgentPoolBusy
+from config import load_agent_pool_config, load_warmup_config
+from metrics import REGISTRY
+from resilience import LatencyHistogram
+from streaming import stream_agent
+from tracing import REQUEST_SPAN_KEY, SERVER, TRACE_LEVEL, get_tracer, parse_traceparent, start_span
+from warmup import get_warmup, warmup_status
 
-# Custom TRACE level
-TRACE_LEVEL = 5
+# Custom TRACE level (emitted by tracing.py for finished spans)
 logging.addLevelName(TRACE_LEVEL, "TRACE")
 
 
@@ -41,29 +48,243 @@ def configure_logging(log_level: str = None) -> None:
 
 logger = logging.getLogger(__name__)
 
-# Build the agent once at startup
-_agent = build_agent()
+# Built on first use (Strands and the model client stay out of startup); each
+# session gets a cheap clone of it
+_template_agent = None
+_template_lock = threading.Lock()
+
+
+def _get_template_agent():
+    global _template_agent
+    if _template_agent is None:
+        with _template_lock:
+            if _template_agent is None:
+                from econflux_agent import build_agent
+
+                _template_agent = build_agent()
+    return _template_agent
+
+
+def _new_session_agent():
+    from econflux_agent import clone_agent
+
+    return clone_agent(_get_template_agent())
+
+
+_pool_config = load_agent_pool_config()
+_agents = AgentPool(
+    _new_session_agent,
+    max_sessions=_pool_config.max_sessions,
+    idle_ttl=_pool_config.idle_ttl,
+    max_concurrency=_pool_config.max_concurrency,
+    queue_timeout=_pool_config.queue_timeout,
+)
+
+# Conversation key for requests without an AgentCore session (e.g. local runs)
+DEFAULT_SESSION_ID = "local"
+
+# Time to first streamed token, across streaming requests
+_ttft = LatencyHistogram()
 
 # Create the AgentCore wrapper
 app = BedrockAgentCoreApp()
 
 
+def _warm_model_connection() -> None:
+    """Resolve credentials and open a TLS connection to Bedrock runtime with a free CountTokens call."""
+    from botocore.exceptions import ClientError
+
+    model = _get_template_agent().model
+    try:
+        model.client.count_tokens(
+            modelId=model.get_config()["model_id"],
+            input={"converse": {"messages": [{"role": "user", "content": [{"text": "ping"}]}]}},
+        )
+    except ClientError as exc:
+        # Rejected (e.g. model without token counting) but the connection is pooled
+        logger.debug(f"Warm-up CountTokens rejected: {exc}")
+
+
+def _warm_tools() -> None:
+    """Import every lazily registered tool module."""
+    for tool in _get_template_agent().tool_registry.registry.values():
+        if hasattr(tool, "load"):
+            tool.load()
+
+
+def _warm_kb_client() -> None:
+    from rag_tools import _get_bedrock_runtime
+
+    _get_bedrock_runtime()
+
+
+def _warm_kb_queries(queries: List[str]) -> None:
+    """Run canned queries against every KB, opening pooled connections and priming caches."""
+    from rag_tools import query_all_kbs
+
+    for query in queries:
+        response = query_all_kbs(query=query)
+        if response.get("errors"):
+            logger.warning(f"Warm-up KB query {query!r} failed for: {response['errors']}")
+
+
+def _warm_screen_snapshots(universes: List[str], periods: List[str]) -> None:
+    """Preload the screening snapshots so the first screen_universe call only ranks."""
+    from analytics_tools import preload_snapshots
+
+    preload_snapshots(universes, periods)
+
+
+def warmup_steps() -> List[Tuple[str, Callable[[], Any]]]:
+    """Named warm-up steps enabled by the WARMUP_* settings."""
+    cfg = load_warmup_config()
+    steps: List[Tuple[str, Callable[[], Any]]] = [("agent", _get_template_agent)]
+    if cfg.model_connection:
+        steps.append(("model_connection", _warm_model_connection))
+    if cfg.load_tools:
+        steps.append(("tools", _warm_tools))
+    steps.append(("kb_client", _warm_kb_client))
+    if cfg.screen_universes and cfg.screen_periods:
+        steps.append((
+            "screen_snapshots",
+            lambda: _warm_screen_snapshots(cfg.screen_universes, cfg.screen_periods),
+        ))
+    if cfg.kb_queries:
+        steps.append(("kb_queries", lambda: _warm_kb_queries(cfg.kb_queries)))
+    return steps
+
+
+@app.ping
+def ping_status() -> PingStatus:
+    """Report busy until the startup warm-up has finished."""
+    return PingStatus.HEALTHY_BUSY if warmup_status()["status"] == "warming" else PingStatus.HEALTHY
+
+
+def health(request) -> JSONResponse:
+    """GET /health: warm-up, session pool, time-to-first-token and trace export stats."""
+    return JSONResponse(
+        {
+            "warmup": warmup_status(),
+            "agent_pool": _agents.stats(),
+            "ttft_ms": ttft_stats(),
+            "tracing": get_tracer().stats(),
+        }
+    )
+
+
+app.add_route("/health", health, methods=["GET"])
+
+
+def _runtime_families():
+    """Metrics owned by the app: session pool, tool slots and streaming time to first token."""
+    pool = _agents.stats()
+    families = [
+        ("econflux_agent_sessions", "gauge", "Pooled agent sessions", [({}, pool["sessions"])]),
+        ("econflux_agent_sessions_active", "gauge", "Sessions running an invocation",
+         [({}, pool["active"])]),
+        ("econflux_agent_sessions_evicted_total", "counter", "Pooled sessions evicted",
+         [({"reason": "idle"}, pool["evicted_idle"]), ({"reason": "lru"}, pool["evicted_lru"])]),
+        ("econflux_requests_rejected_total", "counter", "Requests rejected at capacity",
+         [({}, pool["rejected"])]),
+        ("econflux_ttft_seconds", "histogram", "Streaming time to first token",
+         [({}, _ttft.snapshot())]),
+    ]
+    executor = getattr(_template_agent, "tool_executor", None)
+    if hasattr(executor, "stats"):
+        tools = executor.stats()
+        families += [
+            ("econflux_tool_calls_running", "gauge", "Tool calls holding an execution slot",
+             [({}, tools["running"])]),
+            ("econflux_tool_calls_waited_total", "counter", "Tool calls that waited for a slot",
+             [({}, tools["waited"])]),
+        ]
+    return families
+
+
+REGISTRY.add_collector(_runtime_families)
+
+
+def metrics(request) -> PlainTextResponse:
+    """GET /metrics: request, model, tool, cache and KB metrics in Prometheus text format."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
+app.add_route("/metrics", metrics, methods=["GET"])
+
+
+def ttft_stats() -> Dict[str, Any]:
+    """Histogram (count, p50/p95/p99, buckets) of streaming time-to-first-token."""
+    return _ttft.snapshot()
+
+
+def _stream(session_id: str, user_prompt: str, span: Any) -> Iterator[Dict[str, Any]]:
+    def on_first_token(seconds: float) -> None:
+        _ttft.observe(seconds)
+        logger.info(f"Session {session_id} time to first token: {seconds * 1000:.0f} ms")
+
+    events = stream_agent(
+        lambda: _agents.lease(session_id),
+        user_prompt,
+        on_first_token,
+        invocation_state={"session_id": session_id, REQUEST_SPAN_KEY: span},
+    )
+    # The request span ends with the stream (also when the client disconnects)
+    try:
+        for event in events:
+            if event["type"] == "error":
+                span.record_error(event["error"])
+            elif event["type"] == "done":
+                span.set_attribute("econflux.ttft_ms", event["ttft_ms"] or 0.0)
+            yield event
+    finally:
+        events.close()
+        span.end()
+
+
 @app.entrypoint
-def invoke(payload: Dict[str, Any]) -> Dict[str, Any]:
+def invoke(
+    payload: Dict[str, Any], context: RequestContext
+) -> Union[Dict[str, Any], Iterator[Dict[str, Any]]]:
     """
     Entrypoint for EconFlux.
 
     Expected payload shape:
-      {"prompt": "<user question>"}
+      {"prompt": "<user question>", "stream": false}
+
+    Each AgentCore session (runtimeSessionId) has its own agent and conversation.
+    With "stream": true the response is a server-sent event stream of tokens,
+    tool calls/results and a final "done" event (see `streaming.py`).
     """
     user_prompt = payload.get("prompt")
     if not user_prompt:
         logger.error("Missing 'prompt' in payload")
         return {"error": "Missing 'prompt' in payload."}
 
-    logger.info(f"Processing prompt: {user_prompt[:50]}...")
-    response = _agent(user_prompt)
-    logger.debug(f"Agent response: {response}")
+    session_id = context.session_id or DEFAULT_SESSION_ID
+    logger.info(f"Processing prompt for session {session_id}: {user_prompt[:50]}...")
+    # Continues the caller's trace (and its sampling decision) when it sent a traceparent
+    span = start_span(
+        "econflux.request",
+        parent=parse_traceparent((context.request_headers or {}).get("traceparent")),
+        kind=SERVER,
+        **{"session.id": session_id, "econflux.stream": bool(payload.get("stream"))},
+    )
+    if payload.get("stream"):
+        return _stream(session_id, user_prompt, span)
+
+    with span:
+        try:
+            with _agents.lease(session_id) as agent:
+                response = agent(
+                    user_prompt,
+                    invocation_state={"session_id": session_id, REQUEST_SPAN_KEY: span},
+                )
+        except AgentPoolBusy as exc:
+            span.record_error(exc)
+            logger.warning(f"Rejected prompt for session {session_id}: {exc}")
+            return {"error": f"EconFlux is at capacity, please retry. {exc}"}
+    # Formatted only when DEBUG is enabled; str(response) renders the whole answer
+    logger.debug("Agent response: %s", response)
 
     return {"result": str(response)}
 
@@ -97,5 +318,13 @@ if __name__ == "__main__":
         "debug" if args.log_level.upper() == "TRACE" else args.log_level.lower()
     )
 
+    # Prime clients, connections and tool imports before the first request; in
+    # background mode /ping reports HealthyBusy until it finishes
+    warmup_mode = load_warmup_config().mode
+    if warmup_mode == "blocking":
+        get_warmup().run(warmup_steps())
+    elif warmup_mode == "background":
+        get_warmup().start(warmup_steps())
+
     # Run with access_log enabled to see requests
     app.run()
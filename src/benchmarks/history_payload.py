@@ -0,0 +1,68 @@
+"""
+Compare wire size of `get_price_history` payloads across output formats.
+
+Reports the JSON bytes and token count the model reads for each
+(period, interval) scenario in "rows", "columnar" and "columnar + delta" form.
+Tokens are counted with tiktoken's cl100k_base encoding when installed;
+otherwise a regex word/number/punctuation split is used as an approximation.
+
+Usage (from src/):
+    python benchmarks/history_payload.py
+"""
+
+import json
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from market_tools import get_price_history  # noqa: E402
+
+SCENARIOS = [("5d", "1d"), ("1mo", "1d"), ("3mo", "1d"), ("1y", "1d"), ("1d", "5m"), ("5y", "1wk")]
+FORMATS = [
+    ("rows", {"format": "rows"}),
+    ("columnar", {"format": "columnar"}),
+    ("columnar+delta", {"format": "columnar", "delta": True}),
+]
+
+try:
+    import tiktoken
+
+    # get_encoding downloads the BPE file on first use, so offline hosts fail here too
+    _encoding = tiktoken.get_encoding("cl100k_base")
+    TOKENIZER = "tiktoken cl100k_base"
+
+    def count_tokens(text: str) -> int:
+        return len(_encoding.encode(text))
+
+except Exception:
+    _token_pattern = re.compile(r"[A-Za-z]+|\d{1,3}|[^\sA-Za-z\d]")
+    TOKENIZER = "regex approximation (tiktoken unavailable or offline)"
+
+    def count_tokens(text: str) -> int:
+        return len(_token_pattern.findall(text))
+
+
+def main() -> None:
+    print(f"Tokenizer: {TOKENIZER}\n")
+    print(f"{'period':>6} {'interval':>8} {'format':>15} {'bars':>6} {'bytes':>9} {'tokens':>8} {'vs rows':>8}")
+    for period, interval in SCENARIOS:
+        baseline = None
+        for label, kwargs in FORMATS:
+            payload = get_price_history("AAPL", period=period, interval=interval, **kwargs)
+            # Strands serializes dict tool results with json.dumps(..., ensure_ascii=False)
+            text = json.dumps(payload, ensure_ascii=False)
+            history = payload["history"]
+            bars = len(history) if label == "rows" else len(history["o"])
+            tokens = count_tokens(text)
+            baseline = baseline or tokens
+            print(
+                f"{period:>6} {interval:>8} {label:>15} {bars:>6} {len(text.encode()):>9} "
+                f"{tokens:>8} {tokens / baseline:>7.0%}"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Import-time budget and cold-start check for the AgentCore entrypoint.
+
+Runs `python -X importtime -c "import app"` in a fresh interpreter, parses the
+report and prints the slowest top-level imports. Fails (exit 1) when:
+
+- the cumulative import time of `app` exceeds `--budget-ms`;
+- a module that should load lazily (tools, NumPy, SymPy, Strands) is imported
+  at startup;
+- the median wall-clock time of a fresh `python -c "import app"` (interpreter
+  start included) exceeds `--cold-start-ms`.
+
+Reference numbers on a 2-vCPU dev container: `import app` went from 2.6 s to
+0.9 s cold start once Strands, the tools and the template agent moved to first
+use; the default targets leave ~25% headroom.
+
+Usage (from src/):
+    python benchmarks/import_budget.py [--budget-ms 900] [--cold-start-ms 1200] [--runs 5]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not be imported before the first request
+LAZY_MODULES = [
+    "strands",
+    "strands_tools",
+    "sympy",
+    "numpy",
+    "market_tools",
+    "analytics_tools",
+    "rag_tools",
+    "econflux_agent",
+]
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_report(module: str = "app") -> List[Tuple[int, int, int, str]]:
+    """(self us, cumulative us, nesting depth, module) rows of `-X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            own, cumulative, indent, name = match.groups()
+            rows.append((int(own), int(cumulative), (len(indent) - 1) // 2, name))
+    return rows
+
+
+def cold_start(runs: int, module: str = "app") -> float:
+    """Median seconds for a fresh interpreter to import `module`."""
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", f"import {module}"], cwd=SRC_DIR, capture_output=True, check=True
+        )
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import-time budget check for app.py")
+    parser.add_argument("--budget-ms", type=float, default=900, help="Cumulative import budget")
+    parser.add_argument("--cold-start-ms", type=float, default=1200, help="Cold-start target")
+    parser.add_argument("--runs", type=int, default=5, help="Cold-start runs (median is kept)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list")
+    args = parser.parse_args()
+
+    rows = import_report()
+    # A module's own imports are reported just before it, one level deeper
+    end = next(i for i, row in enumerate(rows) if row[2] == 0 and row[3] == "app")
+    start = end
+    while start > 0 and rows[start - 1][2] > 0:
+        start -= 1
+    total_ms = rows[end][1] / 1000
+    children = [row for row in rows[start:end] if row[2] == 1]
+    print("Slowest imports under app (cumulative ms):")
+    for _, cumulative, _, name in sorted(children, reverse=True, key=lambda r: r[1])[: args.top]:
+        print(f"  {cumulative / 1000:8.1f}  {name}")
+
+    failures = []
+    eager = sorted({name.split(".")[0] for *_, name in rows if name.split(".")[0] in LAZY_MODULES})
+    if eager:
+        failures.append(f"imported at startup but should be lazy: {', '.join(eager)}")
+
+    print(f"\nImport time of app: {total_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    if total_ms > args.budget_ms:
+        failures.append(f"import time {total_ms:.0f} ms over budget")
+
+    cold_ms = cold_start(args.runs) * 1000
+    print(f"Cold start (median of {args.runs}): {cold_ms:.0f} ms", end=" ")
+    print(f"(target {args.cold_start_ms:.0f} ms)")
+    if cold_ms > args.cold_start_ms:
+        failures.append(f"cold start {cold_ms:.0f} ms over target")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
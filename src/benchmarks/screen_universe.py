@@ -0,0 +1,60 @@
+"""
+Latency of `screen_universe` over the ~5,000-name `total_market` universe.
+
+Builds the snapshots the way warm-up does (`preload_snapshots`), then times the
+first screen of each metric, i.e. the first request after a deploy, and the
+median of repeated screens. Fails (exit 1) if a first screen is slower than
+`--max-ms`. The snapshot build itself (bar generation for every name) is
+reported separately; it runs during warm-up and in the background refresh.
+
+Reference numbers on a 2-vCPU dev container: snapshot build 350-450 ms per
+period, first screen under 1 ms, repeated screens ~0.2 ms.
+
+Usage (from src/):
+    python benchmarks/screen_universe.py [--period 5d] [--repeats 50] [--max-ms 50]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics_tools import SCREEN_METRICS, preload_snapshots, screen_universe  # noqa: E402
+from universes import UNIVERSES  # noqa: E402
+
+
+def timed(fn, *args, **kwargs) -> float:
+    started = time.perf_counter()
+    fn(*args, **kwargs)
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--period", default="5d", help="Screening window")
+    parser.add_argument("--repeats", type=int, default=50, help="Screens per metric")
+    parser.add_argument("--max-ms", type=float, default=50.0, help="Allowed first-screen ms")
+    args = parser.parse_args()
+
+    size = len(UNIVERSES["total_market"])
+    build_ms = timed(preload_snapshots, ["total_market"], [args.period])
+    print(f"total_market: {size} names, {args.period} snapshot built in {build_ms:.0f} ms")
+
+    slowest = 0.0
+    for metric in SCREEN_METRICS:
+        first = timed(screen_universe, "total_market", metric, period=args.period)
+        repeats = [
+            timed(screen_universe, "total_market", metric, period=args.period)
+            for _ in range(args.repeats)
+        ]
+        slowest = max(slowest, first)
+        print(f"  {metric:<13} first {first:6.2f} ms   median {statistics.median(repeats):6.2f} ms")
+    print(f"Slowest first screen: {slowest:.2f} ms (limit {args.max_ms:g} ms)")
+    sys.exit(1 if slowest > args.max_ms else 0)
+
+
+if __name__ == "__main__":
+    main()
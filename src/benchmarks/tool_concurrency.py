@@ -0,0 +1,137 @@
+"""
+Wall-clock time of multi-tool model turns, sequential vs bounded concurrent execution.
+
+Replays the tool calls the model makes for the "Comparative & Sector Analysis"
+scenarios in `tests/prompts.md` through a real Strands agent: a scripted model
+requests every call in one assistant message, then answers. Each market-data
+provider call sleeps `--latency` seconds to stand in for the network round
+trip, and the market caches are cleared before every run so each scenario pays
+it. No AWS access is needed.
+
+Usage (from src/):
+    python benchmarks/tool_concurrency.py [--latency 0.3] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strands import Agent  # noqa: E402
+from strands.models import Model  # noqa: E402
+from strands.tools.executors import SequentialToolExecutor  # noqa: E402
+
+import market_tools  # noqa: E402
+from config import load_tool_execution_config  # noqa: E402
+from tool_executor import build_tool_executor  # noqa: E402
+
+# Scenario -> tool calls the model issues in its first turn
+SCENARIOS: Dict[str, List[tuple]] = {
+    "retail peer analysis (WMT, TGT, COST)": [
+        (tool, {"ticker": ticker, **extra})
+        for ticker in ("WMT", "TGT", "COST")
+        for tool, extra in (
+            ("get_stock_price", {}),
+            ("get_price_history", {"period": "1mo", "format": "columnar"}),
+            ("get_earnings", {}),
+        )
+    ],
+    "semiconductor reports (ASML, TSM, QCOM)": [
+        ("generate_stock_report", {"ticker": ticker, "period": "1mo", "format": "columnar"})
+        for ticker in ("ASML", "TSM", "QCOM")
+    ],
+    "bank volumes (GS, MS, JPM)": [
+        ("get_price_history", {"ticker": ticker, "period": "5d"}) for ticker in ("GS", "MS", "JPM")
+    ],
+}
+TOOLS = [
+    market_tools.get_stock_price,
+    market_tools.get_price_history,
+    market_tools.get_earnings,
+    market_tools.generate_stock_report,
+]
+
+
+class ScriptedModel(Model):
+    """Requests `calls` as one tool-use message, then answers with a fixed sentence."""
+
+    def __init__(self, calls: List[tuple]):
+        self.calls = calls
+
+    def update_config(self, **model_config: Any) -> None:
+        pass
+
+    def get_config(self) -> Any:
+        return {}
+
+    async def structured_output(self, *args: Any, **kwargs: Any):
+        raise NotImplementedError
+        yield  # pragma: no cover
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs: Any):
+        yield {"messageStart": {"role": "assistant"}}
+        if messages[-1]["role"] == "user" and not any("toolResult" in b for b in messages[-1]["content"]):
+            for i, (name, arguments) in enumerate(self.calls):
+                yield {"contentBlockStart": {"start": {"toolUse": {"toolUseId": f"t{i}", "name": name}}}}
+                yield {"contentBlockDelta": {"delta": {"toolUse": {"input": json.dumps(arguments)}}}}
+                yield {"contentBlockStop": {}}
+            yield {"messageStop": {"stopReason": "tool_use"}}
+            return
+        yield {"contentBlockDelta": {"delta": {"text": "Done."}}}
+        yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "end_turn"}}
+
+
+def _add_latency(seconds: float) -> None:
+    provider = market_tools._provider
+    for name in ("quotes", "bars", "earnings"):
+        method = getattr(provider, name)
+
+        def delayed(*args, _method=method, **kwargs):
+            time.sleep(seconds)
+            return _method(*args, **kwargs)
+
+        setattr(provider, name, delayed)
+
+
+def run(calls: List[tuple], executor) -> float:
+    market_tools._market_cache.clear()
+    agent = Agent(
+        model=ScriptedModel(calls), tools=TOOLS, tool_executor=executor, callback_handler=None
+    )
+    started = time.perf_counter()
+    agent("benchmark")
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.3, help="Seconds per provider call")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario (best is kept)")
+    args = parser.parse_args()
+    _add_latency(args.latency)
+
+    executors = {
+        "sequential": SequentialToolExecutor(),
+        "concurrent": build_tool_executor(load_tool_execution_config()),
+    }
+    print(f"Provider latency: {args.latency:g}s per call, best of {args.repeat}\n")
+    print(f"{'scenario':<42}{'calls':>6}{'sequential':>12}{'concurrent':>12}{'speedup':>9}")
+    for scenario, calls in SCENARIOS.items():
+        times = {
+            mode: min(run(calls, executor) for _ in range(args.repeat))
+            for mode, executor in executors.items()
+        }
+        speedup = times["sequential"] / times["concurrent"]
+        print(
+            f"{scenario:<42}{len(calls):>6}{times['sequential']:>11.2f}s"
+            f"{times['concurrent']:>11.2f}s{speedup:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
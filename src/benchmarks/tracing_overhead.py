@@ -0,0 +1,123 @@
+"""
+Request latency with tracing off vs. every request sampled.
+
+Runs the 9-call "retail peer analysis" scenario of `tool_concurrency.py` through a
+real Strands agent carrying the production hooks (`AgentMetrics`, `AgentTracing`),
+inside an `econflux.request` span like `app.invoke`, exporting every span to a
+file. Tool results come from the warm market cache and each model call takes
+`--model-latency` seconds (default 50 ms; Bedrock turns take 0.5-5 s), so the
+percentage is a conservative bound. Modes run in ABBA order; the overhead is the
+median of the per-round ratios. Fails (exit 1) above `--max-overhead` percent.
+
+Reference numbers on a 2-vCPU dev container: 12 spans per request, ~4.5 us per
+span on the request path; at 50 ms per model call the difference is within run
+to run noise (-0.3% to +0.1%). With `--model-latency 0` (the Strands loop alone,
+~9 ms per request) tracing adds ~0.6 ms (~6%), mostly OTLP JSON serialization
+on the exporter thread.
+
+Usage (from src/):
+    python benchmarks/tracing_overhead.py [--requests 10] [--rounds 10] [--model-latency 0.05]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from strands import Agent  # noqa: E402
+
+import tracing  # noqa: E402
+from config import load_tool_execution_config  # noqa: E402
+from instrumentation import AgentMetrics, AgentTracing  # noqa: E402
+from tool_concurrency import SCENARIOS, TOOLS, ScriptedModel  # noqa: E402
+from tool_executor import build_tool_executor  # noqa: E402
+
+CALLS = SCENARIOS["retail peer analysis (WMT, TGT, COST)"]
+
+
+class SlowModel(ScriptedModel):
+    """`ScriptedModel` taking `latency` seconds before each response."""
+
+    def __init__(self, calls, latency: float):
+        super().__init__(calls)
+        self.latency = latency
+
+    async def stream(self, *args: Any, **kwargs: Any):
+        await asyncio.sleep(self.latency)
+        async for event in super().stream(*args, **kwargs):
+            yield event
+
+
+def request(agent: Agent) -> None:
+    agent.messages.clear()
+    with tracing.start_span("econflux.request", kind=tracing.SERVER) as span:
+        agent("benchmark", invocation_state={tracing.REQUEST_SPAN_KEY: span})
+
+
+def span_cost(tracer: tracing.Tracer, n: int = 100_000) -> float:
+    """Microseconds to start and end one child span."""
+    root = tracer.start_span("root", parent=None)
+    started = time.perf_counter()
+    for _ in range(n):
+        tracer.start_span("child", parent=root, tool="x").end()
+    return (time.perf_counter() - started) / n * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=10, help="Requests per block")
+    parser.add_argument("--rounds", type=int, default=10, help="ABBA rounds")
+    parser.add_argument("--model-latency", type=float, default=0.05, help="Seconds per model call")
+    parser.add_argument("--max-overhead", type=float, default=1.0, help="Allowed overhead (%%)")
+    args = parser.parse_args()
+
+    out = os.path.join(tempfile.mkdtemp(), "traces.jsonl")
+    exporter = tracing.BatchExporter(tracing.FileExporter(out))
+    tracers = {"off": tracing.Tracer(1.0, None), "sampled 100%": tracing.Tracer(1.0, exporter)}
+    agent = Agent(
+        model=SlowModel(CALLS, args.model_latency),
+        tools=TOOLS,
+        tool_executor=build_tool_executor(load_tool_execution_config()),
+        hooks=[AgentMetrics(), AgentTracing()],
+        callback_handler=None,
+    )
+    for _ in range(args.requests):  # warm caches and imports
+        request(agent)
+
+    def block(mode: str) -> float:
+        tracing._tracer = tracers[mode]
+        started = time.perf_counter()
+        for _ in range(args.requests):
+            request(agent)
+        return (time.perf_counter() - started) / args.requests
+
+    blocks: Dict[str, list] = {mode: [] for mode in tracers}
+    for _ in range(args.rounds):
+        for mode in ("off", "sampled 100%", "sampled 100%", "off"):
+            blocks[mode].append(block(mode))
+    exporter.flush()
+
+    per_request = {mode: statistics.median(times) for mode, times in blocks.items()}
+    ratios = [traced / off for traced, off in zip(blocks["sampled 100%"], blocks["off"])]
+    overhead = (statistics.median(ratios) - 1.0) * 100.0
+    added_ms = (per_request["sampled 100%"] - per_request["off"]) * 1000
+    spans = exporter.exported / (2 * args.rounds * args.requests)
+    print(f"{len(CALLS)} tool calls, {args.model_latency:g}s per model call, ", end="")
+    print(f"{spans:.0f} spans/request")
+    for mode, seconds in per_request.items():
+        print(f"  {mode:<14}{seconds * 1000:9.2f} ms/request")
+    print(f"  span start+end: {span_cost(tracers['sampled 100%']):.1f} us on the request path")
+    print(f"Overhead at 100% sampling: {overhead:+.2f}% ({added_ms:+.2f} ms/request, ", end="")
+    print(f"limit {args.max_overhead:g}%)")
+    sys.exit(1 if overhead > args.max_overhead else 0)
+
+
+if __name__ == "__main__":
+    main()
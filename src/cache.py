@@ -0,0 +1,136 @@
+"""
+Thread-safe TTL + LRU cache shared by the EconFlux tools.
+
+Entries expire after a per-entry time-to-live and the least recently used entry
+is evicted once `maxsize` is reached. Keys are tuples whose first element is a
+namespace (e.g. "quote", "history"); hit/miss/eviction counters are kept per
+namespace so each tool's hit rate can be reported separately.
+
+Caches holding JSON-serializable keys and values can be persisted with
+`dump`/`load`; expiry is stored as wall-clock time so entries keep their
+remaining TTL across restarts.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded mapping of tuple keys to values with per-entry expiry."""
+
+    def __init__(self, maxsize: int = 1024, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Counter] = {}
+
+    def _count(self, key: Tuple[Hashable, ...], event: str) -> None:
+        self._counters.setdefault(str(key[0]), Counter())[event] += 1
+
+    def get(self, key: Tuple[Hashable, ...], default: Any = None) -> Any:
+        """Return the live value for `key` (refreshing its LRU position) or `default`."""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self._count(key, "hits")
+                    return value
+                del self._entries[key]
+                self._count(key, "expirations")
+            self._count(key, "misses")
+            return default
+
+    def set(self, key: Tuple[Hashable, ...], value: Any, ttl: float) -> None:
+        """Store `value` for `ttl` seconds, evicting LRU entries beyond `maxsize`."""
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                self._count(evicted, "evictions")
+
+    def get_or_set(
+        self, key: Tuple[Hashable, ...], ttl: float, factory: Callable[[], Any]
+    ) -> Any:
+        """Return the cached value for `key`, computing and storing it on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value, ttl)
+        return value
+
+    def dump(self, path: str) -> int:
+        """Write live entries to `path` as JSON (atomically); returns the entry count."""
+        now, wall_now = self._clock(), time.time()
+        with self._lock:
+            entries = [
+                [list(key), wall_now + (expires_at - now), value]
+                for key, (expires_at, value) in self._entries.items()
+                if expires_at > now
+            ]
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        # A private temp file per dump, so concurrent dumps never interleave
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".cache-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return len(entries)
+
+    def load(self, path: str) -> int:
+        """Restore unexpired entries written by `dump`; returns the entry count."""
+        if not os.path.exists(path):
+            return 0
+        with open(path) as f:
+            entries = json.load(f)
+
+        wall_now = time.time()
+        restored = 0
+        for key, expires_wall, value in entries:
+            if expires_wall > wall_now:
+                self.set(tuple(key), value, expires_wall - wall_now)
+                restored += 1
+        return restored
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self, namespace: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Counters (hits, misses, evictions, expirations, hit_rate) per namespace,
+        plus current size and capacity.
+        """
+        with self._lock:
+            namespaces = {}
+            for name, counter in self._counters.items():
+                if namespace is not None and name != namespace:
+                    continue
+                lookups = counter["hits"] + counter["misses"]
+                namespaces[name] = {
+                    "hits": counter["hits"],
+                    "misses": counter["misses"],
+                    "evictions": counter["evictions"],
+                    "expirations": counter["expirations"],
+                    "hit_rate": round(counter["hits"] / lookups, 4) if lookups else 0.0,
+                }
+            return {"size": len(self._entries), "maxsize": self.maxsize, "namespaces": namespaces}
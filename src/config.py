@@ -1,5 +1,6 @@
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, List
 
 from dotenv import load_dotenv
 
@@ -18,6 +19,106 @@ class AppConfig:
     eval_mode: bool
 
 
+@dataclass
+class AgentPoolConfig:
+    max_sessions: int
+    idle_ttl: float
+    max_concurrency: int
+    queue_timeout: float
+
+
+@dataclass
+class WarmupConfig:
+    mode: str
+    model_connection: bool
+    load_tools: bool
+    kb_queries: List[str] = field(default_factory=list)
+    screen_universes: List[str] = field(default_factory=list)
+    screen_periods: List[str] = field(default_factory=list)
+
+
+@dataclass
+class TracingConfig:
+    exporter: str
+    sample_rate: float
+    file_path: str
+    otlp_endpoint: str
+    service_name: str
+    batch_size: int
+    export_interval: float
+    max_queue: int
+
+
+@dataclass
+class ToolExecutionConfig:
+    mode: str
+    max_concurrency: int
+    per_tool_limits: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class RagCacheConfig:
+    ttl: float
+    max_entries: int
+    path: str | None
+    save_interval: float
+
+
+@dataclass
+class RagBackendConfig:
+    backend: str
+    index_path: str
+
+
+@dataclass
+class RagFactConfig:
+    index_dir: str
+
+
+@dataclass
+class RagContextConfig:
+    token_budget: int
+
+
+@dataclass
+class RagResilienceConfig:
+    connect_timeout: float
+    read_timeout: float
+    max_attempts: int
+    max_pool_connections: int
+    fanout_workers: int
+    fanout_timeout: float
+    hedge_quantile: float
+    hedge_min_delay: float
+    hedge_min_samples: int
+    hedge_budget: int
+    breaker_failures: int
+    breaker_reset: float
+    stale_ttl: float
+
+
+@dataclass
+class MarketDataConfig:
+    provider: str
+    barstore_path: str
+
+
+@dataclass
+class MarketCacheConfig:
+    max_entries: int
+    quote_ttl: float
+    history_ttl: float
+    earnings_ttl: float
+
+
+@dataclass
+class MarketReportConfig:
+    quote_timeout: float
+    history_timeout: float
+    earnings_timeout: float
+    max_workers: int
+
+
 def load_model_config() -> ModelConfig:
     return ModelConfig(
         model_id=os.getenv("BEDROCK_MODEL_ID", "us.anthropic.claude-sonnet-4-20250514-v1:0"),
@@ -30,3 +131,141 @@ def load_app_config() -> AppConfig:
     return AppConfig(
         eval_mode=os.getenv("EVAL_MODE", "false").lower() == "true",
     )
+
+
+def load_agent_pool_config() -> AgentPoolConfig:
+    return AgentPoolConfig(
+        max_sessions=int(os.getenv("AGENT_POOL_MAX_SESSIONS", "256")),
+        idle_ttl=float(os.getenv("AGENT_SESSION_IDLE_TTL", "900")),
+        max_concurrency=int(os.getenv("AGENT_MAX_CONCURRENCY", "8")),
+        queue_timeout=float(os.getenv("AGENT_QUEUE_TIMEOUT", "30")),
+    )
+
+
+def load_warmup_config() -> WarmupConfig:
+    """
+    WARMUP_KB_QUERIES holds ";"-separated canned queries (none by default: they are billed);
+    WARMUP_SCREEN_UNIVERSES/PERIODS are comma-separated.
+    """
+    return WarmupConfig(
+        mode=os.getenv("WARMUP_MODE", "background").lower(),
+        model_connection=os.getenv("WARMUP_MODEL_CONNECTION", "true").lower() == "true",
+        load_tools=os.getenv("WARMUP_LOAD_TOOLS", "true").lower() == "true",
+        kb_queries=[q.strip() for q in os.getenv("WARMUP_KB_QUERIES", "").split(";") if q.strip()],
+        screen_universes=[
+            u.strip().lower()
+            for u in os.getenv("WARMUP_SCREEN_UNIVERSES", "large_cap,total_market").split(",")
+            if u.strip()
+        ],
+        screen_periods=[
+            p.strip() for p in os.getenv("WARMUP_SCREEN_PERIODS", "5d,1mo").split(",") if p.strip()
+        ],
+    )
+
+
+def load_tracing_config() -> TracingConfig:
+    """TRACE_EXPORTER is "off" (default), "file" (OTLP JSON lines) or "otlp" (OTLP/HTTP JSON)."""
+    return TracingConfig(
+        exporter=os.getenv("TRACE_EXPORTER", "off").lower(),
+        sample_rate=min(1.0, max(0.0, float(os.getenv("TRACE_SAMPLE_RATE", "1.0")))),
+        file_path=os.getenv("TRACE_FILE", "traces.jsonl"),
+        otlp_endpoint=os.getenv("TRACE_OTLP_ENDPOINT", "http://localhost:4318/v1/traces"),
+        service_name=os.getenv("TRACE_SERVICE_NAME", "econflux"),
+        batch_size=int(os.getenv("TRACE_BATCH_SIZE", "256")),
+        export_interval=float(os.getenv("TRACE_EXPORT_INTERVAL", "2")),
+        max_queue=int(os.getenv("TRACE_MAX_QUEUE", "4096")),
+    )
+
+
+# Tools that fan out internally or call a model get a lower per-tool concurrency cap
+DEFAULT_TOOL_LIMITS = {
+    "generate_stock_reports": 2,
+    "screen_universe": 2,
+    "compute_correlations": 2,
+    "use_llm": 2,
+}
+
+
+def load_tool_execution_config() -> ToolExecutionConfig:
+    """TOOL_CONCURRENCY_LIMITS overrides the per-tool caps as "tool=n,tool=n"."""
+    limits = dict(DEFAULT_TOOL_LIMITS)
+    for item in os.getenv("TOOL_CONCURRENCY_LIMITS", "").split(","):
+        name, _, value = item.partition("=")
+        if name.strip() and value.strip():
+            limits[name.strip()] = int(value)
+    return ToolExecutionConfig(
+        mode=os.getenv("TOOL_EXECUTION", "concurrent").lower(),
+        max_concurrency=int(os.getenv("TOOL_MAX_CONCURRENCY", "16")),
+        per_tool_limits=limits,
+    )
+
+
+def load_market_cache_config() -> MarketCacheConfig:
+    return MarketCacheConfig(
+        max_entries=int(os.getenv("MARKET_CACHE_MAX_ENTRIES", "4096")),
+        quote_ttl=float(os.getenv("MARKET_CACHE_QUOTE_TTL", "15")),
+        history_ttl=float(os.getenv("MARKET_CACHE_HISTORY_TTL", "300")),
+        earnings_ttl=float(os.getenv("MARKET_CACHE_EARNINGS_TTL", "3600")),
+    )
+
+
+def load_market_report_config() -> MarketReportConfig:
+    return MarketReportConfig(
+        quote_timeout=float(os.getenv("MARKET_QUOTE_TIMEOUT", "2")),
+        history_timeout=float(os.getenv("MARKET_HISTORY_TIMEOUT", "5")),
+        earnings_timeout=float(os.getenv("MARKET_EARNINGS_TIMEOUT", "3")),
+        max_workers=int(os.getenv("MARKET_REPORT_WORKERS", "8")),
+    )
+
+
+def load_market_data_config() -> MarketDataConfig:
+    return MarketDataConfig(
+        provider=os.getenv("MARKET_DATA_PROVIDER", "synthetic").lower(),
+        barstore_path=os.getenv("MARKET_BARSTORE_PATH", "data/barstore"),
+    )
+
+
+def load_rag_cache_config() -> RagCacheConfig:
+    return RagCacheConfig(
+        ttl=float(os.getenv("RAG_CACHE_TTL", "600")),
+        max_entries=int(os.getenv("RAG_CACHE_MAX_ENTRIES", "1024")),
+        path=os.getenv("RAG_CACHE_PATH") or None,
+        save_interval=float(os.getenv("RAG_CACHE_SAVE_INTERVAL", "60")),
+    )
+
+
+def load_rag_backend_config(kb_env_prefix: str, corpus: str) -> RagBackendConfig:
+    """Backend for one KB: `<prefix>_BACKEND`, else RAG_BACKEND, else Bedrock."""
+    backend = os.getenv(f"{kb_env_prefix}_BACKEND") or os.getenv("RAG_BACKEND", "bedrock")
+    index_dir = os.getenv("RAG_LOCAL_INDEX_DIR", "data/kb_index")
+    return RagBackendConfig(
+        backend=backend.lower(),
+        index_path=os.path.join(index_dir, f"{corpus}.npz"),
+    )
+
+
+def load_rag_fact_config() -> RagFactConfig:
+    return RagFactConfig(index_dir=os.getenv("RAG_LOCAL_INDEX_DIR", "data/kb_index"))
+
+
+def load_rag_context_config() -> RagContextConfig:
+    return RagContextConfig(token_budget=int(os.getenv("RAG_CONTEXT_TOKEN_BUDGET", "1500")))
+
+
+def load_rag_resilience_config() -> RagResilienceConfig:
+    """Bedrock retrieve timeouts, hedging and circuit breaking (RAG_HEDGE_QUANTILE=0: no hedging)."""
+    return RagResilienceConfig(
+        connect_timeout=float(os.getenv("RAG_CONNECT_TIMEOUT", "2")),
+        read_timeout=float(os.getenv("RAG_READ_TIMEOUT", "8")),
+        max_attempts=int(os.getenv("RAG_MAX_ATTEMPTS", "2")),
+        max_pool_connections=int(os.getenv("RAG_MAX_POOL_CONNECTIONS", "32")),
+        fanout_workers=int(os.getenv("RAG_FANOUT_WORKERS", "32")),
+        fanout_timeout=float(os.getenv("RAG_FANOUT_TIMEOUT", "20")),
+        hedge_quantile=float(os.getenv("RAG_HEDGE_QUANTILE", "0.95")),
+        hedge_min_delay=float(os.getenv("RAG_HEDGE_MIN_DELAY", "0.25")),
+        hedge_min_samples=int(os.getenv("RAG_HEDGE_MIN_SAMPLES", "20")),
+        hedge_budget=int(os.getenv("RAG_HEDGE_BUDGET", "4")),
+        breaker_failures=int(os.getenv("RAG_BREAKER_FAILURES", "5")),
+        breaker_reset=float(os.getenv("RAG_BREAKER_RESET", "30")),
+        stale_ttl=float(os.getenv("RAG_STALE_TTL", "86400")),
+    )
@@ -0,0 +1,94 @@
+"""
+Date-sorted earnings calendar index for the mock market data.
+
+Every ticker reports on a stable quarterly cycle whose phase is derived from a
+CRC32 of the symbol, so dates agree across calls, sessions and processes. The
+calendar keeps parallel (date, symbol) arrays sorted by date; a window query is
+two `np.searchsorted` calls plus a slice, i.e. O(log n + k).
+"""
+
+from __future__ import annotations
+
+import threading
+import zlib
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from universes import UNIVERSES
+
+CYCLE_DAYS = 91
+# Arbitrary fixed origin for the quarterly cycles; only phase differences matter
+CYCLE_ANCHOR = np.datetime64("2024-01-01", "D")
+HORIZON_DAYS = 366
+
+
+def _phases(symbols: List[str]) -> np.ndarray:
+    return np.array([zlib.crc32(s.encode()) % CYCLE_DAYS for s in symbols], dtype=np.int64)
+
+
+def _report_dates(phases: np.ndarray, cycles: np.ndarray) -> np.ndarray:
+    """Report dates of shape (len(phases), len(cycles)), rolled forward to weekdays."""
+    raw = CYCLE_ANCHOR + (phases[:, None] + CYCLE_DAYS * cycles[None, :]).astype("timedelta64[D]")
+    return np.busday_offset(raw, 0, roll="forward")
+
+
+def _cycles_around(as_of: np.datetime64, horizon_days: int) -> np.ndarray:
+    center = int((as_of - CYCLE_ANCHOR).astype(np.int64)) // CYCLE_DAYS
+    span = horizon_days // CYCLE_DAYS + 2
+    return np.arange(center - span, center + span + 1)
+
+
+def next_earnings_date(symbol: str, as_of: Optional[np.datetime64] = None) -> np.datetime64:
+    """First report date on or after `as_of` (default today) for `symbol`."""
+    as_of = np.datetime64("today", "D") if as_of is None else np.datetime64(as_of, "D")
+    dates = _report_dates(_phases([symbol]), _cycles_around(as_of, CYCLE_DAYS))[0]
+    return dates[np.searchsorted(dates, as_of)]
+
+
+class EarningsCalendar:
+    """Report dates for a fixed symbol set within +/- `horizon_days` of `as_of`."""
+
+    def __init__(
+        self,
+        symbols: List[str],
+        as_of: Optional[np.datetime64] = None,
+        horizon_days: int = HORIZON_DAYS,
+    ):
+        self.as_of = np.datetime64("today", "D") if as_of is None else np.datetime64(as_of, "D")
+        symbols = list(dict.fromkeys(symbols))
+
+        dates = _report_dates(_phases(symbols), _cycles_around(self.as_of, horizon_days))
+        owners = np.repeat(np.array(symbols, dtype=object), dates.shape[1])
+        dates = dates.ravel()
+
+        keep = np.abs((dates - self.as_of).astype(np.int64)) <= horizon_days
+        order = np.argsort(dates[keep], kind="stable")
+        self.dates = dates[keep][order]
+        self.symbols = owners[keep][order]
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def window(self, start: np.datetime64, end: np.datetime64) -> Tuple[np.ndarray, np.ndarray]:
+        """(dates, symbols) of reports with start <= date <= end, date-ordered."""
+        lo = np.searchsorted(self.dates, np.datetime64(start, "D"), side="left")
+        hi = np.searchsorted(self.dates, np.datetime64(end, "D"), side="right")
+        return self.dates[lo:hi], self.symbols[lo:hi]
+
+
+_calendar: Optional[EarningsCalendar] = None
+_calendar_lock = threading.Lock()
+
+
+def get_calendar() -> EarningsCalendar:
+    """
+    Shared calendar over the `total_market` universe (a superset of every named
+    universe), built once and rebuilt when the day rolls over.
+    """
+    global _calendar
+    today = np.datetime64("today", "D")
+    with _calendar_lock:
+        if _calendar is None or _calendar.as_of != today:
+            _calendar = EarningsCalendar(UNIVERSES["total_market"], as_of=today)
+        return _calendar
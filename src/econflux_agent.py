@@ -2,24 +2,37 @@ from typing import List
 
 from strands import Agent
 from strands.models import BedrockModel
-from strands_tools import calculator, retrieve, use_llm
 
-
-from config import load_model_config
-from market_tools import (
-    get_stock_price,
-    get_price_history,
-    get_earnings,
-    generate_stock_report,
-)
-
-from health_check_tools import ping
-from rag_tools import (
-    query_monetary_policy_kb,
-    query_regulatory_changes_kb,
-    query_policy_decisions_kb,
-    query_economic_indicators_kb,
-)
+from config import load_model_config, load_tool_execution_config
+from instrumentation import AgentMetrics, AgentTracing
+from lazy_tools import lazy_tools
+from tool_executor import build_tool_executor
+
+# Agent tools as Strands import targets, in registration order. They are registered
+# from cached specs and imported on first call (see `lazy_tools.py`), so strands_tools
+# (SymPy), NumPy and the tool modules stay out of startup.
+TOOL_TARGETS: List[str] = [
+    "market_tools:get_stock_price",
+    "market_tools:get_stock_prices",
+    "market_tools:get_price_history",
+    "market_tools:get_earnings",
+    "market_tools:earnings_in_window",
+    "market_tools:generate_stock_report",
+    "market_tools:generate_stock_reports",
+    "analytics_tools:compute_technicals",
+    "analytics_tools:compute_correlations",
+    "analytics_tools:screen_universe",
+    "health_check_tools:ping",
+    "strands_tools.calculator",
+    "strands_tools.retrieve",
+    "rag_tools:query_economic_indicators_kb",
+    "rag_tools:query_monetary_policy_kb",
+    "rag_tools:query_policy_decisions_kb",
+    "rag_tools:query_regulatory_changes_kb",
+    "rag_tools:query_all_kbs",
+    "rag_tools:lookup_policy_facts",
+    "strands_tools.use_llm",
+]
 
 
 def build_agent() -> Agent:
@@ -60,25 +73,31 @@ def build_agent() -> Agent:
     Your responses should demonstrate both financial expertise and practical utility for economists, analysts, and financial decision-makers.
     """
 
-    tools: List[object] = [
-        get_stock_price,
-        get_price_history,
-        get_earnings,
-        generate_stock_report,
-        ping,
-        calculator,
-        retrieve,
-        query_economic_indicators_kb,
-        query_monetary_policy_kb,
-        query_policy_decisions_kb,
-        query_regulatory_changes_kb,
-        use_llm,
-    ]
+    tools = lazy_tools(TOOL_TARGETS)
 
+    # Independent tool calls of one model turn run in parallel, within global and per-tool caps;
+    # the hooks record request, model and tool metrics and trace spans (see `instrumentation.py`)
     agent = Agent(
         model=model,
         system_prompt=system_prompt,
         tools=tools,
+        tool_executor=build_tool_executor(load_tool_execution_config()),
+        hooks=[AgentMetrics(), AgentTracing()],
     )
 
     return agent
+
+
+def clone_agent(template: Agent) -> Agent:
+    """
+    New agent with an empty conversation that shares `template`'s model client,
+    system prompt, tool objects and tool executor (so its concurrency caps hold
+    across sessions), so per-session agents skip model and tool setup.
+    """
+    return Agent(
+        model=template.model,
+        system_prompt=template.system_prompt,
+        tools=list(template.tool_registry.registry.values()),
+        tool_executor=template.tool_executor,
+        hooks=[AgentMetrics(), AgentTracing()],
+    )
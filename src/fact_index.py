@@ -0,0 +1,168 @@
+"""
+Structured fact tables extracted from the synthetic RAG corpus headers.
+
+Every generated report starts with "Field: value" header lines (Institution,
+Meeting Date, Policy Action, Rate Movement, Vote Outcome, Indicator, ...). This
+ingestion step parses them into one columnar table per corpus, so structured
+questions ("last three ECB decisions", "CPI releases since June") are answered
+by an index scan instead of a vector search.
+
+Rows are stored sorted by (key, date), where the key is the bank, indicator or
+sector column of the corpus; a keyed lookup is a `np.searchsorted` for the key
+block followed by one for the date range inside it. A date-ordered permutation
+serves lookups across all keys.
+
+Build the tables next to the local BM25 indexes with:
+
+    python fact_index.py --data financial_intelligence_data --out data/kb_index
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from rag_corpus import parse_corpus, parse_headers
+
+FACTS_SUFFIX = ".facts.npz"
+
+# Corpus -> column that keys its sorted index
+KEY_COLUMNS: Dict[str, str] = {
+    "monetary_policy_summaries": "bank",
+    "policy_decisions": "bank",
+    "economic_indicators": "indicator",
+    "regulatory_changes": "sector",
+}
+
+
+def _to_column(values: List[Any]) -> np.ndarray:
+    present = [v for v in values if v is not None]
+    if present and all(isinstance(v, np.datetime64) for v in present):
+        return np.array(
+            [v if v is not None else np.datetime64("NaT") for v in values], dtype="datetime64[D]"
+        )
+    if present and all(isinstance(v, float) for v in present):
+        return np.array([v if v is not None else np.nan for v in values], dtype=np.float64)
+    return np.array(["" if v is None else str(v) for v in values], dtype=str)
+
+
+class FactTable:
+    """Header fields of one corpus, one array per column, rows sorted by (key, date)."""
+
+    def __init__(self, corpus: str, key: str, columns: Dict[str, np.ndarray]):
+        self.corpus = corpus
+        self.key = key
+        self.columns = columns
+        self.by_date = np.argsort(columns["date"], kind="stable")
+        self.key_values: List[str] = np.unique(columns[key]).tolist()
+
+    def __len__(self) -> int:
+        return len(self.columns["date"])
+
+    @classmethod
+    def build(cls, corpus_path: str) -> "FactTable":
+        corpus = os.path.splitext(os.path.basename(corpus_path))[0]
+        key = KEY_COLUMNS[corpus]
+        rows = []
+        for number, text in parse_corpus(corpus_path):
+            fields = parse_headers(text)
+            fields["record"] = float(number)
+            rows.append(fields)
+
+        names = list(dict.fromkeys(name for row in rows for name in row))
+        columns = {name: _to_column([row.get(name) for row in rows]) for name in names}
+        columns["record"] = columns["record"].astype(np.int32)
+        order = np.lexsort((columns["date"], columns[key]))
+        return cls(corpus, key, {name: values[order] for name, values in columns.items()})
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        np.savez_compressed(path, **self.columns, _corpus=np.array(self.corpus), _key=np.array(self.key))
+
+    @classmethod
+    def load(cls, path: str) -> "FactTable":
+        with np.load(path, allow_pickle=False) as data:
+            columns = {name: data[name] for name in data.files}
+        corpus, key = str(columns.pop("_corpus")), str(columns.pop("_key"))
+        return cls(corpus, key, columns)
+
+    def lookup(
+        self,
+        key: Optional[str] = None,
+        since: Optional[np.datetime64] = None,
+        until: Optional[np.datetime64] = None,
+    ) -> np.ndarray:
+        """Row positions matching `key` (all keys if None) within [since, until], oldest first."""
+        dates = self.columns["date"]
+        if key is None:
+            rows, row_dates = self.by_date, dates[self.by_date]
+        else:
+            keys = self.columns[self.key]
+            lo = np.searchsorted(keys, key, side="left")
+            hi = np.searchsorted(keys, key, side="right")
+            rows, row_dates = np.arange(lo, hi), dates[lo:hi]
+
+        start = 0 if since is None else np.searchsorted(row_dates, since, side="left")
+        end = len(row_dates) if until is None else np.searchsorted(row_dates, until, side="right")
+        return rows[start:end]
+
+    def row(self, position: int, names: List[str]) -> Dict[str, Any]:
+        """Plain-Python values of `names` at `position` (None for missing fields)."""
+        values: Dict[str, Any] = {}
+        for name in names:
+            column = self.columns.get(name)
+            value = None if column is None else column[position]
+            if isinstance(value, np.datetime64):
+                value = None if np.isnat(value) else str(value)
+            elif isinstance(value, np.floating):
+                value = None if np.isnan(value) else float(value)
+            elif isinstance(value, np.integer):
+                value = int(value)
+            elif isinstance(value, np.str_):
+                value = str(value) or None
+            values[name] = value
+        return values
+
+
+_tables: Dict[str, FactTable] = {}
+_tables_lock = threading.Lock()
+
+
+def get_fact_table(index_dir: str, corpus: str) -> FactTable:
+    """Load `<index_dir>/<corpus>.facts.npz` once per process and reuse it."""
+    path = os.path.join(index_dir, corpus + FACTS_SUFFIX)
+    table = _tables.get(path)
+    if table is None:
+        with _tables_lock:
+            table = _tables.get(path)
+            if table is None:
+                table = _tables[path] = FactTable.load(path)
+    return table
+
+
+def build_fact_tables(data_dir: str, out_dir: str) -> Dict[str, int]:
+    """Extract a fact table from every known corpus in `data_dir` into `out_dir`."""
+    built = {}
+    for corpus in KEY_COLUMNS:
+        corpus_path = os.path.join(data_dir, f"{corpus}.txt")
+        if not os.path.exists(corpus_path):
+            continue
+        table = FactTable.build(corpus_path)
+        table.save(os.path.join(out_dir, corpus + FACTS_SUFFIX))
+        built[corpus] = len(table)
+    return built
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build structured fact tables from the RAG corpora")
+    parser.add_argument("--data", "-d", default="financial_intelligence_data", help="Corpus directory")
+    parser.add_argument("--out", "-o", default="data/kb_index", help="Fact table output directory")
+    args = parser.parse_args()
+
+    for corpus, count in build_fact_tables(args.data, args.out).items():
+        print(f"Extracted {count} fact rows from {corpus}.txt")
+    print(f"Fact tables saved to: {args.out}/")
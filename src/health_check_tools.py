@@ -1,13 +1,15 @@
 from strands import tool
 
-import datetime as datetime
-from typing import Dict
+from datetime import datetime
+from typing import Any, Dict
+
+from warmup import warmup_status
 
 
 @tool
-def ping() -> Dict[str, str]:
+def ping() -> Dict[str, Any]:
     """
-    Return a simple liveness check with the current server time.
+    Return a simple liveness check with the current server time and warm-up state.
 
     Use to confirm the agent runtime responds; it does not check dependencies.
 
@@ -15,9 +17,12 @@ def ping() -> Dict[str, str]:
         Dict with:
         - ok: Literal "pong" indicating the service responded
         - tod: Server time in "%Y-%m-%d %H:%M:%S" (local timezone)
+        - warmup: "cold", "warming" or "warm" (startup connections and caches primed)
+        - warmup_ms: How long the startup warm-up took, once finished
 
     Notes:
         - Time is taken from the host OS clock and may not reflect wall-clock accuracy
     """
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    return {"ok": "pong", "tod": now}
+    status = warmup_status()
+    return {"ok": "pong", "tod": now, "warmup": status["status"], "warmup_ms": status["duration_ms"]}
@@ -0,0 +1,285 @@
+"""
+Request, model-call and tool-call metrics and trace spans for the EconFlux agents.
+
+`AgentMetrics` is a Strands hook provider attached to every agent (see
+`econflux_agent.py`). Hooks see each tool call the agent executes, whichever
+module it comes from (market, analytics, RAG, health check, strands_tools),
+and each Bedrock model call, so tools need no decorator of their own:
+
+- econflux_requests_total{outcome}, econflux_request_duration_seconds
+- econflux_model_calls_total{outcome}, econflux_model_call_duration_seconds
+- econflux_tool_calls_total{tool,status}, econflux_tool_duration_seconds{tool}
+  (status is "error" when the tool raised or returned an {"error": ...} dict)
+- econflux_tokens_total{direction}
+
+At the end of each invocation one summary line is logged (INFO) with the
+session, duration, model and tool time, tool errors and token usage. Metrics are
+kept in `metrics.REGISTRY`, served as Prometheus text on GET /metrics.
+
+`AgentTracing` opens the model.turn and tool.call spans of a trace (see
+`tracing.py`) under the request span passed in invocation_state
+(`tracing.REQUEST_SPAN_KEY`), and makes each tool call the active span while the
+tool runs.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from strands.hooks import (
+    AfterInvocationEvent,
+    AfterModelCallEvent,
+    AfterToolCallEvent,
+    BeforeInvocationEvent,
+    BeforeModelCallEvent,
+    BeforeToolCallEvent,
+    HookProvider,
+    HookRegistry,
+)
+
+import tracing
+from metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# invocation_state key of the running request's `_RequestStats`
+STATE_KEY = "econflux_request_stats"
+# invocation_state key of the hooks' `_TraceState`
+TRACE_KEY = "econflux_trace"
+
+# Tools report failures as small {"error": ...} dicts; larger results are not parsed
+_ERROR_RESULT_MAX_CHARS = 2048
+
+_requests = REGISTRY.counter("econflux_requests_total", "Agent invocations by outcome")
+_request_seconds = REGISTRY.histogram(
+    "econflux_request_duration_seconds", "Agent invocation latency"
+)
+_model_calls = REGISTRY.counter("econflux_model_calls_total", "Bedrock model calls by outcome")
+_model_seconds = REGISTRY.histogram(
+    "econflux_model_call_duration_seconds", "Bedrock model call latency (full streamed response)"
+)
+_tool_calls = REGISTRY.counter("econflux_tool_calls_total", "Tool calls by tool and status")
+_tool_seconds = REGISTRY.histogram("econflux_tool_duration_seconds", "Tool call latency")
+_tokens = REGISTRY.counter("econflux_tokens_total", "Model tokens by direction")
+
+
+class _RequestStats:
+    """Timings of one invocation; tool calls of a turn may update it concurrently."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.model_started: Optional[float] = None
+        self.model_calls = 0
+        self.model_seconds = 0.0
+        self.tool_calls: Counter = Counter()
+        self.tool_seconds = 0.0
+        self.tool_errors = 0
+        self.lock = threading.Lock()
+
+
+def _failed(result: Dict[str, Any]) -> bool:
+    """True for an error tool result or one wrapping an {"error": ...} dict."""
+    if result.get("status") == "error":
+        return True
+    for block in result.get("content", []):
+        text = block.get("text")
+        if text and len(text) <= _ERROR_RESULT_MAX_CHARS and '"error"' in text:
+            try:
+                value = json.loads(text)
+            except ValueError:
+                continue
+            if isinstance(value, dict) and "error" in value:
+                return True
+    return False
+
+
+class AgentMetrics(HookProvider):
+    """Records agent, model and tool metrics and logs a summary line per request."""
+
+    def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        registry.add_callback(BeforeInvocationEvent, self._before_invocation)
+        registry.add_callback(BeforeModelCallEvent, self._before_model_call)
+        registry.add_callback(AfterModelCallEvent, self._after_model_call)
+        registry.add_callback(AfterToolCallEvent, self._after_tool_call)
+        registry.add_callback(AfterInvocationEvent, self._after_invocation)
+
+    @staticmethod
+    def _stats(invocation_state: Dict[str, Any]) -> _RequestStats:
+        stats = invocation_state.get(STATE_KEY)
+        if stats is None:
+            stats = invocation_state[STATE_KEY] = _RequestStats()
+        return stats
+
+    def _before_invocation(self, event: BeforeInvocationEvent) -> None:
+        event.invocation_state[STATE_KEY] = _RequestStats()
+
+    def _before_model_call(self, event: BeforeModelCallEvent) -> None:
+        self._stats(event.invocation_state).model_started = time.perf_counter()
+
+    def _after_model_call(self, event: AfterModelCallEvent) -> None:
+        stats = self._stats(event.invocation_state)
+        if stats.model_started is None:
+            return
+        seconds = time.perf_counter() - stats.model_started
+        stats.model_started = None
+        stats.model_calls += 1
+        stats.model_seconds += seconds
+        _model_seconds.observe(seconds)
+        _model_calls.inc(outcome="error" if event.exception is not None else "ok")
+
+    def _after_tool_call(self, event: AfterToolCallEvent) -> None:
+        name = event.tool_use.get("name", "unknown")
+        failed = event.exception is not None or _failed(event.result)
+        seconds = event.duration or 0.0
+        _tool_seconds.observe(seconds, tool=name)
+        _tool_calls.inc(tool=name, status="error" if failed else "success")
+        stats = self._stats(event.invocation_state)
+        with stats.lock:
+            stats.tool_calls[name] += 1
+            stats.tool_seconds += seconds
+            stats.tool_errors += failed
+
+    def _after_invocation(self, event: AfterInvocationEvent) -> None:
+        stats = self._stats(event.invocation_state)
+        seconds = time.perf_counter() - stats.started
+        outcome = "ok" if event.result is not None else "error"
+        _request_seconds.observe(seconds)
+        _requests.inc(outcome=outcome)
+
+        invocation = event.agent.event_loop_metrics.latest_agent_invocation
+        usage = invocation.usage if invocation is not None else {}
+        input_tokens = usage.get("inputTokens", 0)
+        output_tokens = usage.get("outputTokens", 0)
+        _tokens.inc(input_tokens, direction="input")
+        _tokens.inc(output_tokens, direction="output")
+
+        tools = ",".join(f"{name}x{count}" for name, count in sorted(stats.tool_calls.items()))
+        logger.info(
+            f"request session={event.invocation_state.get('session_id', '-')} "
+            f"outcome={outcome} duration_ms={seconds * 1000:.0f} "
+            f"model_calls={stats.model_calls} model_ms={stats.model_seconds * 1000:.0f} "
+            f"tool_calls={sum(stats.tool_calls.values())} "
+            f"tool_ms={stats.tool_seconds * 1000:.0f} tool_errors={stats.tool_errors} "
+            f"input_tokens={input_tokens} output_tokens={output_tokens} tools={tools or '-'}"
+        )
+
+
+class _TraceState:
+    """Spans of one invocation: the request, the current model turn and running tools."""
+
+    def __init__(self, request: Any, owned: bool):
+        self.request = request
+        self.owned = owned
+        self.turn: Any = None
+        self.turns = 0
+        self.tools: Dict[str, Any] = {}
+
+
+class AgentTracing(HookProvider):
+    """Records model.turn and tool.call spans under the invocation's request span."""
+
+    def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        registry.add_callback(BeforeInvocationEvent, self._before_invocation)
+        registry.add_callback(BeforeModelCallEvent, self._before_model_call)
+        registry.add_callback(AfterModelCallEvent, self._after_model_call)
+        registry.add_callback(BeforeToolCallEvent, self._before_tool_call)
+        registry.add_callback(AfterToolCallEvent, self._after_tool_call)
+        registry.add_callback(AfterInvocationEvent, self._after_invocation)
+
+    def _before_invocation(self, event: BeforeInvocationEvent) -> None:
+        request = event.invocation_state.get(tracing.REQUEST_SPAN_KEY)
+        # Agents invoked without one (e.g. outside app.py) start their own trace
+        owned = request is None
+        if owned:
+            request = tracing.start_span("econflux.request", kind=tracing.SERVER)
+        event.invocation_state[TRACE_KEY] = _TraceState(request, owned)
+        # Tool tasks inherit it, so spans they open (or skip, if unsampled) join this trace
+        tracing.activate(request)
+
+    def _before_model_call(self, event: BeforeModelCallEvent) -> None:
+        state = event.invocation_state.get(TRACE_KEY)
+        if state is None or not state.request.sampled:
+            return
+        if state.turn is not None:
+            state.turn.end()
+        state.turns += 1
+        model = event.agent.model
+        state.turn = tracing.start_span(
+            "model.turn",
+            parent=state.request,
+            kind=tracing.CLIENT,
+            **{
+                "gen_ai.operation.name": "chat",
+                "gen_ai.request.model": lambda: model.get_config().get("model_id", ""),
+                "econflux.turn": state.turns,
+            },
+        )
+
+    def _after_model_call(self, event: AfterModelCallEvent) -> None:
+        state = event.invocation_state.get(TRACE_KEY)
+        if state is None or state.turn is None:
+            return
+        turn = state.turn
+        turn.set_attribute("econflux.model_call_ms", (time.time_ns() - turn.start_ns) / 1e6)
+        if event.exception is not None:
+            turn.record_error(event.exception)
+        elif event.stop_response is not None:
+            turn.set_attribute("gen_ai.response.finish_reasons", [event.stop_response.stop_reason])
+
+    def _before_tool_call(self, event: BeforeToolCallEvent) -> None:
+        state = event.invocation_state.get(TRACE_KEY)
+        if state is None or not state.request.sampled:
+            return
+        tool_use = event.tool_use
+        span = tracing.start_span(
+            "tool.call",
+            parent=state.turn or state.request,
+            **{
+                "gen_ai.operation.name": "execute_tool",
+                "gen_ai.tool.name": tool_use.get("name", "unknown"),
+                "gen_ai.tool.call.id": tool_use.get("toolUseId", ""),
+            },
+        )
+        state.tools[tool_use.get("toolUseId", "")] = span
+        # Each tool call runs in its own task, so this only scopes the tool's own work
+        tracing.activate(span)
+
+    def _after_tool_call(self, event: AfterToolCallEvent) -> None:
+        state = event.invocation_state.get(TRACE_KEY)
+        if state is None:
+            return
+        span = state.tools.pop(event.tool_use.get("toolUseId", ""), None)
+        if span is None:
+            return
+        if event.exception is not None:
+            span.record_error(event.exception)
+        elif _failed(event.result):
+            span.record_error("tool returned an error")
+        span.end()
+
+    def _after_invocation(self, event: AfterInvocationEvent) -> None:
+        state = event.invocation_state.get(TRACE_KEY)
+        if state is None:
+            return
+        if state.turn is not None:
+            state.turn.end()
+        request = state.request
+        if request.sampled:
+            invocation = event.agent.event_loop_metrics.latest_agent_invocation
+            usage = invocation.usage if invocation is not None else {}
+            request.set_attributes(
+                **{
+                    "gen_ai.usage.input_tokens": lambda: usage.get("inputTokens", 0),
+                    "gen_ai.usage.output_tokens": lambda: usage.get("outputTokens", 0),
+                    "econflux.model_turns": state.turns,
+                }
+            )
+            if event.result is None:
+                request.record_error("invocation failed")
+        if state.owned:
+            request.end()
@@ -1,21 +1,53 @@
 import boto3
 import json
+import time
 
 PROMPT="""
-Conduct a peer analysis of Walmart, Target, and Costco as a table. 
-Compare their price performance, earnings quality, and upcoming catalyst calendars. 
+Conduct a peer analysis of Walmart, Target, and Costco as a table.
+Compare their price performance, earnings quality, and upcoming catalyst calendars.
 Which retailer presents the most compelling risk-reward profile right now?
 """
 
 client = boto3.client("bedrock-agentcore", region_name="us-east-1")
-payload = json.dumps({"prompt": PROMPT})
+payload = json.dumps({"prompt": PROMPT, "stream": True})
 
+started = time.perf_counter()
 response = client.invoke_agent_runtime(
     agentRuntimeArn="arn:aws:bedrock-agentcore:us-east-1:128959305403:runtime/econflux-5nwkhPGvJS",
     runtimeSessionId="dfmeoagmreaklgmrkleafremoigrmtesogmtrskhmtkrlshmt",  # Must be 33+ chars
     payload=payload,
     qualifier="DEFAULT",  # Optional
 )
-response_body = response["response"].read()
-response_data = json.loads(response_body)
-print("Agent Response:", response_data)
+
+if "text/event-stream" not in response.get("contentType", ""):
+    # Non-streaming deployment: one JSON body
+    response_data = json.loads(response["response"].read())
+    print("Agent Response:", response_data)
+else:
+    # Server-sent events: token, tool_call, tool_result, done and error events
+    ttft = None
+    for line in response["response"].iter_lines(chunk_size=64):
+        line = line.decode("utf-8")
+        if not line.startswith("data: "):
+            continue
+        event = json.loads(line[len("data: "):])
+        kind = event.get("type")
+        if kind == "token":
+            if ttft is None:
+                ttft = time.perf_counter() - started
+            print(event["text"], end="", flush=True)
+        elif kind == "tool_call":
+            print(f"\n[calling {event['tool']}]", flush=True)
+        elif kind == "tool_result":
+            print(f"[{event['tool']}: {event['status']}]", flush=True)
+        elif kind == "done":
+            print()
+            print(f"Stop reason: {event.get('stop_reason')}")
+            print(f"Server time to first token: {event.get('ttft_ms')} ms")
+        elif kind == "error" or "error" in event:
+            print(f"\nAgent error: {event.get('error', event)}")
+
+    total = time.perf_counter() - started
+    if ttft is not None:
+        print(f"Client time to first token: {ttft * 1000:.0f} ms")
+    print(f"Total time: {total * 1000:.0f} ms")
@@ -0,0 +1,146 @@
+"""
+Lazily loaded agent tools, for faster container cold starts.
+
+Registering a tool normally means importing its module: the market, analytics
+and RAG tools pull in NumPy and boto3, and `strands_tools.calculator` imports
+SymPy (~0.4 s). `LazyTool` registers a tool from its cached spec instead and
+imports the module the first time the model calls the tool.
+
+Tools are named by Strands import targets ("module:function" for @tool
+functions, "module" for module-based tools). Their specs are cached in
+`tool_specs.json` next to this file; regenerate it after changing a tool's
+signature or docstring:
+
+    python lazy_tools.py            # rewrite tool_specs.json
+    python lazy_tools.py --check    # exit 1 if it is stale
+
+A target missing from the cache is loaded eagerly, so a stale cache costs
+startup time, never a tool.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+from typing import Any, Dict, List, Optional
+
+from strands.tools.registry import ToolRegistry
+from strands.types.tools import AgentTool, ToolGenerator, ToolSpec, ToolUse
+
+logger = logging.getLogger(__name__)
+
+SPECS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tool_specs.json")
+
+
+def load_tool(target: str) -> AgentTool:
+    """Import `target` and return its tool object, normalized the way `Agent` does."""
+    registry = ToolRegistry()
+    (name,) = registry.process_tools([target])
+    return registry.registry[name]
+
+
+class LazyTool(AgentTool):
+    """Stands in for the tool at `target`, importing it on first call."""
+
+    def __init__(self, target: str, name: str, spec: ToolSpec, tool_type: str):
+        super().__init__()
+        self.target = target
+        self._name = name
+        self._spec = spec
+        self._type = tool_type
+        self._tool: Optional[AgentTool] = None
+        self._lock = threading.Lock()
+
+    @property
+    def tool_name(self) -> str:
+        return self._name
+
+    @property
+    def tool_spec(self) -> ToolSpec:
+        return self._spec
+
+    @property
+    def tool_type(self) -> str:
+        return self._type
+
+    @property
+    def loaded(self) -> bool:
+        return self._tool is not None
+
+    def load(self) -> AgentTool:
+        """The real tool, imported once (thread-safe)."""
+        if self._tool is None:
+            with self._lock:
+                if self._tool is None:
+                    tool = load_tool(self.target)
+                    if json.loads(json.dumps(tool.tool_spec)) != self._spec:
+                        logger.warning(
+                            f"Cached spec of {self._name} is stale; run lazy_tools.py to refresh"
+                        )
+                    self._tool = tool
+        return self._tool
+
+    async def stream(
+        self, tool_use: ToolUse, invocation_state: Dict[str, Any], **kwargs: Any
+    ) -> ToolGenerator:
+        # The first import can take a while; keep it off the event loop
+        tool = self._tool or await asyncio.to_thread(self.load)
+        async for event in tool.stream(tool_use, invocation_state, **kwargs):
+            yield event
+
+
+def _read_specs(path: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as exc:
+        logger.warning(f"Tool spec cache unavailable ({exc}); loading tools eagerly")
+        return {}
+
+
+def lazy_tools(targets: List[str], path: str = SPECS_PATH) -> List[AgentTool]:
+    """A `LazyTool` per target found in the spec cache; others are loaded now."""
+    specs = _read_specs(path)
+    tools: List[AgentTool] = []
+    for target in targets:
+        cached = specs.get(target)
+        if cached is None:
+            tools.append(load_tool(target))
+        else:
+            tools.append(LazyTool(target, cached["name"], cached["spec"], cached["type"]))
+    return tools
+
+
+def build_specs(targets: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Spec cache entries for `targets`, importing every tool."""
+    specs = {}
+    for target in targets:
+        tool = load_tool(target)
+        specs[target] = {"name": tool.tool_name, "type": tool.tool_type, "spec": tool.tool_spec}
+    return json.loads(json.dumps(specs))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh or check the cached agent tool specs")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if tool_specs.json is stale")
+    args = parser.parse_args()
+
+    from econflux_agent import TOOL_TARGETS
+
+    specs = build_specs(TOOL_TARGETS)
+    if args.check:
+        stale = sorted(t for t in TOOL_TARGETS if _read_specs(SPECS_PATH).get(t) != specs[t])
+        if stale:
+            print(f"Stale tool specs: {', '.join(stale)}. Run: python lazy_tools.py")
+            sys.exit(1)
+        print(f"{len(specs)} tool specs up to date")
+    else:
+        with open(SPECS_PATH, "w", encoding="utf-8") as f:
+            json.dump(specs, f, indent=1, sort_keys=True)
+            f.write("\n")
+        print(f"Wrote {len(specs)} tool specs to {SPECS_PATH}")
@@ -0,0 +1,246 @@
+"""
+Offline BM25 retrieval over the synthetic finance corpora.
+
+Indexes the `financial_intelligence_data/*.txt` files written by
+`rag/synthetic_data_gen.py` so the RAG tools can run without a Bedrock
+Knowledge Base (CI, load tests, benchmarks, air-gapped demos). Each report in a
+corpus (title line, header fields and summary paragraphs) is one passage.
+
+The index is an inverted index stored column-wise in one compressed `.npz`
+file per corpus:
+
+    terms          sorted vocabulary (term id = position)
+    offsets        postings of term i are docs/freqs[offsets[i]:offsets[i+1]]
+    docs, freqs    concatenated postings lists (passage id, term frequency)
+    lengths        passage lengths in tokens
+    text, text_offsets, records   UTF-8 passage text blob and report numbers
+    dates, meta_<field>           per-passage filter metadata (see `rag_corpus`)
+
+A query looks its terms up with `np.searchsorted`, scores only the postings of
+those terms with BM25 and takes the top k with `np.argpartition`. Metadata
+filters (date range, bank, indicator, sector, topic) mask passages out before
+ranking, the same way Bedrock applies retrieval filters.
+
+Build the indexes with:
+
+    python local_kb.py --data financial_intelligence_data --out data/kb_index
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from rag_corpus import METADATA_FIELDS, parse_corpus, parse_headers, record_metadata
+
+# BM25 parameters (Robertson/Zaragoza defaults)
+K1 = 1.2
+B = 0.75
+
+INDEX_SUFFIX = ".npz"
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:\.[0-9]+)?")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was "
+    "were which while will with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word/number tokens (decimals such as 0.25 kept whole), minus stopwords."""
+    return [t for t in _TOKEN.findall(text.lower()) if t not in _STOPWORDS]
+
+
+class LocalIndex:
+    """Read-only BM25 index over the passages of one corpus."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], source: str):
+        self.terms = arrays["terms"]
+        self.offsets = arrays["offsets"]
+        self.docs = arrays["docs"]
+        self.freqs = arrays["freqs"]
+        self.lengths = arrays["lengths"]
+        self.text = arrays["text"]
+        self.text_offsets = arrays["text_offsets"]
+        self.records = arrays["records"]
+        self.dates = arrays["dates"]
+        self.metadata = {name: arrays[f"meta_{name}"] for name in METADATA_FIELDS}
+        self.source = source
+
+        n_docs = len(self.lengths)
+        df = np.diff(self.offsets)
+        self.idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+        # Per-passage length normalisation term of the BM25 denominator
+        avg_length = self.lengths.mean() if n_docs else 1.0
+        self.norm = K1 * (1 - B + B * self.lengths / avg_length)
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    @classmethod
+    def build(cls, corpus_path: str) -> "LocalIndex":
+        records = parse_corpus(corpus_path)
+        postings: Dict[str, Dict[int, int]] = {}
+        lengths = np.zeros(len(records), dtype=np.int32)
+        for doc, (_, text) in enumerate(records):
+            tokens = tokenize(text)
+            lengths[doc] = len(tokens)
+            for token in tokens:
+                counts = postings.setdefault(token, {})
+                counts[doc] = counts.get(doc, 0) + 1
+
+        terms = sorted(postings)
+        sizes = np.array([len(postings[t]) for t in terms], dtype=np.int64)
+        offsets = np.concatenate([[0], np.cumsum(sizes)])
+        docs = np.fromiter(
+            (d for t in terms for d in postings[t]), dtype=np.int32, count=int(offsets[-1])
+        )
+        freqs = np.fromiter(
+            (c for t in terms for c in postings[t].values()), dtype=np.uint16, count=int(offsets[-1])
+        )
+
+        metadata = [record_metadata(parse_headers(text)) for _, text in records]
+        encoded = [text.encode("utf-8") for _, text in records]
+        text_offsets = np.concatenate([[0], np.cumsum([len(e) for e in encoded])]).astype(np.int64)
+        arrays = {
+            "terms": np.array(terms, dtype=str),
+            "offsets": offsets,
+            "docs": docs,
+            "freqs": freqs,
+            "lengths": lengths,
+            "text": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+            "text_offsets": text_offsets,
+            "records": np.array([n for n, _ in records], dtype=np.int32),
+            "dates": np.array([m["date"] for m in metadata], dtype="datetime64[D]"),
+        }
+        for name in METADATA_FIELDS:
+            arrays[f"meta_{name}"] = np.array([m[name] for m in metadata], dtype=str)
+        return cls(arrays, source=os.path.basename(corpus_path))
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        np.savez_compressed(
+            path,
+            terms=self.terms,
+            offsets=self.offsets,
+            docs=self.docs,
+            freqs=self.freqs,
+            lengths=self.lengths,
+            text=self.text,
+            text_offsets=self.text_offsets,
+            records=self.records,
+            dates=self.dates,
+            source=np.array(self.source),
+            **{f"meta_{name}": values for name, values in self.metadata.items()},
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "LocalIndex":
+        with np.load(path, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files}
+        return cls(arrays, source=str(arrays.pop("source")))
+
+    def passage(self, doc: int) -> str:
+        return self.text[self.text_offsets[doc] : self.text_offsets[doc + 1]].tobytes().decode("utf-8")
+
+    def filter_mask(self, filters: Dict[str, str]) -> np.ndarray:
+        """
+        Passages matching all `filters`: since/until (YYYY-MM-DD, inclusive), bank
+        (exact name) and indicator/sector/topic/direction (case-insensitive substring).
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if filters.get("since"):
+            mask &= self.dates >= np.datetime64(filters["since"], "D")
+        if filters.get("until"):
+            mask &= self.dates <= np.datetime64(filters["until"], "D")
+        for name in METADATA_FIELDS:
+            value = filters.get(name)
+            if not value:
+                continue
+            if name == "bank":
+                mask &= self.metadata[name] == value
+            else:
+                mask &= np.char.find(self.metadata[name], value.lower()) >= 0
+        return mask
+
+    def search(
+        self, query: str, k: int, filters: Optional[Dict[str, str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Top-`k` passages by BM25 score as {text, score, source} dicts (best first)."""
+        tokens = tokenize(query)
+        if not tokens or not len(self):
+            return []
+        query_terms = np.unique(np.array(tokens, dtype=str))
+        ids = np.searchsorted(self.terms, query_terms)
+        found = ids < len(self.terms)
+        found[found] = self.terms[ids[found]] == query_terms[found]
+        ids = ids[found]
+        if not len(ids):
+            return []
+
+        spans = self.offsets[ids + 1] - self.offsets[ids]
+        positions = np.concatenate([np.arange(self.offsets[i], self.offsets[i + 1]) for i in ids])
+        docs = self.docs[positions]
+        tf = self.freqs[positions].astype(np.float64)
+        weights = np.repeat(self.idf[ids], spans) * tf * (K1 + 1) / (tf + self.norm[docs])
+        scores = np.bincount(docs, weights=weights, minlength=len(self))
+        if filters:
+            scores[~self.filter_mask(filters)] = 0.0
+
+        k = min(k, int(np.count_nonzero(scores)))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            {
+                "text": self.passage(doc),
+                "score": round(float(scores[doc]), 4),
+                "source": {"uri": self.source, "record": int(self.records[doc])},
+            }
+            for doc in top
+        ]
+
+
+_indexes: Dict[str, LocalIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(path: str) -> LocalIndex:
+    """Load the index at `path` once per process and reuse it."""
+    index = _indexes.get(path)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(path)
+            if index is None:
+                index = _indexes[path] = LocalIndex.load(path)
+    return index
+
+
+def build_indexes(data_dir: str, out_dir: str) -> Dict[str, int]:
+    """Index every `*.txt` corpus in `data_dir` into `<out_dir>/<corpus>.npz`."""
+    built = {}
+    for filename in sorted(os.listdir(data_dir)):
+        if not filename.endswith(".txt"):
+            continue
+        corpus = filename[: -len(".txt")]
+        index = LocalIndex.build(os.path.join(data_dir, filename))
+        index.save(os.path.join(out_dir, corpus + INDEX_SUFFIX))
+        built[corpus] = len(index)
+    return built
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build local BM25 indexes for the RAG corpora")
+    parser.add_argument("--data", "-d", default="financial_intelligence_data", help="Corpus directory")
+    parser.add_argument("--out", "-o", default="data/kb_index", help="Index output directory")
+    args = parser.parse_args()
+
+    for corpus, count in build_indexes(args.data, args.out).items():
+        print(f"Indexed {count} passages from {corpus}.txt")
+    print(f"Indexes saved to: {args.out}/")
@@ -0,0 +1,280 @@
+"""
+Synthetic OHLCV bar engine backing the EconFlux market tools.
+
+Base series are generated as NumPy arrays at 1-minute (intraday intervals) or
+1-day (daily and longer intervals) resolution for a whole basket of tickers at
+once, then resampled to the requested interval with vectorized group reductions
+(`np.ufunc.reduceat` over bucket boundaries) instead of per-bar Python loops.
+
+Each ticker's path is seeded with the CRC32 of its symbol (as the earnings
+calendar is) and generated backwards from a fixed last close, so history of
+any window, intraday bars and quotes agree across calls and processes.
+"""
+
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+# Regular US equity session: 09:30-16:00 exchange time
+SESSION_OPEN_MINUTE = 9 * 60 + 30
+SESSION_MINUTES = 390
+
+# Requested window -> number of trading days ("ytd" is resolved at call time)
+PERIOD_TRADING_DAYS = {
+    "1d": 1,
+    "5d": 5,
+    "1mo": 21,
+    "3mo": 63,
+    "6mo": 126,
+    "1y": 252,
+    "2y": 504,
+    "5y": 1260,
+}
+SUPPORTED_PERIODS = (*PERIOD_TRADING_DAYS, "ytd")
+
+# Intraday intervals -> bucket width in minutes of the 1-minute base series
+INTRADAY_INTERVAL_MINUTES = {"1m": 1, "5m": 5, "15m": 15, "30m": 30, "1h": 60}
+DAILY_INTERVALS = ("1d", "1wk", "1mo")
+SUPPORTED_INTERVALS = (*INTRADAY_INTERVAL_MINUTES, *DAILY_INTERVALS)
+
+# Longest window (in trading days) served at each intraday resolution, mirroring
+# the limits common market data vendors apply to minute bars
+MAX_INTRADAY_DAYS = {"1m": 5, "5m": 21, "15m": 21, "30m": 21, "1h": 63}
+
+
+@dataclass
+class Bars:
+    """
+    OHLCV bars for a basket of tickers sharing one time axis.
+
+    Price and volume arrays have shape (len(tickers), len(timestamps)); row i
+    belongs to tickers[i]. Timestamps mark the start of each bar and are
+    `datetime64[D]` for daily-or-longer bars, `datetime64[m]` for intraday bars.
+    """
+
+    tickers: List[str]
+    timestamps: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+
+def select_row(bars: Bars, row: int) -> Bars:
+    """One ticker of a basket as a single-row `Bars` (views, no copies)."""
+    return Bars(
+        [bars.tickers[row]],
+        bars.timestamps,
+        *(getattr(bars, name)[row : row + 1] for name in ("open", "high", "low", "close", "volume")),
+    )
+
+
+def _last_trading_day(end: Optional[np.datetime64] = None) -> np.datetime64:
+    if end is None:
+        end = np.datetime64("today", "D")
+    return np.busday_offset(np.datetime64(end, "D"), 0, roll="backward")
+
+
+def _resolve_trading_days(period: str, end: np.datetime64) -> int:
+    if period == "ytd":
+        jan_1 = end.astype("datetime64[Y]").astype("datetime64[D]")
+        return max(1, int(np.busday_count(jan_1, end + 1)))
+    return PERIOD_TRADING_DAYS[period]
+
+
+def _trading_days(n_days: int, end: np.datetime64) -> np.ndarray:
+    start = np.busday_offset(end, -(n_days - 1), roll="backward")
+    days = np.arange(start, end + 1, dtype="datetime64[D]")
+    return days[np.is_busday(days)]
+
+
+def _symbol_draws(
+    tickers: List[str],
+    n_steps: int,
+    stream: int,
+    rng: Optional[np.random.Generator],
+):
+    """
+    (last price, volatility, noise of shape (5, n_tickers, n_steps)) per ticker.
+
+    Without `rng` everything derives from the CRC32 of each symbol: the price
+    level and volatility from its bits, the noise from a generator seeded with it
+    (and `stream`) whose draws start at the most recent step, so windows of any
+    length end on the same close.
+    """
+    n = len(tickers)
+    if rng is not None:
+        last = rng.uniform(50, 500, n)
+        sigma = rng.uniform(0.01, 0.035, n)
+        return last, sigma, rng.standard_normal((5, n, n_steps))
+
+    seeds = np.array([zlib.crc32(symbol.encode()) for symbol in tickers], dtype=np.int64)
+    last = 50 + 450 * (seeds & 0xFFFF) / 0xFFFF
+    sigma = 0.01 + 0.025 * (seeds >> 16) / 0xFFFF
+    noise = np.empty((n, n_steps, 5))
+    for i, seed in enumerate(seeds.tolist()):
+        # Filled row-major, newest step first: a longer window only appends older steps
+        noise[i] = np.random.default_rng((seed, stream)).standard_normal((n_steps, 5))
+    return last, sigma, noise[:, ::-1].transpose(2, 0, 1)
+
+
+def _simulate(
+    step_sigma: np.ndarray,
+    last_price: np.ndarray,
+    noise: np.ndarray,
+    volume_mean: float,
+):
+    """Random-walk OHLCV paths of shape (n_tickers, n_steps) ending at `last_price`."""
+    sigma = step_sigma[:, None]
+
+    log_returns = np.cumsum(sigma * noise[0], axis=1)
+    close = last_price[:, None] * np.exp(log_returns - log_returns[:, -1:])
+    start_price = close[:, 0] * np.exp(-sigma[:, 0] * noise[0][:, 0])
+    prev_close = np.concatenate([start_price[:, None], close[:, :-1]], axis=1)
+    open_ = prev_close * np.exp(0.3 * sigma * noise[1])
+
+    high = np.maximum(open_, close) * (1.0 + 0.5 * sigma * np.abs(noise[2]))
+    low = np.minimum(open_, close) * (1.0 - 0.5 * sigma * np.abs(noise[3]))
+    volume = (volume_mean * np.exp(0.35 * noise[4])).astype(np.int64)
+
+    return open_, high, low, close, volume
+
+
+def generate_daily_bars(
+    tickers: List[str],
+    days: np.ndarray,
+    rng: Optional[np.random.Generator] = None,
+) -> Bars:
+    """
+    Generate a base 1-day series for every ticker over the given trading days;
+    deterministic per ticker unless `rng` is given.
+    """
+    last_price, daily_sigma, noise = _symbol_draws(tickers, len(days), 0, rng)
+    open_, high, low, close, volume = _simulate(
+        daily_sigma, last_price, noise, volume_mean=3_000_000
+    )
+    return Bars(list(tickers), days, open_, high, low, close, volume)
+
+
+def generate_minute_bars(
+    tickers: List[str],
+    days: np.ndarray,
+    rng: Optional[np.random.Generator] = None,
+) -> Bars:
+    """
+    Generate a base 1-minute series covering the regular session of each day,
+    ending at the same close as the daily series unless `rng` is given.
+    """
+    last_price, daily_sigma, noise = _symbol_draws(
+        tickers, len(days) * SESSION_MINUTES, 1, rng
+    )
+    minute_sigma = daily_sigma / np.sqrt(SESSION_MINUTES)
+
+    session = np.arange(SESSION_OPEN_MINUTE, SESSION_OPEN_MINUTE + SESSION_MINUTES)
+    timestamps = (
+        days.astype("datetime64[m]")[:, None] + session.astype("timedelta64[m]")
+    ).ravel()
+
+    open_, high, low, close, volume = _simulate(
+        minute_sigma, last_price, noise, volume_mean=3_000_000 / SESSION_MINUTES
+    )
+    return Bars(list(tickers), timestamps, open_, high, low, close, volume)
+
+
+def _bucket_keys(timestamps: np.ndarray, interval: str) -> np.ndarray:
+    """Integer group key per base bar; equal keys are aggregated into one bar."""
+    if interval in INTRADAY_INTERVAL_MINUTES:
+        width = INTRADAY_INTERVAL_MINUTES[interval]
+        day = timestamps.astype("datetime64[D]")
+        session_minute = (timestamps - day).astype(np.int64) - SESSION_OPEN_MINUTE
+        # Buckets never straddle sessions: key = day * 1440 + bucket within day
+        return day.astype(np.int64) * 1440 + session_minute // width
+
+    day = timestamps.astype("datetime64[D]")
+    if interval == "1d":
+        return day.astype(np.int64)
+    if interval == "1wk":
+        # Day 0 (1970-01-01) is a Thursday; shifting by 3 aligns weeks to Monday
+        return (day.astype(np.int64) + 3) // 7
+    return day.astype("datetime64[M]").astype(np.int64)
+
+
+def resample(bars: Bars, interval: str) -> Bars:
+    """
+    Aggregate bars into `interval` buckets: first open, max high, min low,
+    last close and summed volume per bucket.
+    """
+    keys = _bucket_keys(bars.timestamps, interval)
+    if len(keys) == 0:
+        return bars
+
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    if len(starts) == len(keys):
+        return bars
+    ends = np.r_[starts[1:], len(keys)] - 1
+
+    return Bars(
+        tickers=bars.tickers,
+        timestamps=bars.timestamps[starts],
+        open=bars.open[:, starts],
+        high=np.maximum.reduceat(bars.high, starts, axis=1),
+        low=np.minimum.reduceat(bars.low, starts, axis=1),
+        close=bars.close[:, ends],
+        volume=np.add.reduceat(bars.volume, starts, axis=1),
+    )
+
+
+def resolve_window(period: str, interval: str, end: np.datetime64) -> int:
+    """
+    Validate a period/interval request and return the trading days it spans,
+    counting back from (and including) trading day `end`.
+
+    Raises:
+        ValueError: Unknown period/interval, or an intraday interval requested
+            over a window longer than MAX_INTRADAY_DAYS allows.
+    """
+    if period not in SUPPORTED_PERIODS:
+        raise ValueError(
+            f"Unsupported period '{period}'. Use one of: {', '.join(SUPPORTED_PERIODS)}."
+        )
+    if interval not in SUPPORTED_INTERVALS:
+        raise ValueError(
+            f"Unsupported interval '{interval}'. Use one of: {', '.join(SUPPORTED_INTERVALS)}."
+        )
+
+    n_days = _resolve_trading_days(period, end)
+    if interval in INTRADAY_INTERVAL_MINUTES and n_days > MAX_INTRADAY_DAYS[interval]:
+        raise ValueError(
+            f"Interval '{interval}' is limited to {MAX_INTRADAY_DAYS[interval]} "
+            f"trading days; requested period '{period}' spans {n_days}."
+        )
+    return n_days
+
+
+def build_bars(
+    tickers: List[str],
+    period: str = "5d",
+    interval: str = "1d",
+    rng: Optional[np.random.Generator] = None,
+    end: Optional[np.datetime64] = None,
+) -> Bars:
+    """
+    Build OHLCV bars for `tickers` covering `period` at `interval` resolution.
+
+    Raises:
+        ValueError: See `resolve_window`.
+    """
+    last_day = _last_trading_day(end)
+    days = _trading_days(resolve_window(period, interval, last_day), last_day)
+
+    if interval in INTRADAY_INTERVAL_MINUTES:
+        base = generate_minute_bars(tickers, days, rng)
+    else:
+        base = generate_daily_bars(tickers, days, rng)
+
+    return resample(base, interval)
@@ -0,0 +1,290 @@
+"""
+Market-data providers behind the EconFlux market tools.
+
+`market_tools` talks to a `MarketDataProvider` and caches on top of it, so a data
+source is swapped by configuration instead of rewriting the tools:
+
+- `synthetic` (default): generated bars, deterministic per symbol, with quotes
+  taken from their last closes, and random earnings figures.
+- `barstore`: a local on-disk store of per-ticker OHLCV columns saved as `.npy`
+  files and opened with `np.load(mmap_mode="r")`. Range reads are slices of the
+  memory map, so nothing is copied into the process and every worker process
+  reading the same store shares one page-cached copy of the data.
+
+Bar store layout (one directory per symbol, one sub-directory per base interval):
+
+    <root>/<SYMBOL>/1d/{timestamps,open,high,low,close,volume}.npy   (required)
+    <root>/<SYMBOL>/1m/{timestamps,open,high,low,close,volume}.npy   (optional, intraday)
+    <root>/<SYMBOL>/meta.json       (optional: {"currency": ..., "exchange": ...})
+    <root>/<SYMBOL>/earnings.json   (optional: {"earnings": {...}, "calendar": {...}})
+
+Seed a store from the synthetic engine with:
+
+    python market_providers.py --path data/barstore --tickers AAPL MSFT NVDA
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import threading
+from abc import ABC, abstractmethod
+from functools import reduce
+from typing import Any, Dict, List
+
+import numpy as np
+
+from config import MarketDataConfig, load_market_data_config
+from earnings_calendar import next_earnings_date
+from market_bars import (
+    INTRADAY_INTERVAL_MINUTES,
+    Bars,
+    build_bars,
+    generate_minute_bars,
+    resample,
+    resolve_window,
+    select_row,
+)
+
+BAR_COLUMNS = ("timestamps", "open", "high", "low", "close", "volume")
+
+
+class MarketDataProvider(ABC):
+    """Source of quotes, OHLCV bars and earnings snapshots for the market tools."""
+
+    name: str
+
+    @abstractmethod
+    def quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Latest quote per normalized symbol: {currentPrice, previousClose, currency,
+        exchange}. Symbols the provider has no data for are omitted.
+        """
+
+    @abstractmethod
+    def bars(self, symbols: List[str], period: str, interval: str) -> Bars:
+        """
+        Bars for `symbols` on one shared time axis.
+
+        Raises:
+            ValueError: Unsupported period/interval or a symbol without data.
+        """
+
+    def series(self, symbols: List[str], period: str, interval: str) -> Dict[str, Bars]:
+        """
+        Bars per symbol, each on its own time axis (unlike `bars`, nothing is dropped
+        to line symbols up). By default one `bars` batch split into rows, for
+        providers whose symbols always share an axis.
+        """
+        batch = self.bars(symbols, period, interval)
+        return {symbol: select_row(batch, i) for i, symbol in enumerate(batch.tickers)}
+
+    @abstractmethod
+    def earnings(self, symbol: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Earnings snapshot: {"earnings": {...}, "calendar": {next_earnings_date}}.
+
+        Raises:
+            ValueError: The provider has no data for `symbol`.
+        """
+
+
+class SyntheticProvider(MarketDataProvider):
+    """Generated market data; each symbol's bars and quote come from one seeded path."""
+
+    name = "synthetic"
+
+    def quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        # The last two daily closes of the symbol's path, one NumPy batch for the basket
+        close = build_bars(symbols, period="5d", interval="1d").close
+        current = np.round(close[:, -1], 2)
+        previous = np.round(close[:, -2], 2)
+
+        return {
+            symbol: {
+                "currentPrice": float(current[i]),
+                "previousClose": float(previous[i]),
+                "currency": "USD",
+                "exchange": "NASDAQ",
+            }
+            for i, symbol in enumerate(symbols)
+        }
+
+    def bars(self, symbols: List[str], period: str, interval: str) -> Bars:
+        return build_bars(symbols, period=period, interval=interval)
+
+    def earnings(self, symbol: str) -> Dict[str, Dict[str, Any]]:
+        earnings = {
+            "eps_actual": round(random.uniform(0.5, 4.0), 2),
+            "eps_estimate": round(random.uniform(0.5, 4.0), 2),
+            "revenue_actual": random.randint(5_000_000_000, 50_000_000_000),
+            "revenue_estimate": random.randint(5_000_000_000, 50_000_000_000),
+        }
+        calendar = {"next_earnings_date": str(next_earnings_date(symbol))}
+        return {"earnings": earnings, "calendar": calendar}
+
+
+class BarStoreProvider(MarketDataProvider):
+    """Memory-mapped columnar bar store on local disk (see module docstring)."""
+
+    name = "barstore"
+
+    def __init__(self, root: str):
+        self.root = root
+        self._columns: Dict[tuple, Dict[str, np.ndarray]] = {}
+        self._lock = threading.Lock()
+        self._fallback = SyntheticProvider()
+
+    def _open(self, symbol: str, base: str) -> Dict[str, np.ndarray]:
+        """Memory maps of one symbol's columns, opened once and reused."""
+        key = (symbol, base)
+        columns = self._columns.get(key)
+        if columns is not None:
+            return columns
+
+        directory = os.path.join(self.root, symbol, base)
+        if not os.path.isdir(directory):
+            raise ValueError(f"No stored {base} bars for {symbol}.")
+        columns = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+            for name in BAR_COLUMNS
+        }
+        with self._lock:
+            self._columns.setdefault(key, columns)
+        return columns
+
+    def _read_json(self, symbol: str, filename: str) -> Dict[str, Any]:
+        path = os.path.join(self.root, symbol, filename)
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def _window(self, symbol: str, period: str, interval: str) -> Bars:
+        """Zero-copy slice of one symbol's base series covering `period`."""
+        daily = self._open(symbol, "1d")["timestamps"]
+        if len(daily) == 0:
+            raise ValueError(f"No stored 1d bars for {symbol}.")
+        n_days = resolve_window(period, interval, daily[-1])
+        first_day = daily[max(0, len(daily) - n_days)]
+
+        base = "1m" if interval in INTRADAY_INTERVAL_MINUTES else "1d"
+        columns = self._open(symbol, base)
+        timestamps = columns["timestamps"]
+        lo = np.searchsorted(timestamps, first_day.astype(timestamps.dtype))
+
+        return Bars(
+            [symbol],
+            timestamps[lo:],
+            *(columns[name][None, lo:] for name in BAR_COLUMNS[1:]),
+        )
+
+    def bars(self, symbols: List[str], period: str, interval: str) -> Bars:
+        windows = [self._window(symbol, period, interval) for symbol in symbols]
+        axes = [w.timestamps for w in windows]
+
+        if all(np.array_equal(axes[0], axis) for axis in axes[1:]):
+            if len(windows) == 1:
+                return resample(windows[0], interval)
+            timestamps = axes[0]
+            stacked = [np.vstack([getattr(w, name) for w in windows]) for name in BAR_COLUMNS[1:]]
+        else:
+            # Symbols with gaps or different histories: keep timestamps all of them share
+            timestamps = reduce(np.intersect1d, axes)
+            stacked = [
+                np.vstack([getattr(w, name)[:, np.isin(w.timestamps, timestamps)] for w in windows])
+                for name in BAR_COLUMNS[1:]
+            ]
+
+        return resample(Bars(list(symbols), timestamps, *stacked), interval)
+
+    def series(self, symbols: List[str], period: str, interval: str) -> Dict[str, Bars]:
+        return {
+            symbol: resample(self._window(symbol, period, interval), interval)
+            for symbol in symbols
+        }
+
+    def quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        quotes = {}
+        for symbol in symbols:
+            try:
+                close = self._open(symbol, "1d")["close"]
+            except ValueError:
+                continue
+            if len(close) == 0:
+                continue
+            meta = self._read_json(symbol, "meta.json")
+            quotes[symbol] = {
+                "currentPrice": round(float(close[-1]), 2),
+                "previousClose": round(float(close[-2] if len(close) > 1 else close[-1]), 2),
+                "currency": meta.get("currency", "USD"),
+                "exchange": meta.get("exchange", "NASDAQ"),
+            }
+        return quotes
+
+    def earnings(self, symbol: str) -> Dict[str, Dict[str, Any]]:
+        # Earnings come from an optional sidecar file; stored symbols without one get
+        # synthetic figures, symbols absent from the store none at all
+        if not os.path.isdir(os.path.join(self.root, symbol)):
+            raise ValueError(f"No stored data for {symbol}.")
+        return self._read_json(symbol, "earnings.json") or self._fallback.earnings(symbol)
+
+    def write(self, bars: Bars, base: str) -> None:
+        """Persist each ticker row of `bars` as the `base` ("1d" or "1m") series."""
+        for i, symbol in enumerate(bars.tickers):
+            directory = os.path.join(self.root, symbol, base)
+            os.makedirs(directory, exist_ok=True)
+            for name in BAR_COLUMNS:
+                values = bars.timestamps if name == "timestamps" else getattr(bars, name)[i]
+                np.save(os.path.join(directory, f"{name}.npy"), np.ascontiguousarray(values))
+            with self._lock:
+                self._columns.pop((symbol, base), None)
+
+
+def get_provider(cfg: MarketDataConfig | None = None) -> MarketDataProvider:
+    """Instantiate the provider selected by MARKET_DATA_PROVIDER."""
+    cfg = cfg or load_market_data_config()
+    if cfg.provider == "synthetic":
+        return SyntheticProvider()
+    if cfg.provider == "barstore":
+        return BarStoreProvider(cfg.barstore_path)
+    raise ValueError(
+        f"Unknown MARKET_DATA_PROVIDER '{cfg.provider}'. Use 'synthetic' or 'barstore'."
+    )
+
+
+def seed_bar_store(root: str, tickers: List[str]) -> None:
+    """
+    Fill a bar store with 5 years of synthetic daily bars and 5 sessions of minute
+    bars per ticker; the last daily bars are re-derived from the minute bars so
+    both resolutions agree.
+    """
+    store = BarStoreProvider(root)
+    daily = build_bars(tickers, period="5y", interval="1d")
+    minute_days = daily.timestamps[-5:]
+    minutes = generate_minute_bars(tickers, minute_days)
+
+    # Rescale each minute path to continue from the prior daily close
+    anchor = daily.close[:, -6] / minutes.open[:, 0]
+    for name in ("open", "high", "low", "close"):
+        setattr(minutes, name, getattr(minutes, name) * anchor[:, None])
+
+    tail = resample(minutes, "1d")
+    for name in ("open", "high", "low", "close", "volume"):
+        getattr(daily, name)[:, -5:] = getattr(tail, name)
+
+    store.write(daily, "1d")
+    store.write(minutes, "1m")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Seed a memory-mapped bar store with synthetic data")
+    parser.add_argument("--path", "-p", required=True, help="Bar store root directory")
+    parser.add_argument("--tickers", "-t", nargs="+", required=True, help="Symbols to seed")
+    args = parser.parse_args()
+
+    symbols = list(dict.fromkeys(t.upper() for t in args.tickers))
+    seed_bar_store(args.path, symbols)
+    print(f"Seeded {len(symbols)} tickers into {args.path}")
@@ -1,26 +1,109 @@
 from strands import tool
 import datetime as dt
-import random
-from typing import Any, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import reduce
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 
-def _normalize_ticker(ticker: str) -> dict:
-    """
-    Convert raw ticker input into a normalized dict with mock data.
-    """
-    t = ticker.upper()
+from cache import TTLCache
+from config import load_market_cache_config, load_market_report_config
+from earnings_calendar import EarningsCalendar, get_calendar
+from market_bars import Bars
+from market_providers import get_provider
+from single_flight import SingleFlight
+from universes import resolve_universe
 
-    # generate random but realistic numbers
-    current = round(random.uniform(50, 500), 2)
-    previous = round(current * random.uniform(0.97, 0.999), 2)
+_provider = get_provider()
+_cache_config = load_market_cache_config()
+_market_cache = TTLCache(maxsize=_cache_config.max_entries)
+# Concurrent misses for the same quote/history/earnings key share one provider call
+_inflight = SingleFlight()
+
+_report_config = load_market_report_config()
+# Sub-fetches and per-ticker reports use separate pools so a report waiting on
+# its sources can never starve the pool those sources run in
+_source_pool = ThreadPoolExecutor(
+    max_workers=3 * _report_config.max_workers, thread_name_prefix="market-source"
+)
+_report_pool = ThreadPoolExecutor(
+    max_workers=_report_config.max_workers, thread_name_prefix="market-report"
+)
+
+
+def market_cache_stats() -> Dict[str, Any]:
+    """Hit/miss/eviction counters of the shared market-data cache, per data type."""
+    return _market_cache.stats()
+
+
+def market_coalescing_stats() -> Dict[str, Any]:
+    """Calls, provider executions and collapsed duplicate calls, per data type."""
+    return _inflight.stats()
+
+
+def _get_or_fetch(key: tuple, ttl: float, factory) -> Any:
+    """Cached value for `key`; on a miss one caller runs `factory` and caches it for all."""
+    value = _market_cache.get(key)
+    if value is not None:
+        return value
+
+    def fetch():
+        fetched = factory()
+        _market_cache.set(key, fetched, ttl)
+        return fetched
+
+    return _inflight.do(key, fetch)
+
+
+def _normalize_symbol(ticker: str) -> str:
+    """Canonical form of a raw ticker input: surrounding whitespace removed, uppercased."""
+    return ticker.strip().upper()
+
+
+def _normalize_symbols(tickers: List[str]) -> List[str]:
+    """Normalize and de-duplicate raw ticker inputs (first occurrence wins)."""
+    return list(dict.fromkeys(_normalize_symbol(t) for t in tickers if t.strip()))
 
-    return {
-        "symbol": t,
-        "currentPrice": current,
-        "previousClose": previous,
-        "currency": "USD",
-        "exchange": "NASDAQ",
-    }
+
+def _cached_quotes(symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Quotes for normalized `symbols`, served from the market cache where live.
+
+    Misses are fetched from the provider together in one batch and cached
+    individually, so single and batch lookups of a symbol agree for the quote TTL.
+    Symbols another request is already fetching are awaited rather than re-fetched.
+    Symbols the provider has no data for are absent from the result.
+    """
+    quotes = {}
+    missing = []
+    for symbol in symbols:
+        quote = _market_cache.get(("quote", symbol))
+        if quote is None:
+            missing.append(symbol)
+        else:
+            quotes[symbol] = quote
+
+    if missing:
+        for (_, symbol), quote in _inflight.do_many(
+            [("quote", symbol) for symbol in missing], _fetch_quotes
+        ).items():
+            if quote is not None:
+                quotes[symbol] = quote
+
+    return quotes
+
+
+def _fetch_quotes(keys: List[tuple]) -> Dict[tuple, Dict[str, Any]]:
+    """Fetch ("quote", symbol) keys from the provider in one batch and cache them."""
+    timestamp = dt.datetime.utcnow().isoformat() + "Z"
+    fetched = {}
+    for symbol, values in _provider.quotes([symbol for _, symbol in keys]).items():
+        quote = {"symbol": symbol, **values, "timestamp": timestamp}
+        _market_cache.set(("quote", symbol), quote, _cache_config.quote_ttl)
+        fetched[("quote", symbol)] = quote
+    return fetched
 
 
 @tool
@@ -29,7 +112,7 @@ def get_stock_price(ticker: str) -> Dict[str, Any]:
     Return a mock latest stock quote (price, currency, previous close, exchange).
 
     Use when you need an example quote without calling real market data. Values are
-    randomly generated per call and unsuitable for trading/analysis.
+    randomly generated and unsuitable for trading/analysis.
 
     Args:
         ticker: Stock symbol (case-insensitive). It is uppercased for the response.
@@ -41,13 +124,19 @@ def get_stock_price(ticker: str) -> Dict[str, Any]:
         - currency: Quotation currency (string)
         - previous_close: Mock previous close (float)
         - exchange: Mock exchange code (string)
-        - timestamp: ISO-8601 UTC timestamp with trailing "Z"
+        - timestamp: ISO-8601 UTC time the quote was generated, with trailing "Z"
+        - error: Present instead of the quote if no data exists for the ticker
 
     Notes:
-        - Values are synthetic and change on every call
-        - No external APIs are contacted; this is a local mock
+        - Values come from the configured market-data provider (synthetic by default);
+          a quote is cached for a short TTL (default 15s), so repeated lookups and
+          `generate_stock_report` agree within that window
+        - No external APIs are contacted; data is generated or read locally
     """
-    quote = _normalize_ticker(ticker)
+    symbol = _normalize_symbol(ticker)
+    quote = _cached_quotes([symbol]).get(symbol)
+    if quote is None:
+        return {"ticker": symbol, "error": f"No market data for {symbol}."}
 
     return {
         "ticker": quote["symbol"],
@@ -55,58 +144,299 @@ def get_stock_price(ticker: str) -> Dict[str, Any]:
         "currency": quote["currency"],
         "previous_close": quote["previousClose"],
         "exchange": quote["exchange"],
-        "timestamp": dt.datetime.utcnow().isoformat() + "Z",
+        "timestamp": quote["timestamp"],
+    }
+
+
+@tool
+def get_stock_prices(tickers: List[str]) -> Dict[str, Any]:
+    """
+    Return mock latest quotes for several tickers in one call, as parallel arrays.
+
+    Prefer this over repeated `get_stock_price` calls for peer comparisons and baskets;
+    entry i of every array belongs to `tickers[i]`.
+
+    Args:
+        tickers: Stock symbols (case-insensitive). Uppercased and de-duplicated.
+
+    Returns:
+        Dict with:
+        - tickers: Uppercased symbols, in request order
+        - price: Mock latest prices (list of float)
+        - previous_close: Mock previous closes (list of float)
+        - currency: Quotation currency shared by all quotes (string)
+        - exchange: Mock exchange code shared by all quotes (string)
+        - timestamp: ISO-8601 UTC generation time of the oldest quote, with trailing "Z"
+        - missing: Symbols without market data, excluded from the arrays (only if any)
+        - error: Present instead of the arrays if no tickers were supplied or none
+          has market data
+
+    Notes:
+        - Values are synthetic; quotes share the `get_stock_price` cache, so a symbol
+          reports the same price from either tool within the quote TTL
+        - No external APIs are contacted; this is a local mock
+    """
+    symbols = _normalize_symbols(tickers)
+    if not symbols:
+        return {"error": "No tickers supplied."}
+
+    quotes = _cached_quotes(symbols)
+    ordered = [quotes[symbol] for symbol in symbols if symbol in quotes]
+    missing = [symbol for symbol in symbols if symbol not in quotes]
+    if not ordered:
+        return {"missing": missing, "error": "No market data for the requested tickers."}
+
+    payload = {
+        "tickers": [q["symbol"] for q in ordered],
+        "price": [q["currentPrice"] for q in ordered],
+        "previous_close": [q["previousClose"] for q in ordered],
+        "currency": ordered[0]["currency"],
+        "exchange": ordered[0]["exchange"],
+        "timestamp": min(q["timestamp"] for q in ordered),
+    }
+    if missing:
+        payload["missing"] = missing
+    return payload
+
+
+def _cached_bars(symbol: str, period: str, interval: str) -> Bars:
+    """Bars for one symbol, cached per (period, interval) for the history TTL."""
+    return _get_or_fetch(
+        ("history", symbol, period, interval),
+        _cache_config.history_ttl,
+        lambda: _provider.bars([symbol], period=period, interval=interval),
+    )
+
+
+def _fetch_basket(
+    symbols: List[str], period: str, interval: str, store: bool
+) -> Dict[str, Bars]:
+    """
+    Per-symbol bars generated in one provider batch; symbols another request is
+    already fetching for the same window are awaited instead.
+    """
+
+    def fetch(keys: List[tuple]) -> Dict[tuple, Bars]:
+        fetched = {}
+        for symbol, bars in _provider.series([key[1] for key in keys], period, interval).items():
+            key = ("history", symbol, period, interval)
+            if store:
+                _market_cache.set(key, bars, _cache_config.history_ttl)
+            fetched[key] = bars
+        return fetched
+
+    keys = [("history", symbol, period, interval) for symbol in symbols]
+    return {key[1]: bars for key, bars in _inflight.do_many(keys, fetch).items()}
+
+
+def _align(bars: Bars, timestamps: np.ndarray) -> Bars:
+    """`bars` restricted to `timestamps`, a subset of its own axis."""
+    if np.array_equal(bars.timestamps, timestamps):
+        return bars
+    keep = np.isin(bars.timestamps, timestamps)
+    return Bars(
+        bars.tickers,
+        timestamps,
+        *(getattr(bars, name)[:, keep] for name in ("open", "high", "low", "close", "volume")),
+    )
+
+
+def load_bars(
+    tickers: List[str], period: str = "5d", interval: str = "1d", store: bool = True
+) -> Bars:
+    """
+    Bars for a basket of tickers on one shared time axis, row i = symbol i. Symbols
+    with different histories (e.g. bar-store listings starting on other dates) are
+    cut to the bars they all have.
+
+    Served from the same per-symbol cache entries as `get_price_history`, so
+    analytics computed on the basket match the history the agent sees. Misses
+    are generated in a single batch and cached per symbol; pass `store=False`
+    for large ad-hoc baskets so they reuse cached series without evicting them.
+
+    Raises:
+        ValueError: No tickers, or unsupported period/interval (see
+            `market_bars.resolve_window`), a symbol the provider has no data for, or
+            symbols sharing no bar in the window.
+    """
+    symbols = _normalize_symbols(tickers)
+    if not symbols:
+        raise ValueError("No tickers supplied.")
+
+    series: Dict[str, Bars] = {}
+    for symbol in symbols:
+        bars = _market_cache.get(("history", symbol, period, interval))
+        if bars is not None:
+            series[symbol] = bars
+
+    missing = [symbol for symbol in symbols if symbol not in series]
+    if missing:
+        series.update(_fetch_basket(missing, period, interval, store))
+
+    # Entries cached before a trading-day rollover end on an older bar; refetch them
+    newest = max(b.timestamps[-1] for b in series.values())
+    stale = [s for s in symbols if series[s].timestamps[-1] < newest]
+    if stale:
+        series.update(_fetch_basket(stale, period, interval, store))
+
+    ordered = [series[symbol] for symbol in symbols]
+    timestamps = ordered[0].timestamps
+    if not all(np.array_equal(timestamps, b.timestamps) for b in ordered[1:]):
+        # Providers with per-symbol histories: keep the bars every symbol has
+        timestamps = reduce(np.intersect1d, [b.timestamps for b in ordered])
+        if len(timestamps) == 0:
+            raise ValueError(f"{', '.join(symbols)} share no {interval} bars over {period}.")
+        ordered = [_align(b, timestamps) for b in ordered]
+    return Bars(
+        symbols,
+        timestamps,
+        np.vstack([b.open for b in ordered]),
+        np.vstack([b.high for b in ordered]),
+        np.vstack([b.low for b in ordered]),
+        np.vstack([b.close for b in ordered]),
+        np.vstack([b.volume for b in ordered]),
+    )
+
+
+def _history_rows(bars: Bars, row: int = 0) -> Dict[str, Dict[str, Any]]:
+    """
+    Render one ticker's bars as a mapping of bar timestamp to OHLCV fields.
+    """
+    labels = np.datetime_as_string(bars.timestamps).tolist()
+    columns = zip(
+        labels,
+        np.round(bars.open[row], 2).tolist(),
+        np.round(bars.high[row], 2).tolist(),
+        np.round(bars.low[row], 2).tolist(),
+        np.round(bars.close[row], 2).tolist(),
+        bars.volume[row].tolist(),
+    )
+
+    return {
+        label: {"open": o, "high": h, "low": lo, "close": c, "volume": v}
+        for label, o, h, lo, c, v in columns
     }
 
 
+HISTORY_FORMATS = ("rows", "columnar")
+
+
+def _delta_encode(values: np.ndarray, precision: int) -> List[float]:
+    """
+    First value followed by successive differences, computed on the rounded
+    integer grid so a cumulative sum reproduces the rounded series exactly.
+    """
+    scale = 10**precision
+    ticks = np.round(values * scale).astype(np.int64)
+    deltas = np.diff(ticks, prepend=0)
+    if precision == 0:
+        return deltas.tolist()
+    return np.round(deltas / scale, precision).tolist()
+
+
+def _history_columns(
+    bars: Bars, row: int = 0, precision: int = 2, delta: bool = False
+) -> Dict[str, Any]:
+    """
+    Render one ticker's bars as parallel arrays (t, o, h, l, c, v).
+
+    With `delta`, timestamps become `t0` plus integer steps `dt` (in `unit`,
+    "D" days or "m" minutes) and every numeric array holds its first value
+    followed by successive differences.
+    """
+    prices = {
+        "o": bars.open[row],
+        "h": bars.high[row],
+        "l": bars.low[row],
+        "c": bars.close[row],
+    }
+
+    if not delta:
+        columns: Dict[str, Any] = {"t": np.datetime_as_string(bars.timestamps).tolist()}
+        for key, values in prices.items():
+            columns[key] = np.round(values, precision).tolist()
+        columns["v"] = bars.volume[row].tolist()
+        return columns
+
+    unit, _ = np.datetime_data(bars.timestamps.dtype)
+    steps = np.diff(bars.timestamps).astype(np.int64)
+    columns = {
+        "encoding": "delta",
+        "t0": str(np.datetime_as_string(bars.timestamps[0])) if len(bars.timestamps) else None,
+        "unit": unit,
+        "dt": steps.tolist(),
+    }
+    for key, values in prices.items():
+        columns[key] = _delta_encode(values, precision)
+    columns["v"] = np.diff(bars.volume[row], prepend=0).tolist()
+    return columns
+
+
 @tool
 def get_price_history(
-    ticker: str, period: str = "5d", interval: str = "1d"
+    ticker: str,
+    period: str = "5d",
+    interval: str = "1d",
+    format: str = "rows",
+    precision: int = 2,
+    delta: bool = False,
 ) -> Dict[str, Any]:
     """
-    Return a mock OHLCV (Open, High, Low, Close, Volume) history with five synthetic periods.
+    Return a mock OHLCV (Open, High, Low, Close, Volume) history for a window and bar size.
 
-    Use for placeholder history when real data is unavailable. `period` and `interval`
-    are informational only; five entries are always generated to keep payloads small.
+    Use for placeholder history when real data is unavailable. Bars are simulated over
+    trading days only and resampled from a 1-minute or 1-day base series. Prefer
+    `format="columnar"` for long histories: it avoids repeating field names per bar.
 
     Args:
         ticker: Stock symbol (case-insensitive). It is uppercased for the response.
-        period: Label for the requested period (informational only).
-        interval: Label for the requested interval (informational only).
+        period: Window to cover: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y or ytd.
+        interval: Bar size: 1m, 5m, 15m, 30m, 1h, 1d, 1wk or 1mo. Intraday bars are
+            limited to short windows (1m: 5d, 5m-30m: 1mo, 1h: 3mo).
+        format: "rows" (mapping of timestamp to OHLCV object) or "columnar"
+            (parallel arrays t, o, h, l, c, v).
+        precision: Decimal places for prices (columnar only, default 2).
+        delta: Columnar only. Encode arrays as first value plus successive
+            differences; recover values with a cumulative sum. Timestamps become
+            `t0` plus integer steps `dt` in `unit` ("D" days, "m" minutes).
 
     Returns:
         Dict with:
         - ticker: Uppercased symbol
         - period: Echoed input period
         - interval: Echoed input interval
-        - history: Mapping of period keys to OHLCV fields (open, high, low, close, volume)
+        - format: Echoed output format
+        - history: Rows: mapping of bar start time ("YYYY-MM-DD" or
+          "YYYY-MM-DDTHH:MM") to OHLCV fields (open, high, low, close, volume).
+          Columnar: parallel arrays as described above. Oldest bar first.
+        - error: Present instead of history if an argument is unsupported
 
     Notes:
-        - All values are randomly generated and will differ on each call
-        - Exactly five entries are returned to simplify downstream handling
-    """
-    t = ticker.upper()
-
-    # Produce 5 random daily candles
-    history = {}
-    for i in range(5):
-        base = round(random.uniform(50, 500), 2)
-        history_key = f"day_{i + 1}"
-
-        history[history_key] = {
-            "open": base,
-            "high": round(base * random.uniform(1.00, 1.03), 2),
-            "low": round(base * random.uniform(0.97, 1.00), 2),
-            "close": round(base * random.uniform(0.98, 1.02), 2),
-            "volume": random.randint(1_000_000, 5_000_000),
+        - Bars come from the configured market-data provider (synthetic by default)
+          and are cached per (ticker, period, interval) for the history TTL (default
+          5 minutes)
+        - Weekly and monthly bars are stamped with their first trading day
+    """
+    t = _normalize_symbol(ticker)
+    meta = {"ticker": t, "period": period, "interval": interval, "format": format}
+
+    if format not in HISTORY_FORMATS:
+        return {
+            **meta,
+            "error": f"Unsupported format '{format}'. Use one of: {', '.join(HISTORY_FORMATS)}.",
         }
 
-    return {
-        "ticker": t,
-        "period": period,
-        "interval": interval,
-        "history": history,
-    }
+    try:
+        bars = _cached_bars(t, period, interval)
+    except ValueError as exc:
+        return {**meta, "error": str(exc)}
+
+    if format == "columnar":
+        history = _history_columns(bars, precision=max(0, precision), delta=delta)
+    else:
+        history = _history_rows(bars)
+
+    return {**meta, "history": history}
 
 
 @tool
@@ -125,75 +455,239 @@ def get_earnings(ticker: str) -> Dict[str, Any]:
         - ticker: Uppercased symbol
         - calendar: {next_earnings_date: ISO date string}
         - earnings: {eps_actual, eps_estimate, revenue_actual, revenue_estimate}
+        - error: Present instead of the snapshot if no data exists for the ticker
 
     Notes:
-        - Values are synthetic and change on every call
-        - Calendar dates are forward-looking but not linked to real schedules
+        - Values are synthetic and cached per ticker for the earnings TTL (default 1 hour)
+        - Calendar dates follow a stable quarterly cycle per ticker (the same dates
+          `earnings_in_window` reports) but are not linked to real schedules
     """
-    t = ticker.upper()
+    t = _normalize_symbol(ticker)
+    try:
+        snapshot = _get_or_fetch(
+            ("earnings", t), _cache_config.earnings_ttl, lambda: _provider.earnings(t)
+        )
+    except ValueError as exc:
+        return {"ticker": t, "error": str(exc)}
 
-    earnings = {
-        "eps_actual": round(random.uniform(0.5, 4.0), 2),
-        "eps_estimate": round(random.uniform(0.5, 4.0), 2),
-        "revenue_actual": random.randint(5_000_000_000, 50_000_000_000),
-        "revenue_estimate": random.randint(5_000_000_000, 50_000_000_000),
+    return {
+        "ticker": t,
+        "calendar": dict(snapshot["calendar"]),
+        "earnings": dict(snapshot["earnings"]),
     }
 
-    calendar = {
-        "next_earnings_date": (
-            dt.datetime.utcnow() + dt.timedelta(days=random.randint(10, 60))
-        )
-        .date()
-        .isoformat()
-    }
+
+MAX_CALENDAR_EVENTS = 500
+
+
+@tool
+def earnings_in_window(
+    start: str,
+    end: str,
+    universe: str = "large_cap",
+    tickers: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    List every earnings report scheduled between two dates across a universe in one call.
+
+    Use for catalyst-calendar questions ("which of these report in the next two weeks")
+    instead of calling `get_earnings` per ticker. Dates match `get_earnings`.
+
+    Args:
+        start: First date of the window, "YYYY-MM-DD" (inclusive).
+        end: Last date of the window, "YYYY-MM-DD" (inclusive).
+        universe: Named universe: mega_cap_tech, semiconductors, retail, banks, autos,
+            energy, healthcare, consumer, industrials, large_cap or total_market.
+            Ignored when `tickers` is given.
+        tickers: Optional custom basket (case-insensitive) to search instead.
+
+    Returns:
+        Dict with:
+        - start, end: Echoed window
+        - universe: Universe name, or "custom"
+        - count: Number of reports in the window
+        - events: Parallel arrays {date, ticker}, ordered by date (capped at 500)
+        - truncated: True if more than 500 reports matched
+        - error: Present instead of events if an argument is invalid
+
+    Notes:
+        - Report dates are synthetic and cover roughly one year either side of today
+    """
+    try:
+        start_day, end_day = np.datetime64(start, "D"), np.datetime64(end, "D")
+    except ValueError:
+        return {"start": start, "end": end, "error": "Dates must be formatted YYYY-MM-DD."}
+    if end_day < start_day:
+        return {"start": start, "end": end, "error": "end must not be before start."}
+
+    if tickers:
+        label = "custom"
+        calendar = EarningsCalendar(_normalize_symbols(tickers))
+        dates, symbols = calendar.window(start_day, end_day)
+    else:
+        label = universe.strip().lower()
+        try:
+            members = resolve_universe(label)
+        except ValueError as exc:
+            return {"start": start, "end": end, "error": str(exc)}
+        dates, symbols = get_calendar().window(start_day, end_day)
+        if label != "total_market":
+            keep = np.isin(symbols, members)
+            dates, symbols = dates[keep], symbols[keep]
 
     return {
-        "ticker": t,
-        "calendar": calendar,
-        "earnings": earnings,
+        "start": start,
+        "end": end,
+        "universe": label,
+        "count": len(dates),
+        "events": {
+            "date": np.datetime_as_string(dates[:MAX_CALENDAR_EVENTS]).tolist(),
+            "ticker": symbols[:MAX_CALENDAR_EVENTS].tolist(),
+        },
+        "truncated": len(dates) > MAX_CALENDAR_EVENTS,
+    }
+
+
+def _build_stock_report(ticker: str, period: str, format: str) -> Dict[str, Any]:
+    """
+    Fetch quote, history and earnings concurrently and assemble one report.
+
+    Each source has its own timeout measured from submission; a source that is
+    slow or fails is reported under `errors` and its sections are left null.
+    """
+    sources = {
+        "quote": (get_stock_price, (ticker,), {}, _report_config.quote_timeout),
+        "history": (
+            get_price_history,
+            (ticker,),
+            {"period": period, "format": format},
+            _report_config.history_timeout,
+        ),
+        "earnings": (get_earnings, (ticker,), {}, _report_config.earnings_timeout),
     }
 
+    started = time.monotonic()
+    futures = {
+        name: _source_pool.submit(fn, *args, **kwargs)
+        for name, (fn, args, kwargs, _) in sources.items()
+    }
+
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for name, future in futures.items():
+        timeout = sources[name][3]
+        try:
+            results[name] = future.result(
+                timeout=max(0.0, started + timeout - time.monotonic())
+            )
+        except FutureTimeoutError:
+            errors[name] = f"Timed out after {timeout}s"
+        except Exception as exc:  # a source that raises is reported like a timeout
+            errors[name] = str(exc)
+    # Sources report missing data or bad arguments as {"error": ...} results
+    for name in ("quote", "history", "earnings"):
+        if "error" in results.get(name, {}):
+            errors[name] = results.pop(name)["error"]
+
+    price = results.get("quote")
+    history = results.get("history")
+    earnings = results.get("earnings")
+
+    report = {
+        "ticker": _normalize_symbol(ticker),
+        "summary": {
+            "latest_price": price["price"],
+            "previous_close": price["previous_close"],
+            "currency": price["currency"],
+            "exchange": price["exchange"],
+        }
+        if price
+        else None,
+        "history": history["history"] if history else None,
+        "earnings": earnings["earnings"] if earnings else None,
+        "calendar": earnings["calendar"] if earnings else None,
+        "generated_at": dt.datetime.utcnow().isoformat() + "Z",
+    }
+    if errors:
+        report["errors"] = errors
+    return report
+
 
 @tool
-def generate_stock_report(ticker: str, period: str = "5d") -> Dict[str, Any]:
+def generate_stock_report(
+    ticker: str, period: str = "5d", format: str = "rows"
+) -> Dict[str, Any]:
     """
     Generate a compact mock stock report combining quote, history, and earnings.
 
     Use when you want one payload summarizing the mock market data tools
-    (`get_stock_price`, `get_price_history`, `get_earnings`).
+    (`get_stock_price`, `get_price_history`, `get_earnings`). The three sources are
+    fetched concurrently, so latency tracks the slowest source rather than the sum.
 
     Args:
         ticker: Stock symbol (case-insensitive). It is uppercased for the response.
-        period: Label passed through to `get_price_history` to tag the history payload.
+        period: Window passed through to `get_price_history` (e.g. 5d, 1mo, 1y).
+        format: History layout passed through to `get_price_history`: "rows" or
+            "columnar" (parallel arrays t, o, h, l, c, v; fewer tokens for long windows).
 
     Returns:
         Dict with:
         - ticker: Uppercased symbol
         - summary: Latest price, previous close, currency, exchange
-        - history: OHLCV series from `get_price_history`
+        - history: OHLCV series from `get_price_history` (daily bars, in `format`
+          layout)
         - earnings: Earnings fields from `get_earnings`
         - calendar: Next earnings date from `get_earnings`
         - generated_at: ISO-8601 UTC timestamp with trailing "Z"
+        - errors: Present only for a partial report; maps "quote"/"history"/"earnings"
+          to why that source is missing (its sections above are null)
 
     Notes:
-        - All values are synthetic and differ per call
-        - Because each mock is invoked once per request, values stay internally consistent
-          within a single response but not across separate invocations
+        - Per-source timeouts come from MARKET_QUOTE_TIMEOUT, MARKET_HISTORY_TIMEOUT
+          and MARKET_EARNINGS_TIMEOUT (seconds)
+        - All values are synthetic
+        - Sub-results come from the shared market cache, so the report agrees with
+          standalone `get_stock_price`/`get_price_history`/`get_earnings` calls made
+          within their TTLs
+    """
+    return _build_stock_report(ticker, period, format)
+
+
+@tool
+def generate_stock_reports(
+    tickers: List[str], period: str = "5d", format: str = "rows"
+) -> Dict[str, Any]:
     """
-    price = get_stock_price(ticker)
-    history = get_price_history(ticker, period=period)
-    earnings = get_earnings(ticker)
+    Generate `generate_stock_report` payloads for several tickers in one call.
+
+    Prefer this for peer analyses (e.g. Walmart/Target/Costco): tickers are processed
+    in parallel on a bounded worker pool instead of one tool call per ticker.
+
+    Args:
+        tickers: Stock symbols (case-insensitive). Uppercased and de-duplicated.
+        period: Window passed through to `get_price_history` (e.g. 5d, 1mo, 1y).
+        format: History layout: "rows" or "columnar".
+
+    Returns:
+        Dict with:
+        - reports: One report per ticker, in request order, shaped like
+          `generate_stock_report` (including `errors` for partial reports)
+        - generated_at: ISO-8601 UTC timestamp with trailing "Z"
+        - error: Present instead of reports if no tickers were supplied
+
+    Notes:
+        - Concurrency is capped by MARKET_REPORT_WORKERS (default 8)
+        - All values are synthetic
+    """
+    symbols = _normalize_symbols(tickers)
+    if not symbols:
+        return {"error": "No tickers supplied."}
+
+    reports = list(
+        _report_pool.map(lambda symbol: _build_stock_report(symbol, period, format), symbols)
+    )
 
     return {
-        "ticker": ticker.upper(),
-        "summary": {
-            "latest_price": price["price"],
-            "previous_close": price["previous_close"],
-            "currency": price["currency"],
-            "exchange": price["exchange"],
-        },
-        "history": history["history"],
-        "earnings": earnings["earnings"],
-        "calendar": earnings["calendar"],
+        "reports": reports,
         "generated_at": dt.datetime.utcnow().isoformat() + "Z",
     }
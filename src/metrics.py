@@ -0,0 +1,219 @@
+"""
+In-process metrics in Prometheus text exposition format.
+
+`REGISTRY` holds labelled counters and latency histograms updated on the hot
+path (requests, model calls, tool calls, tokens; see `instrumentation.py`), plus
+collectors: callbacks run at scrape time that turn the existing stats functions
+(retrieval/market caches, coalescing, KB latency, agent pool) into samples, so
+those modules need no metrics code of their own.
+
+`app.py` serves `REGISTRY.render()` on GET /metrics. Histograms reuse
+`resilience.LatencyHistogram` buckets, reported in seconds.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from resilience import LatencyHistogram
+
+Labels = Tuple[Tuple[str, str], ...]
+# (metric name, type, help, [(labels, value)]) as produced by collectors
+Family = Tuple[str, str, str, List[Tuple[Dict[str, Any], float]]]
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in labels]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    value = round(float(value), 6)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class Counter:
+    """Monotonic counter per label set."""
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = _labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        lines += [f"{self.name}{_format_labels(k)} {_format_value(v)}" for k, v in values]
+        return lines
+
+
+class Histogram:
+    """Latency histogram (seconds) per label set."""
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._histograms: Dict[Labels, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, **labels: Any) -> LatencyHistogram:
+        key = _labels(labels)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, LatencyHistogram())
+        return histogram
+
+    def observe(self, seconds: float, **labels: Any) -> None:
+        self.labels(**labels).observe(seconds)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            histograms = sorted(self._histograms.items(), key=lambda item: item[0])
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for key, histogram in histograms:
+            lines += histogram_lines(self.name, dict(key), histogram.snapshot())
+        return lines
+
+
+def histogram_lines(name: str, labels: Dict[str, Any], snapshot: Dict[str, Any]) -> List[str]:
+    """Prometheus bucket/sum/count lines for a `LatencyHistogram.snapshot()`."""
+    base = list(_labels(labels))
+    lines = []
+    for bound, cumulative in snapshot["buckets_ms"].items():
+        le = bound if bound == "+Inf" else _format_value(float(bound) / 1000.0)
+        lines.append(f"{name}_bucket{_format_labels(base + [('le', le)])} {cumulative}")
+    lines.append(f"{name}_sum{_format_labels(base)} {_format_value(snapshot['sum_ms'] / 1000.0)}")
+    lines.append(f"{name}_count{_format_labels(base)} {snapshot['count']}")
+    return lines
+
+
+class MetricsRegistry:
+    """Named counters and histograms plus scrape-time collectors."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name: str, help: str):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help)
+            return metric
+
+    def counter(self, name: str, help: str) -> Counter:
+        return self._get(Counter, name, help)
+
+    def histogram(self, name: str, help: str) -> Histogram:
+        return self._get(Histogram, name, help)
+
+    def add_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        """Register `collector`, called on every render; it yields metric families."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """All metrics in Prometheus text format (version 0.0.4)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines += metric.render()
+        for collector in self._collectors:
+            for name, kind, help, samples in collector():
+                lines += [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+                for labels, value in samples:
+                    if kind == "histogram":
+                        lines += histogram_lines(name, labels, value)
+                    else:
+                        label_text = _format_labels(_labels(labels))
+                        lines.append(f"{name}{label_text} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def cache_families(name: str, stats: Dict[str, Any]) -> List[Family]:
+    """Lookups by namespace and result, and entries, of a `TTLCache.stats()` result."""
+    lookups = []
+    for namespace, counters in stats["namespaces"].items():
+        lookups.append(({"namespace": namespace, "result": "hit"}, counters["hits"]))
+        lookups.append(({"namespace": namespace, "result": "miss"}, counters["misses"]))
+    return [
+        (f"{name}_lookups_total", "counter", "Cache lookups by namespace and result", lookups),
+        (f"{name}_entries", "gauge", "Entries currently cached", [({}, stats["size"])]),
+    ]
+
+
+def coalescing_families(name: str, stats: Dict[str, Any]) -> List[Family]:
+    """Calls and collapsed duplicate calls per namespace of a `SingleFlight.stats()` result."""
+    namespaces = stats["namespaces"].items()
+    return [
+        (f"{name}_calls_total", "counter", "Coalesced calls by namespace",
+         [({"namespace": ns}, counters["calls"]) for ns, counters in namespaces]),
+        (f"{name}_collapsed_total", "counter", "Duplicate calls served by an in-flight call",
+         [({"namespace": ns}, counters["collapsed"]) for ns, counters in namespaces]),
+    ]
+
+
+def tool_module_families() -> List[Family]:
+    """
+    Cache, coalescing and Bedrock retrieve metrics of the tool modules imported
+    so far; a scrape never imports a lazily loaded tool module.
+    """
+    families: List[Family] = []
+    market_tools = sys.modules.get("market_tools")
+    if market_tools is not None:
+        families += cache_families("econflux_market_cache", market_tools.market_cache_stats())
+        families += coalescing_families(
+            "econflux_market_coalesced", market_tools.market_coalescing_stats()
+        )
+    rag_tools = sys.modules.get("rag_tools")
+    if rag_tools is not None:
+        families += cache_families("econflux_retrieval_cache", rag_tools.retrieval_cache_stats())
+        families += coalescing_families(
+            "econflux_retrieval_coalesced", rag_tools.retrieval_coalescing_stats()
+        )
+        latency = rag_tools.retrieval_latency_stats()
+        families.append((
+            "econflux_kb_retrieve_duration_seconds", "histogram",
+            "Bedrock Knowledge Base retrieve latency",
+            [
+                ({"kb": kb, "outcome": outcome}, histogram)
+                for kb, stats in latency.items()
+                for outcome, histogram in stats["latency"].items()
+            ],
+        ))
+        for event in ("hedged", "failures", "short_circuited", "stale_served"):
+            families.append((
+                f"econflux_kb_retrieve_{event}_total", "counter",
+                f"Bedrock Knowledge Base retrieves: {event.replace('_', ' ')}",
+                [({"kb": kb}, stats.get(event, 0)) for kb, stats in latency.items()],
+            ))
+        families.append((
+            "econflux_kb_circuit_open", "gauge", "1 while the KB circuit breaker is not closed",
+            [({"kb": kb}, int(stats["circuit"] != "closed")) for kb, stats in latency.items()],
+        ))
+    return families
+
+
+REGISTRY.add_collector(tool_module_families)
@@ -2,6 +2,7 @@ from faker import Faker
 import random
 from datetime import datetime, timedelta
 import os
+import json
 import argparse
 
 fake = Faker()
@@ -365,10 +366,114 @@ def generate_policy_decisions(date_tracker):
     }
 
 
+def format_monetary_policy_summary(idx, policy):
+    return (
+        f"\nMONETARY POLICY REPORT #{idx}\n"
+        f"Institution: {policy['bank']}\n"
+        f"Meeting Date: {policy['date']}\n"
+        f"Policy Action: {policy['policy_decision']}\n"
+        f"Rate Movement: {policy['current_rate']}% → {policy['new_rate']}%\n"
+        f"Policy Stance: {policy['direction'].capitalize()}\n"
+        f"\n{policy['summary']}\n"
+    )
+
+
+def format_economic_indicator(idx, indicator):
+    return (
+        f"\nECONOMIC DATA RELEASE #{idx}\n"
+        f"Indicator: {indicator['indicator']}\n"
+        f"Release Date: {indicator['reported_date']}\n"
+        f"Current Value: {indicator['value']}%\n"
+        f"Prior Value: {indicator['prior_value']}%\n"
+        f"Consensus Forecast: {indicator['consensus']}%\n"
+        f"\n{indicator['context']}\n"
+    )
+
+
+def format_regulatory_change(idx, regulation):
+    return (
+        f"\nREGULATORY UPDATE #{idx}\n"
+        f"Affected Sector: {regulation['sector']}\n"
+        f"Regulatory Topic: {regulation['topic']}\n"
+        f"Announcement Date: {regulation['announcement_date']}\n"
+        f"Effective Date: {regulation['effective_date']}\n"
+        f"Affected Institutions: {regulation['affected_institutions']}\n"
+        f"Compliance Period: {regulation['compliance_period_months']} months\n"
+        f"\n{regulation['summary']}\n"
+    )
+
+
+def format_policy_decision(idx, decision):
+    return (
+        f"\nPOLICY DECISION ANALYSIS #{idx}\n"
+        f"Central Bank: {decision['bank']}\n"
+        f"Decision Date: {decision['date']}\n"
+        f"Next Meeting: {decision['next_meeting']}\n"
+        f"Policy Action: {decision['policy_decision']}\n"
+        f"Vote Outcome: {decision['vote']}\n"
+        f"Policy Direction: {decision['direction'].capitalize()}\n"
+        f"Current Inflation: {decision['current_inflation']}%\n"
+        f"Core Inflation: {decision['core_inflation']}%\n"
+        f"Inflation Target: {decision['inflation_target']}%\n"
+        f"\n{decision['summary']}\n"
+    )
+
+
+def date_value(iso_date):
+    """YYYY-MM-DD as a YYYYMMDD number; KB metadata range filters only work on numbers."""
+    return int(iso_date.replace("-", ""))
+
+
+# Bedrock KB metadata attributes per record. The bank is kept verbatim (exact-match
+# filter); other strings are lower-cased for case-insensitive "stringContains" filters.
+def monetary_policy_metadata(policy):
+    return {"bank": policy["bank"], "date": date_value(policy["date"]), "direction": policy["direction"]}
+
+
+def economic_indicator_metadata(indicator):
+    return {"indicator": indicator["indicator"].lower(), "date": date_value(indicator["reported_date"])}
+
+
+def regulatory_change_metadata(regulation):
+    return {
+        "sector": regulation["sector"],
+        "topic": regulation["topic"],
+        "date": date_value(regulation["announcement_date"]),
+    }
+
+
+def policy_decision_metadata(decision):
+    return {"bank": decision["bank"], "date": date_value(decision["date"]), "direction": decision["direction"]}
+
+
+def write_corpus(output_dir, name, records, formatter, metadata, documents=True):
+    """
+    Write all records to <output_dir>/<name>.txt and, when `documents` is set, each
+    record to documents/<name>/<name>_<idx>.txt with a Bedrock `.metadata.json` sidecar
+    so a KB data source can filter retrieval by bank, date, indicator, sector or topic.
+    """
+    doc_dir = os.path.join(output_dir, "documents", name)
+    if documents:
+        os.makedirs(doc_dir, exist_ok=True)
+
+    with open(f"{output_dir}/{name}.txt", "w") as f:
+        for idx, record in enumerate(records, 1):
+            text = formatter(idx, record)
+            f.write(text)
+            if not documents:
+                continue
+            doc_path = os.path.join(doc_dir, f"{name}_{idx:05d}.txt")
+            with open(doc_path, "w") as doc:
+                doc.write(text.lstrip("\n"))
+            with open(f"{doc_path}.metadata.json", "w") as sidecar:
+                json.dump({"metadataAttributes": metadata(record)}, sidecar)
+
+
 if __name__=="__main__":
     parser = argparse.ArgumentParser(description='Number of records to generate')
     parser.add_argument('--records', '-r', type=int, default=100, help='Number of records for each dataset')
     parser.add_argument('--years', '-y', type=int, default=3, help='Number of back dated in years')
+    parser.add_argument('--no-documents', action='store_true', help='Skip per-record documents and metadata sidecars')
     args = parser.parse_args()
     TOTAL_RECORDS = args.records  # Change this to 5000 for full dataset
     YEARS_BACK = args.years  # How many years of historical data
@@ -390,15 +495,8 @@ if __name__=="__main__":
         policy = generate_monetary_policy_summary(monetary_date_tracker)
         monetary_policies.append(policy)
     
-    with open(f"{output_dir}/monetary_policy_summaries.txt", "w") as f:
-        for idx, policy in enumerate(monetary_policies, 1):
-            f.write(f"\nMONETARY POLICY REPORT #{idx}\n")
-            f.write(f"Institution: {policy['bank']}\n")
-            f.write(f"Meeting Date: {policy['date']}\n")
-            f.write(f"Policy Action: {policy['policy_decision']}\n")
-            f.write(f"Rate Movement: {policy['current_rate']}% → {policy['new_rate']}%\n")
-            f.write(f"Policy Stance: {policy['direction'].capitalize()}\n")
-            f.write(f"\n{policy['summary']}\n")
+    write_corpus(output_dir, "monetary_policy_summaries", monetary_policies,
+                 format_monetary_policy_summary, monetary_policy_metadata, not args.no_documents)
 
     # Economic Indicators
     print("Generating economic indicators...")
@@ -408,15 +506,8 @@ if __name__=="__main__":
         indicator = generate_economic_indicator(economic_date_tracker)
         economic_data.append(indicator)
     
-    with open(f"{output_dir}/economic_indicators.txt", "w") as f:
-        for idx, indicator in enumerate(economic_data, 1):
-            f.write(f"\nECONOMIC DATA RELEASE #{idx}\n")
-            f.write(f"Indicator: {indicator['indicator']}\n")
-            f.write(f"Release Date: {indicator['reported_date']}\n")
-            f.write(f"Current Value: {indicator['value']}%\n")
-            f.write(f"Prior Value: {indicator['prior_value']}%\n")
-            f.write(f"Consensus Forecast: {indicator['consensus']}%\n")
-            f.write(f"\n{indicator['context']}\n")
+    write_corpus(output_dir, "economic_indicators", economic_data,
+                 format_economic_indicator, economic_indicator_metadata, not args.no_documents)
 
     # Regulatory Changes
     print("Generating regulatory changes...")
@@ -426,16 +517,8 @@ if __name__=="__main__":
         regulation = generate_regulatory_changes(regulatory_date_tracker)
         regulatory_updates.append(regulation)
     
-    with open(f"{output_dir}/regulatory_changes.txt", "w") as f:
-        for idx, regulation in enumerate(regulatory_updates, 1):
-            f.write(f"\nREGULATORY UPDATE #{idx}\n")
-            f.write(f"Affected Sector: {regulation['sector']}\n")
-            f.write(f"Regulatory Topic: {regulation['topic']}\n")
-            f.write(f"Announcement Date: {regulation['announcement_date']}\n")
-            f.write(f"Effective Date: {regulation['effective_date']}\n")
-            f.write(f"Affected Institutions: {regulation['affected_institutions']}\n")
-            f.write(f"Compliance Period: {regulation['compliance_period_months']} months\n")
-            f.write(f"\n{regulation['summary']}\n")
+    write_corpus(output_dir, "regulatory_changes", regulatory_updates,
+                 format_regulatory_change, regulatory_change_metadata, not args.no_documents)
 
     # Policy Decisions
     print("Generating policy decisions...")
@@ -445,19 +528,8 @@ if __name__=="__main__":
         decision = generate_policy_decisions(policy_date_tracker)
         policy_decisions_data.append(decision)
     
-    with open(f"{output_dir}/policy_decisions.txt", "w") as f:
-        for idx, decision in enumerate(policy_decisions_data, 1):
-            f.write(f"\nPOLICY DECISION ANALYSIS #{idx}\n")
-            f.write(f"Central Bank: {decision['bank']}\n")
-            f.write(f"Decision Date: {decision['date']}\n")
-            f.write(f"Next Meeting: {decision['next_meeting']}\n")
-            f.write(f"Policy Action: {decision['policy_decision']}\n")
-            f.write(f"Vote Outcome: {decision['vote']}\n")
-            f.write(f"Policy Direction: {decision['direction'].capitalize()}\n")
-            f.write(f"Current Inflation: {decision['current_inflation']}%\n")
-            f.write(f"Core Inflation: {decision['core_inflation']}%\n")
-            f.write(f"Inflation Target: {decision['inflation_target']}%\n")
-            f.write(f"\n{decision['summary']}\n")
+    write_corpus(output_dir, "policy_decisions", policy_decisions_data,
+                 format_policy_decision, policy_decision_metadata, not args.no_documents)
 
     print("\nDATA GENERATION COMPLETE")
     print(f"\nGenerated {len(monetary_policies)} monetary policy summaries")
@@ -469,4 +541,6 @@ if __name__=="__main__":
     print(f"  - monetary_policy_summaries.txt")
     print(f"  - economic_indicators.txt")
     print(f"  - regulatory_changes.txt")
-    print(f"  - policy_decisions.txt")
\ No newline at end of file
+    print(f"  - policy_decisions.txt")
+    if not args.no_documents:
+        print(f"  - documents/<corpus>/*.txt with .metadata.json sidecars (for Bedrock KB ingestion)")
\ No newline at end of file
@@ -0,0 +1,219 @@
+"""
+Post-retrieval context compression for the RAG tools.
+
+Retrieved chunks are mostly generator boilerplate, and every token of them is
+paid for as model input. `compress_results` shrinks a result list to a token
+budget in three cheap, purely lexical steps:
+
+1. Re-rank: blend the retrieval score with a query-term overlap score
+   (IDF-weighted within the candidate set).
+2. Collapse near-duplicates: a passage with the same header lines as a
+   higher-ranked passage and whose body word 3-grams are mostly contained in it
+   is dropped (its source is kept under `duplicates`). Generated records share
+   most of their wording, so passages with different headers (another record,
+   institution or date) are never duplicates.
+3. Extract: when the survivors still exceed the budget, keep each passage's
+   header lines plus its query-relevant sentences, best first, until the budget
+   is used. Budget left over goes to the header and leading sentences of the
+   ranked passages that kept nothing, so a query sharing no term with the
+   passages still gets the top-ranked ones.
+
+Tokens are estimated with a regex approximation of a BPE tokenizer (words,
+1-3 digit groups, punctuation), close enough for budgeting.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import Any, Dict, List, Tuple
+
+from local_kb import tokenize
+
+# Passages with equal headers sharing this fraction of body word 3-grams (of the
+# shorter one) are duplicates
+DUPLICATE_OVERLAP = 0.8
+# Weight of the lexical score against the normalized retrieval score when re-ranking
+LEXICAL_WEIGHT = 0.5
+
+_TOKEN_ESTIMATE = re.compile(r"[A-Za-z]+|\d{1,3}|[^\sA-Za-z\d]")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[A-Z])")
+_HEADER_LINE = re.compile(r"^([A-Z][A-Z ]+ #\d+|[A-Z][A-Za-z ]+: .+)$")
+
+
+def estimate_tokens(text: str) -> int:
+    return len(_TOKEN_ESTIMATE.findall(text))
+
+
+def shingles(text: str, size: int = 3) -> set:
+    words = text.lower().split()
+    return {tuple(words[i : i + size]) for i in range(max(1, len(words) - size + 1))}
+
+
+def overlaps(a: set, b: set) -> bool:
+    """True when the shorter of two shingle sets is mostly contained in the other."""
+    return len(a & b) / (min(len(a), len(b)) or 1) >= DUPLICATE_OVERLAP
+
+
+def _split(text: str) -> Tuple[str, List[str]]:
+    """(header block, body sentences) of a passage; the header may be empty."""
+    lines = text.strip().splitlines()
+    header_lines = []
+    while lines and _HEADER_LINE.match(lines[0].strip()):
+        header_lines.append(lines.pop(0).strip())
+    body = " ".join(line.strip() for line in lines if line.strip())
+    return "\n".join(header_lines), [s for s in _SENTENCE_END.split(body) if s]
+
+
+class _Passage:
+    """A result split once into header and sentences, with per-sentence terms and token counts."""
+
+    __slots__ = (
+        "result",
+        "header",
+        "header_tokens",
+        "sentences",
+        "sentence_terms",
+        "sentence_tokens",
+        "shingles",
+        "terms",
+        "tokens",
+    )
+
+    def __init__(self, result: Dict[str, Any]):
+        self.result = result
+        self.header, self.sentences = _split(result.get("text", ""))
+        self.header_tokens = estimate_tokens(self.header)
+        self.sentence_terms = [set(tokenize(sentence)) for sentence in self.sentences]
+        self.sentence_tokens = [estimate_tokens(sentence) for sentence in self.sentences]
+        self.shingles = shingles(" ".join(self.sentences))
+        self.terms = set(tokenize(self.header)).union(*self.sentence_terms)
+        self.tokens = self.header_tokens + sum(self.sentence_tokens)
+
+
+def _idf(query_terms: set, documents: List[set]) -> Dict[str, float]:
+    n = len(documents)
+    return {
+        term: math.log1p((n + 1) / (1 + sum(term in doc for doc in documents)))
+        for term in query_terms
+    }
+
+
+def _lexical(terms: set, idf: Dict[str, float]) -> float:
+    return sum(weight for term, weight in idf.items() if term in terms)
+
+
+def compress_results(
+    query: str,
+    results: List[Dict[str, Any]],
+    token_budget: int,
+    score_key: str = "score",
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Re-rank, de-duplicate and trim `results` ({text, score, source, ...} dicts) to
+    about `token_budget` tokens of passage text, blending `score_key` with the
+    lexical score. Returns the new list and stats (tokens_before/after/saved,
+    passages_before/after, duplicates_collapsed). A budget <= 0 disables compression.
+    """
+    if token_budget <= 0 or not results:
+        tokens = sum(estimate_tokens(r.get("text", "")) for r in results)
+        return results, {
+            "tokens_before": tokens,
+            "tokens_after": tokens,
+            "tokens_saved": 0,
+            "passages_before": len(results),
+            "passages_after": len(results),
+            "duplicates_collapsed": 0,
+        }
+
+    passages = [_Passage(r) for r in results]
+    tokens_before = sum(p.tokens for p in passages)
+    idf = _idf(set(tokenize(query)), [p.terms for p in passages])
+    max_lexical = max(_lexical(p.terms, idf) for p in passages) or 1.0
+    max_score = max((r.get(score_key) or 0.0 for r in results), default=0.0) or 1.0
+
+    def rank(p: _Passage) -> float:
+        retrieval = (p.result.get(score_key) or 0.0) / max_score
+        lexical = _lexical(p.terms, idf) / max_lexical
+        return (1 - LEXICAL_WEIGHT) * retrieval + LEXICAL_WEIGHT * lexical
+
+    kept: List[_Passage] = []
+    duplicates = 0
+    for passage in sorted(passages, key=rank, reverse=True):
+        match = next((k for k in kept if _duplicate(passage, k)), None)
+        if match is not None:
+            match.result = dict(match.result)
+            match.result.setdefault("duplicates", []).append(passage.result.get("source"))
+            duplicates += 1
+            continue
+        kept.append(passage)
+
+    if sum(p.tokens for p in kept) > token_budget:
+        compressed, tokens_after = _extract(kept, idf, token_budget)
+    else:
+        compressed, tokens_after = [p.result for p in kept], sum(p.tokens for p in kept)
+
+    return compressed, {
+        "tokens_before": tokens_before,
+        "tokens_after": tokens_after,
+        "tokens_saved": tokens_before - tokens_after,
+        "passages_before": len(results),
+        "passages_after": len(compressed),
+        "duplicates_collapsed": duplicates,
+    }
+
+
+def _duplicate(passage: _Passage, kept: _Passage) -> bool:
+    return passage.header == kept.header and overlaps(passage.shingles, kept.shingles)
+
+
+def _extract(
+    passages: List[_Passage], idf: Dict[str, float], token_budget: int
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Keep query-relevant sentences of ranked `passages`, with their headers, within
+    the budget, then fill what is left with the header and leading sentences of
+    passages that kept none. Returns the trimmed results and their token count.
+    """
+    units = []  # (priority, passage index, sentence index)
+    for p, passage in enumerate(passages):
+        rank_weight = 1.0 / (1 + p)
+        for s, terms in enumerate(passage.sentence_terms):
+            relevance = _lexical(terms, idf)
+            if relevance > 0:
+                units.append((relevance * rank_weight, p, s))
+    units.sort(key=lambda u: (u[0], -u[1], -u[2]), reverse=True)
+
+    selected: Dict[int, List[int]] = {}
+    used = 0
+    for _, p, s in units:
+        # A passage's header (facts and attribution) comes with its first kept sentence
+        cost = passages[p].sentence_tokens[s] + (0 if p in selected else passages[p].header_tokens)
+        if used + cost > token_budget:
+            continue
+        selected.setdefault(p, []).append(s)
+        used += cost
+
+    for p, passage in enumerate(passages):
+        if p in selected:
+            continue
+        cost = passage.header_tokens
+        leading = []
+        for s, tokens in enumerate(passage.sentence_tokens):
+            if used + cost + tokens > token_budget:
+                break
+            leading.append(s)
+            cost += tokens
+        if leading:
+            selected[p] = leading
+            used += cost
+
+    compressed = []
+    for p, passage in enumerate(passages):
+        if p not in selected:
+            continue
+        body = " ".join(passage.sentences[s] for s in sorted(selected[p]))
+        text = f"{passage.header}\n{body}" if passage.header else body
+        excerpt = len(selected[p]) < len(passage.sentences)
+        compressed.append({**passage.result, "text": text, "excerpt": excerpt})
+    return compressed, used
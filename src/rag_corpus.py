@@ -0,0 +1,124 @@
+"""
+Parsing helpers for the corpora written by `rag/synthetic_data_gen.py`.
+
+A corpus file is a sequence of reports, each a title line ("MONETARY POLICY
+REPORT #12"), "Field: value" header lines, a blank line and summary paragraphs.
+`local_kb` (BM25 passages and filter metadata) and `fact_index` (structured
+fact tables) both build on these helpers.
+
+The retrieval metadata mirrors the `.metadata.json` sidecars the generator
+writes for Bedrock ingestion: `bank` (exact name), `indicator`, `sector`,
+`topic`, `direction` (lower-case, matched by substring) and `date`.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+# Central banks appearing in the corpora, and the short names analysts use for them
+CENTRAL_BANKS = [
+    "Federal Reserve",
+    "European Central Bank",
+    "Bank of Japan",
+    "Bank of England",
+    "Swiss National Bank",
+    "Reserve Bank of Australia",
+]
+BANK_ALIASES: Dict[str, str] = {
+    "fed": "Federal Reserve",
+    "fomc": "Federal Reserve",
+    "ecb": "European Central Bank",
+    "boj": "Bank of Japan",
+    "boe": "Bank of England",
+    "snb": "Swiss National Bank",
+    "rba": "Reserve Bank of Australia",
+}
+
+# Header names that mean the same thing across corpora
+CANONICAL_COLUMNS: Dict[str, str] = {
+    "institution": "bank",
+    "central_bank": "bank",
+    "meeting_date": "date",
+    "decision_date": "date",
+    "release_date": "date",
+    "announcement_date": "date",
+    "affected_sector": "sector",
+    "regulatory_topic": "topic",
+    "policy_stance": "direction",
+    "policy_direction": "direction",
+    "policy_action": "action",
+    "vote_outcome": "vote",
+}
+
+# Retrieval filter attributes besides `date`
+METADATA_FIELDS = ("bank", "indicator", "sector", "topic", "direction")
+
+_RECORD_TITLE = re.compile(r"^[A-Z][A-Z ]+ #(\d+)$")
+_NUMBER = re.compile(r"^-?\d+(?:\.\d+)?%?$")
+_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_RATE_MOVEMENT = re.compile(r"^(-?\d+(?:\.\d+)?)% → (-?\d+(?:\.\d+)?)%$")
+
+
+def resolve_bank(name: str) -> str:
+    """Canonical central bank name for a full or short name (unknown names pass through)."""
+    key = name.strip().lower()
+    if key in BANK_ALIASES:
+        return BANK_ALIASES[key]
+    return next((bank for bank in CENTRAL_BANKS if bank.lower() == key), name.strip())
+
+
+def parse_corpus(path: str) -> List[Tuple[int, str]]:
+    """Split a generated corpus into (report number, report text) passages."""
+    records: List[Tuple[int, str]] = []
+    number, lines = None, []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            match = _RECORD_TITLE.match(line.strip())
+            if match:
+                if number is not None:
+                    records.append((number, "".join(lines).strip()))
+                number, lines = int(match.group(1)), []
+            lines.append(line)
+    if number is not None:
+        records.append((number, "".join(lines).strip()))
+    return records
+
+
+def _column_name(header: str) -> str:
+    name = re.sub(r"[^a-z0-9]+", "_", header.lower()).strip("_")
+    return CANONICAL_COLUMNS.get(name, name)
+
+
+def parse_headers(text: str) -> Dict[str, Any]:
+    """Typed header fields of one report: floats for numbers/percentages, datetime64 for dates."""
+    fields: Dict[str, Any] = {}
+    for line in text.splitlines()[1:]:
+        if not line.strip():
+            break
+        header, _, value = line.partition(":")
+        value = value.strip()
+        name = _column_name(header)
+
+        movement = _RATE_MOVEMENT.match(value)
+        if movement:
+            fields["previous_rate"] = float(movement.group(1))
+            fields["new_rate"] = float(movement.group(2))
+        elif _NUMBER.match(value):
+            fields[name] = float(value.rstrip("%"))
+        elif _DATE.match(value):
+            fields[name] = np.datetime64(value, "D")
+        else:
+            fields[name] = value
+    return fields
+
+
+def record_metadata(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Filter attributes of one report from its parsed headers ("" when absent)."""
+    metadata: Dict[str, Any] = {"date": fields.get("date", np.datetime64("NaT", "D"))}
+    for name in METADATA_FIELDS:
+        value = str(fields.get(name, ""))
+        metadata[name] = value if name == "bank" else value.lower()
+    return metadata
@@ -7,19 +7,228 @@ policy decisions).
 
 Tools follow the Strands @tool pattern and return structured
 results ready for grounding answers.
+
+Successful retrievals are cached per (knowledge base, normalized query,
+max_results) for RAG_CACHE_TTL seconds, so repeated analyst questions skip
+the Bedrock round trip; set RAG_CACHE_PATH to persist the cache across restarts.
+Identical retrievals issued concurrently by different sessions are coalesced
+into one Bedrock call.
+
+Bedrock calls run with explicit connect/read timeouts (see `resilience.py`): a
+call still running after the KB's observed p95 latency is hedged with a second
+identical request, and a KB that keeps failing is short-circuited for a
+cool-down, answering from its last good (possibly stale) results or an empty
+list flagged `degraded`. `retrieval_latency_stats()` exposes per-KB latency
+histograms, circuit state and hedging counters.
+
+Any KB can instead be served from a local BM25 index (see `local_kb.py`) by
+setting `<KB env prefix>_BACKEND=local` (e.g. KB_MONETARY_POLICY_BACKEND), or
+RAG_BACKEND=local for all of them; results keep the same shape.
+
+All KB tools accept optional metadata filters (date range plus bank, indicator,
+sector or topic, depending on the corpus). They are sent to Bedrock as retrieval
+filters over the `.metadata.json` sidecars written by the data generator and
+applied identically by the local index, so off-date or off-bank passages never
+reach the context.
+
+Retrieved passages are compressed to RAG_CONTEXT_TOKEN_BUDGET tokens per tool
+call (see `rag_compress.py`); each response reports the tokens saved under
+`compression`.
+
+`lookup_policy_facts` answers structured rate-decision questions from the fact
+tables extracted out of the corpus headers (see `fact_index.py`) without any
+vector search.
 """
 
 from __future__ import annotations
 
+import atexit
+import logging
 import os
-from typing import Any, Dict, List
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional
 
 import boto3
+import numpy as np
 from botocore.config import Config
+from botocore.exceptions import ClientError
 from strands import tool
 
+from cache import TTLCache
+from config import (
+    load_rag_backend_config,
+    load_rag_cache_config,
+    load_rag_context_config,
+    load_rag_fact_config,
+    load_rag_resilience_config,
+)
+from fact_index import get_fact_table
+from local_kb import get_index
+from rag_compress import compress_results
+from rag_corpus import BANK_ALIASES, resolve_bank
+from resilience import CircuitBreaker, HedgeBudget, LatencyHistogram, hedged_call
+from single_flight import SingleFlight
+from tracing import CLIENT, bind, start_span
+
+logger = logging.getLogger(__name__)
+
+# Tool-facing KB names -> environment variable holding the KB ID, friendly label
+# the synthetic corpus (rag/synthetic_data_gen.py output) the KB is built from and
+# the metadata filters its documents carry besides the date
+KNOWLEDGE_BASES: Dict[str, Dict[str, Any]] = {
+    "monetary_policy": {
+        "kb_id_env": "KB_MONETARY_POLICY_ID",
+        "kb_label": "kb_monetary_policy_summaries",
+        "corpus": "monetary_policy_summaries",
+        "filters": ("bank",),
+    },
+    "economic_indicators": {
+        "kb_id_env": "KB_ECONOMIC_INDICATORS_ID",
+        "kb_label": "kb_economic_indicators",
+        "corpus": "economic_indicators",
+        "filters": ("indicator",),
+    },
+    "regulatory_changes": {
+        "kb_id_env": "KB_REGULATORY_CHANGES_ID",
+        "kb_label": "kb-regulatory-changes",
+        "corpus": "regulatory_changes",
+        "filters": ("sector", "topic"),
+    },
+    "policy_decisions": {
+        "kb_id_env": "KB_POLICY_DECISIONS_ID",
+        "kb_label": "kb_policy_decisions",
+        "corpus": "policy_decisions",
+        "filters": ("bank",),
+    },
+}
+
 _bedrock_runtime_client = None
 
+_rag_cache_config = load_rag_cache_config()
+_rag_fact_config = load_rag_fact_config()
+_rag_context_config = load_rag_context_config()
+_backend_configs = {
+    name: load_rag_backend_config(spec["kb_id_env"][: -len("_ID")], spec["corpus"])
+    for name, spec in KNOWLEDGE_BASES.items()
+}
+_retrieval_cache = TTLCache(maxsize=_rag_cache_config.max_entries)
+_inflight = SingleFlight()
+
+_rag_resilience_config = load_rag_resilience_config()
+# Shared by every session's query_all_kbs calls: sized for concurrent fan-outs
+# (RAG_FANOUT_WORKERS), not for the four KBs of a single call
+_kb_pool = ThreadPoolExecutor(
+    max_workers=_rag_resilience_config.fanout_workers, thread_name_prefix="kb-retrieve"
+)
+# Last good results per retrieval, kept well past the cache TTL for degraded answers
+_stale_results = TTLCache(maxsize=_rag_cache_config.max_entries)
+# Bedrock calls that may be hedged run here; their hedges run under a per-KB budget,
+# so a slow KB's hedges never hold up primary calls (its own or other KBs')
+_retrieve_pool = ThreadPoolExecutor(
+    max_workers=_rag_resilience_config.max_pool_connections, thread_name_prefix="kb-call"
+)
+_kb_labels = [spec["kb_label"] for spec in KNOWLEDGE_BASES.values()]
+_hedges = {
+    label: HedgeBudget(_rag_resilience_config.hedge_budget, f"kb-hedge-{label}")
+    for label in _kb_labels
+}
+# Retrieve latency per KB and outcome; hedge delays come from the "ok" histogram
+_latency = {label: {"ok": LatencyHistogram(), "error": LatencyHistogram()} for label in _kb_labels}
+_breakers = {
+    label: CircuitBreaker(
+        _rag_resilience_config.breaker_failures, _rag_resilience_config.breaker_reset
+    )
+    for label in _kb_labels
+}
+_retrieve_counters = {label: Counter() for label in _kb_labels}
+_counters_lock = threading.Lock()
+
+# Bedrock error codes worth tripping the breaker for; other client errors are caller mistakes
+_TRANSIENT_ERROR_CODES = {
+    "ThrottlingException",
+    "ServiceQuotaExceededException",
+    "InternalServerException",
+    "DependencyFailedException",
+    "BadGatewayException",
+}
+
+
+def _normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query, used as the cache key."""
+    return " ".join(query.lower().split()).rstrip("?.! ")
+
+
+def retrieval_cache_stats() -> Dict[str, Any]:
+    """Hit/miss/eviction counters of the retrieval cache, per knowledge base label."""
+    return _retrieval_cache.stats()
+
+
+def retrieval_coalescing_stats() -> Dict[str, Any]:
+    """Calls, Bedrock executions and collapsed duplicate calls, per knowledge base label."""
+    return _inflight.stats()
+
+
+def retrieval_latency_stats() -> Dict[str, Any]:
+    """
+    Per knowledge base label: Bedrock retrieve latency histograms by outcome ("ok",
+    "error"; count, sum, p50/p95/p99, cumulative buckets), circuit state, and
+    requests/hedged/failures/short_circuited/stale_served counters.
+    """
+    with _counters_lock:
+        counters = {label: dict(counter) for label, counter in _retrieve_counters.items()}
+    return {
+        label: {
+            "latency": {outcome: h.snapshot() for outcome, h in _latency[label].items()},
+            "circuit": _breakers[label].state,
+            **counters[label],
+        }
+        for label in _kb_labels
+    }
+
+
+# Retrievals cached since the last save; atexit does not run when the container is
+# killed by a signal, so the cache is also saved periodically
+_unsaved_entries = 0
+_save_lock = threading.Lock()
+
+
+def save_retrieval_cache() -> None:
+    """Persist the retrieval cache to RAG_CACHE_PATH, if configured."""
+    global _unsaved_entries
+    if not _rag_cache_config.path:
+        return
+    with _save_lock:
+        with _counters_lock:
+            unsaved, _unsaved_entries = _unsaved_entries, 0
+        try:
+            count = _retrieval_cache.dump(_rag_cache_config.path)
+            logger.info(f"Saved {count} retrieval cache entries to {_rag_cache_config.path}")
+        except OSError as exc:
+            with _counters_lock:
+                _unsaved_entries += unsaved
+            logger.warning(f"Could not save retrieval cache: {exc}")
+
+
+def _save_loop() -> None:
+    """Save the retrieval cache every RAG_CACHE_SAVE_INTERVAL seconds while it changes."""
+    while True:
+        time.sleep(_rag_cache_config.save_interval)
+        if _unsaved_entries:
+            save_retrieval_cache()
+
+
+if _rag_cache_config.path:
+    try:
+        _retrieval_cache.load(_rag_cache_config.path)
+    except (OSError, ValueError) as exc:
+        logger.warning(f"Could not load retrieval cache: {exc}")
+    atexit.register(save_retrieval_cache)
+    if _rag_cache_config.save_interval > 0:
+        threading.Thread(target=_save_loop, name="retrieval-cache-save", daemon=True).start()
+
 
 def _get_bedrock_runtime():
     """Lazily create and cache the Bedrock Agent Runtime client."""
@@ -28,19 +237,115 @@ def _get_bedrock_runtime():
         return _bedrock_runtime_client
 
     region = os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION") or "us-east-1"
+    resilience = _rag_resilience_config
     _bedrock_runtime_client = boto3.client(
         "bedrock-agent-runtime",
         region_name=region,
-        config=Config(retries={"max_attempts": 3}),
+        config=Config(
+            connect_timeout=resilience.connect_timeout,
+            read_timeout=resilience.read_timeout,
+            # Room for every in-flight retrieve plus the KBs' hedges without waiting on the pool
+            max_pool_connections=resilience.max_pool_connections,
+            retries={"max_attempts": resilience.max_attempts, "mode": "standard"},
+        ),
     )
     return _bedrock_runtime_client
 
 
+def _note_cached() -> None:
+    global _unsaved_entries
+    with _counters_lock:
+        _unsaved_entries += 1
+
+
+def _count(kb_label: str, *events: str) -> None:
+    with _counters_lock:
+        _retrieve_counters[kb_label].update(events)
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Whether a retrieve failure says the KB is unhealthy (timeouts, throttling, 5xx)."""
+    if not isinstance(exc, ClientError):
+        return True
+    error = exc.response.get("Error", {})
+    status = exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+    return error.get("Code") in _TRANSIENT_ERROR_CODES or status >= 500
+
+
+def _hedge_delay(kb_label: str) -> Optional[float]:
+    """Delay before hedging a retrieve: the KB's configured latency quantile, once known."""
+    resilience = _rag_resilience_config
+    histogram = _latency[kb_label]["ok"]
+    if resilience.hedge_quantile <= 0 or histogram.count < resilience.hedge_min_samples:
+        return None
+    return max(resilience.hedge_min_delay, histogram.quantile(resilience.hedge_quantile))
+
+
+def _degraded(kb_label: str, cache_key: tuple, reason: str) -> Dict[str, Any]:
+    """Last good results for `cache_key` (or none), flagged as degraded."""
+    stale = _stale_results.get(cache_key)
+    response: Dict[str, Any] = {
+        "knowledge_base": kb_label,
+        "results": stale or [],
+        "degraded": True,
+        "warning": reason,
+    }
+    if stale is not None:
+        _count(kb_label, "stale_served")
+        response["cached"] = True
+    return response
+
+
+def _retrieval_filters(
+    since: Optional[str] = None, until: Optional[str] = None, **fields: Optional[str]
+) -> Dict[str, str]:
+    """
+    Normalized metadata filters: ISO since/until dates, canonical bank name, other
+    fields as given. Unset filters are dropped.
+
+    Raises:
+        ValueError: A date is not formatted as YYYY-MM-DD.
+    """
+    filters: Dict[str, str] = {}
+    for name, value in (("since", since), ("until", until)):
+        if value:
+            filters[name] = str(np.datetime64(value.strip(), "D"))
+    for name, value in fields.items():
+        if value and value.strip():
+            filters[name] = resolve_bank(value) if name == "bank" else value.strip()
+    return filters
+
+
+def _bedrock_filter(filters: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    Bedrock `RetrievalFilter` for `_retrieval_filters` output. Sidecars store the date
+    as a YYYYMMDD number (range filters only apply to numbers), the bank verbatim and
+    the other fields lower-cased.
+    """
+    conditions = []
+    for name, operator in (("since", "greaterThanOrEquals"), ("until", "lessThanOrEquals")):
+        if name in filters:
+            value = int(filters[name].replace("-", ""))
+            conditions.append({operator: {"key": "date", "value": value}})
+    for name, value in filters.items():
+        if name in ("since", "until"):
+            continue
+        if name == "bank":
+            conditions.append({"equals": {"key": "bank", "value": value}})
+        else:
+            conditions.append({"stringContains": {"key": name, "value": value.lower()}})
+
+    if not conditions:
+        return None
+    return conditions[0] if len(conditions) == 1 else {"andAll": conditions}
+
+
 def _retrieve_from_bedrock_kb(
     kb_id_env: str,
     kb_label: str,
     query: str,
     max_results: int,
+    filters: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
     
     """Shared retrieval helper for all KB tools."""
@@ -53,18 +358,64 @@ def _retrieve_from_bedrock_kb(
         }
 
     max_results = max(1, min(max_results, 10))
-    client = _get_bedrock_runtime()
-
-    try:
-        response = client.retrieve(
-            knowledgeBaseId=kb_id,
-            retrievalQuery={"text": query},
-            retrievalConfiguration={
-                "vectorSearchConfiguration": {
-                    "numberOfResults": max_results,
-                }
-            },
-        )
+    cache_key = (
+        kb_label,
+        kb_id,
+        _normalize_query(query),
+        max_results,
+        ",".join(f"{k}={v.lower()}" for k, v in sorted((filters or {}).items())),
+    )
+    cached = _retrieval_cache.get(cache_key)
+    if cached is not None:
+        return {"knowledge_base": kb_label, "results": cached, "cached": True}
+
+    breaker = _breakers[kb_label]
+
+    def retrieve(span: Any) -> Dict[str, Any]:
+        if not breaker.allow():
+            _count(kb_label, "short_circuited")
+            return _degraded(kb_label, cache_key, f"{kb_label} is failing; retrieval skipped.")
+
+        client = _get_bedrock_runtime()
+        search_config: Dict[str, Any] = {"numberOfResults": max_results}
+        retrieval_filter = _bedrock_filter(filters or {})
+        if retrieval_filter:
+            search_config["filter"] = retrieval_filter
+
+        def attempt() -> Dict[str, Any]:
+            started, outcome = time.perf_counter(), "error"
+            try:
+                response = client.retrieve(
+                    knowledgeBaseId=kb_id,
+                    retrievalQuery={"text": query},
+                    retrievalConfiguration={"vectorSearchConfiguration": search_config},
+                )
+                outcome = "ok"
+                return response
+            finally:
+                _latency[kb_label][outcome].observe(time.perf_counter() - started)
+
+        _count(kb_label, "requests")
+        try:
+            response, hedged = hedged_call(
+                attempt, _hedge_delay(kb_label), _retrieve_pool, _hedges[kb_label]
+            )
+        except Exception as exc:
+            _count(kb_label, "failures")
+            if not _is_transient(exc):
+                # The KB answered, just not with results - it is healthy
+                breaker.record_success()
+                return {"knowledge_base": kb_label, "error": str(exc)}
+            breaker.record_failure()
+            if _stale_results.get(cache_key) is not None:
+                reason = f"Retrieval failed ({exc}); serving stale results."
+                return _degraded(kb_label, cache_key, reason)
+            return {"knowledge_base": kb_label, "error": str(exc)}
+
+        breaker.record_success()
+        span.set_attribute("econflux.hedged", hedged)
+        if hedged:
+            _count(kb_label, "hedged")
 
         results: List[Dict[str, Any]] = []
         for item in response.get("retrievalResults", []):
@@ -80,16 +431,121 @@ def _retrieve_from_bedrock_kb(
                 }
             )
 
+        _retrieval_cache.set(cache_key, results, _rag_cache_config.ttl)
+        _note_cached()
+        _stale_results.set(cache_key, results, _rag_resilience_config.stale_ttl)
         return {"knowledge_base": kb_label, "results": results}
-    except Exception as exc:  # pragma: no cover - defensive error guard
+
+    # Identical concurrent misses share one Bedrock call (and its result or error)
+    def fetch() -> Dict[str, Any]:
+        with start_span(
+            "bedrock.retrieve",
+            kind=CLIENT,
+            **{
+                "rpc.service": "bedrock-agent-runtime",
+                "rpc.method": "Retrieve",
+                "econflux.kb": kb_label,
+            },
+        ) as span:
+            response = retrieve(span)
+            if "error" in response:
+                span.record_error(response["error"])
+            span.set_attribute("econflux.degraded", bool(response.get("degraded")))
+            return response
+
+    return _inflight.do(cache_key, fetch)
+
+
+def _retrieve_from_local_index(
+    kb_label: str,
+    index_path: str,
+    query: str,
+    max_results: int,
+    filters: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """Same contract as `_retrieve_from_bedrock_kb`, served from a local BM25 index."""
+    try:
+        index = get_index(index_path)
+    except (OSError, ValueError) as exc:
         return {
             "knowledge_base": kb_label,
-            "error": str(exc),
+            "error": f"Local index for {kb_label} unavailable ({exc}). Build it with local_kb.py.",
         }
+    max_results = max(1, min(max_results, 10))
+    return {"knowledge_base": kb_label, "results": index.search(query, max_results, filters)}
+
+
+def _retrieve_from_kb(
+    name: str,
+    query: str,
+    max_results: int,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    **fields: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Route a retrieval to the backend configured for KB `name`. Metadata `fields`
+    the KB's documents do not carry are ignored.
+    """
+    spec = KNOWLEDGE_BASES[name]
+    try:
+        filters = _retrieval_filters(
+            since, until, **{k: v for k, v in fields.items() if k in spec["filters"]}
+        )
+    except ValueError:
+        return {"knowledge_base": spec["kb_label"], "error": "Dates must be formatted as YYYY-MM-DD."}
+
+    backend = _backend_configs[name]
+    with start_span(
+        "kb.retrieve",
+        **{
+            "econflux.kb": spec["kb_label"],
+            "econflux.kb.backend": backend.backend,
+            "econflux.kb.max_results": max_results,
+            "econflux.kb.filters": lambda: ",".join(f"{k}={v}" for k, v in sorted(filters.items())),
+        },
+    ) as span:
+        if backend.backend == "local":
+            response = _retrieve_from_local_index(
+                spec["kb_label"], backend.index_path, query, max_results, filters
+            )
+        else:
+            response = _retrieve_from_bedrock_kb(
+                kb_id_env=spec["kb_id_env"],
+                kb_label=spec["kb_label"],
+                query=query,
+                max_results=max_results,
+                filters=filters,
+            )
+        if "error" in response:
+            span.record_error(response["error"])
+        span.set_attributes(
+            **{
+                "econflux.kb.results": lambda: len(response.get("results", [])),
+                "econflux.kb.cached": bool(response.get("cached")),
+            }
+        )
+        return response
+
+
+def _compress(query: str, response: Dict[str, Any], score_key: str = "score") -> Dict[str, Any]:
+    """Fit a successful response's passages to the per-call context token budget."""
+    if "results" not in response or _rag_context_config.token_budget <= 0:
+        return response
+    results, stats = compress_results(
+        query, response["results"], _rag_context_config.token_budget, score_key
+    )
+    return {**response, "results": results, "compression": stats}
 
 
 @tool
-def query_monetary_policy_kb(query: str, max_results: int = 5) -> Dict[str, Any]:
+def query_monetary_policy_kb(
+    query: str,
+    max_results: int = 5,
+    bank: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Retrieve grounded passages about monetary policy summaries (rate decisions, stance, rationale).
 
@@ -99,23 +555,34 @@ def query_monetary_policy_kb(query: str, max_results: int = 5) -> Dict[str, Any]
     Args:
         query: User question that should be answered with monetary policy context.
         max_results: Maximum passages to return (1-10, default 5).
+        bank: Only passages about this central bank (full name or Fed, ECB, BoJ, BoE, SNB, RBA).
+        since: Only meetings on or after this date, YYYY-MM-DD.
+        until: Only meetings on or before this date, YYYY-MM-DD.
 
     Returns:
         Dict with:
         - knowledge_base: Friendly KB label
-        - results: List of passages with score and source metadata, or empty list
-        - error: Present if the KB ID is missing or Bedrock retrieval fails
-    """
-    return _retrieve_from_bedrock_kb(
-        kb_id_env="KB_MONETARY_POLICY_ID",
-        kb_label="kb_monetary_policy_summaries",
-        query=query,
-        max_results=max_results,
-    )
+        - results: List of passages with score and source metadata, or empty list;
+          `excerpt` is true when only the passage's query-relevant sentences are kept
+        - cached: True when served from the retrieval cache
+        - degraded: True when the KB is failing and its last good (possibly stale) or no
+          results are returned instead, with the reason under `warning`
+        - compression: Token counts before/after fitting the context budget, tokens_saved,
+          passages kept and near-duplicates collapsed
+        - error: Present if the KB ID or local index is missing, a date is malformed or retrieval fails
+    """
+    response = _retrieve_from_kb("monetary_policy", query, max_results, since, until, bank=bank)
+    return _compress(query, response)
 
 
 @tool
-def query_economic_indicators_kb(query: str, max_results: int = 5) -> Dict[str, Any]:
+def query_economic_indicators_kb(
+    query: str,
+    max_results: int = 5,
+    indicator: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Retrieve grounded passages about economic indicators (GDP, CPI, unemployment, PMIs).
 
@@ -124,23 +591,37 @@ def query_economic_indicators_kb(query: str, max_results: int = 5) -> Dict[str,
     Args:
         query: User question requiring indicator context.
         max_results: Maximum passages to return (1-10, default 5).
+        indicator: Only releases whose indicator name contains this text (e.g. "CPI", "PMI").
+        since: Only releases on or after this date, YYYY-MM-DD.
+        until: Only releases on or before this date, YYYY-MM-DD.
 
     Returns:
         Dict with:
         - knowledge_base: Friendly KB label
-        - results: List of passages with score and source metadata, or empty list
-        - error: Present if the KB ID is missing or Bedrock retrieval fails
-    """
-    return _retrieve_from_bedrock_kb(
-        kb_id_env="KB_ECONOMIC_INDICATORS_ID",
-        kb_label="kb_economic_indicators",
-        query=query,
-        max_results=max_results,
+        - results: List of passages with score and source metadata, or empty list;
+          `excerpt` is true when only the passage's query-relevant sentences are kept
+        - cached: True when served from the retrieval cache
+        - degraded: True when the KB is failing and its last good (possibly stale) or no
+          results are returned instead, with the reason under `warning`
+        - compression: Token counts before/after fitting the context budget, tokens_saved,
+          passages kept and near-duplicates collapsed
+        - error: Present if the KB ID or local index is missing, a date is malformed or retrieval fails
+    """
+    response = _retrieve_from_kb(
+        "economic_indicators", query, max_results, since, until, indicator=indicator
     )
+    return _compress(query, response)
 
 
 @tool
-def query_regulatory_changes_kb(query: str, max_results: int = 5) -> Dict[str, Any]:
+def query_regulatory_changes_kb(
+    query: str,
+    max_results: int = 5,
+    sector: Optional[str] = None,
+    topic: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Retrieve grounded passages about regulatory changes and compliance timelines.
 
@@ -149,23 +630,37 @@ def query_regulatory_changes_kb(query: str, max_results: int = 5) -> Dict[str, A
     Args:
         query: User question about regulations or compliance changes.
         max_results: Maximum passages to return (1-10, default 5).
+        sector: Only rules for sectors containing this text (e.g. "banking", "fintech").
+        topic: Only rules on topics containing this text (e.g. "liquidity", "stress testing").
+        since: Only announcements on or after this date, YYYY-MM-DD.
+        until: Only announcements on or before this date, YYYY-MM-DD.
 
     Returns:
         Dict with:
         - knowledge_base: Friendly KB label
-        - results: List of passages with score and source metadata, or empty list
-        - error: Present if the KB ID is missing or Bedrock retrieval fails
-    """
-    return _retrieve_from_bedrock_kb(
-        kb_id_env="KB_REGULATORY_CHANGES_ID",
-        kb_label="kb-regulatory-changes",
-        query=query,
-        max_results=max_results,
+        - results: List of passages with score and source metadata, or empty list;
+          `excerpt` is true when only the passage's query-relevant sentences are kept
+        - cached: True when served from the retrieval cache
+        - degraded: True when the KB is failing and its last good (possibly stale) or no
+          results are returned instead, with the reason under `warning`
+        - compression: Token counts before/after fitting the context budget, tokens_saved,
+          passages kept and near-duplicates collapsed
+        - error: Present if the KB ID or local index is missing, a date is malformed or retrieval fails
+    """
+    response = _retrieve_from_kb(
+        "regulatory_changes", query, max_results, since, until, sector=sector, topic=topic
     )
+    return _compress(query, response)
 
 
 @tool
-def query_policy_decisions_kb(query: str, max_results: int = 5) -> Dict[str, Any]:
+def query_policy_decisions_kb(
+    query: str,
+    max_results: int = 5,
+    bank: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Retrieve grounded passages about policy decisions (vote splits, guidance, inflation context).
 
@@ -174,16 +669,262 @@ def query_policy_decisions_kb(query: str, max_results: int = 5) -> Dict[str, Any
     Args:
         query: User question needing policy decision context.
         max_results: Maximum passages to return (1-10, default 5).
+        bank: Only decisions by this central bank (full name or Fed, ECB, BoJ, BoE, SNB, RBA).
+        since: Only decisions on or after this date, YYYY-MM-DD.
+        until: Only decisions on or before this date, YYYY-MM-DD.
 
     Returns:
         Dict with:
         - knowledge_base: Friendly KB label
-        - results: List of passages with score and source metadata, or empty list
-        - error: Present if the KB ID is missing or Bedrock retrieval fails
-    """
-    return _retrieve_from_bedrock_kb(
-        kb_id_env="KB_POLICY_DECISIONS_ID",
-        kb_label="kb_policy_decisions",
-        query=query,
-        max_results=max_results,
-    )
+        - results: List of passages with score and source metadata, or empty list;
+          `excerpt` is true when only the passage's query-relevant sentences are kept
+        - cached: True when served from the retrieval cache
+        - degraded: True when the KB is failing and its last good (possibly stale) or no
+          results are returned instead, with the reason under `warning`
+        - compression: Token counts before/after fitting the context budget, tokens_saved,
+          passages kept and near-duplicates collapsed
+        - error: Present if the KB ID or local index is missing, a date is malformed or retrieval fails
+    """
+    response = _retrieve_from_kb("policy_decisions", query, max_results, since, until, bank=bank)
+    return _compress(query, response)
+
+
+def _merge_results(responses: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+    """
+    Merge per-KB results into one list ranked by normalized score.
+
+    Scores are divided by each KB's best score so KBs with different score
+    distributions compete fairly. A passage whose normalized text equals an
+    already-kept, higher-ranked passage is dropped and its KB recorded under
+    `also_in`; the corpora share templates, so near-matches are distinct records.
+    """
+    candidates = []
+    for response in responses:
+        results = response.get("results") or []
+        top = max((r.get("score") or 0.0 for r in results), default=0.0)
+        for result in results:
+            score = result.get("score") or 0.0
+            candidates.append(
+                {
+                    **result,
+                    "knowledge_base": response["knowledge_base"],
+                    "normalized_score": round(score / top, 4) if top else 0.0,
+                }
+            )
+    candidates.sort(key=lambda r: (r["normalized_score"], r.get("score") or 0.0), reverse=True)
+
+    merged: List[Dict[str, Any]] = []
+    kept_texts: Dict[str, Dict[str, Any]] = {}
+    for candidate in candidates:
+        text = " ".join(candidate.get("text", "").lower().split())
+        duplicate_of = kept_texts.get(text)
+        if duplicate_of is not None:
+            if candidate["knowledge_base"] != duplicate_of["knowledge_base"]:
+                also_in = duplicate_of.setdefault("also_in", [])
+                if candidate["knowledge_base"] not in also_in:
+                    also_in.append(candidate["knowledge_base"])
+            continue
+        merged.append(candidate)
+        kept_texts[text] = candidate
+        if len(merged) == limit:
+            break
+    return merged
+
+
+@tool
+def query_all_kbs(
+    query: str,
+    kbs: Optional[List[str]] = None,
+    max_results: int = 8,
+    bank: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Search several knowledge bases at once and return one merged, de-duplicated ranking.
+
+    Use for cross-domain questions (e.g. how a rate decision relates to indicator
+    releases or new regulation) instead of calling each KB tool in turn; the KBs are
+    queried in parallel, so latency is that of the slowest KB.
+
+    Args:
+        query: User question to retrieve context for.
+        kbs: Subset of: monetary_policy, economic_indicators, regulatory_changes,
+            policy_decisions. Defaults to all four.
+        max_results: Maximum passages in the merged list (1-10 per KB retrieved, default 8).
+        bank: Only passages about this central bank, in the KBs that are per-bank
+            (monetary_policy, policy_decisions); other KBs are not bank-filtered.
+        since: Only documents dated on or after this date, YYYY-MM-DD.
+        until: Only documents dated on or before this date, YYYY-MM-DD.
+
+    Returns:
+        Dict with:
+        - knowledge_bases: Labels of the KBs that were queried
+        - results: Passages ranked by normalized score, each with text, score,
+          normalized_score (score relative to the best hit of its KB), knowledge_base,
+          source, and also_in (other KBs that returned the same passage) when present;
+          `excerpt` is true when only the passage's query-relevant sentences are kept
+        - compression: Token counts before/after fitting the context budget, tokens_saved,
+          passages kept and near-duplicates collapsed
+        - errors: Mapping of KB label to error message for KBs that failed or did not
+          answer within RAG_FANOUT_TIMEOUT (if any)
+        - degraded: Labels of failing KBs that answered from stale or no results (if any)
+        - error: Present instead of results if `kbs` names an unknown knowledge base
+    """
+    names = list(dict.fromkeys(kbs)) if kbs else list(KNOWLEDGE_BASES)
+    unknown = [name for name in names if name not in KNOWLEDGE_BASES]
+    if unknown:
+        return {
+            "error": f"Unknown knowledge bases: {', '.join(unknown)}. "
+            f"Use any of: {', '.join(KNOWLEDGE_BASES)}."
+        }
+
+    limit = max(1, max_results)
+    # bind() keeps each lookup's spans under this tool call's span
+    futures = [
+        _kb_pool.submit(
+            bind(_retrieve_from_kb), name, query, min(limit, 10), since, until, bank=bank
+        )
+        for name in names
+    ]
+    timeout = _rag_resilience_config.fanout_timeout
+    done, _ = wait(futures, timeout=timeout)
+    responses = []
+    for name, future in zip(names, futures):
+        if future in done:
+            responses.append(future.result())
+        else:
+            future.cancel()
+            responses.append(
+                {
+                    "knowledge_base": KNOWLEDGE_BASES[name]["kb_label"],
+                    "error": f"Timed out after {timeout:g}s.",
+                }
+            )
+
+    errors = {r["knowledge_base"]: r["error"] for r in responses if "error" in r}
+    degraded = [r["knowledge_base"] for r in responses if r.get("degraded")]
+    payload: Dict[str, Any] = {
+        "knowledge_bases": [r["knowledge_base"] for r in responses],
+        "results": _merge_results([r for r in responses if "error" not in r], limit),
+    }
+    if errors:
+        payload["errors"] = errors
+    if degraded:
+        payload["degraded"] = degraded
+    return _compress(query, payload, score_key="normalized_score")
+
+
+# Policy corpora and the fact columns reported from them
+POLICY_FACT_SOURCES = {
+    "monetary_policy": ["action", "direction", "previous_rate", "new_rate"],
+    "policy_decisions": [
+        "action",
+        "direction",
+        "vote",
+        "current_inflation",
+        "core_inflation",
+        "inflation_target",
+        "next_meeting",
+    ],
+}
+POLICY_FACT_COLUMNS = [
+    "date",
+    "knowledge_base",
+    "record",
+    "action",
+    "direction",
+    "previous_rate",
+    "new_rate",
+    "vote",
+    "current_inflation",
+    "core_inflation",
+    "inflation_target",
+    "next_meeting",
+]
+MAX_POLICY_FACTS = 100
+
+
+@tool
+def lookup_policy_facts(
+    bank: str,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: int = 10,
+) -> Dict[str, Any]:
+    """
+    Look up central bank rate decisions as structured facts (no vector search).
+
+    Use for structured questions - "last three ECB decisions", "Fed moves since
+    2024-06-01", "how did the BoE vote in 2024" - where the answer is the dates,
+    actions, rates and votes themselves. Use the knowledge-base tools instead for
+    narrative questions (rationale, outlook, market reaction); `record` identifies
+    the matching report if that narrative is needed.
+
+    Args:
+        bank: Central bank name or short form (Fed, ECB, BoJ, BoE, SNB, RBA), or "all".
+        since: Earliest decision date, YYYY-MM-DD (optional).
+        until: Latest decision date, YYYY-MM-DD (optional).
+        limit: Maximum decisions to return, most recent first (default 10, max 100).
+
+    Returns:
+        Dict with:
+        - bank: Resolved central bank name (or "all")
+        - count: Number of matching decisions before truncation
+        - decisions: Columnar payload, most recent first, with one list per field:
+          date, knowledge_base, record, action, direction, previous_rate, new_rate,
+          vote, current_inflation, core_inflation, inflation_target, next_meeting
+          (null where the source report does not carry the field)
+        - truncated: True when more than `limit` decisions matched
+        - error: Present for an unknown bank, a bad date or missing fact tables
+    """
+    try:
+        start = np.datetime64(since, "D") if since else None
+        end = np.datetime64(until, "D") if until else None
+    except ValueError:
+        return {"bank": bank, "error": "Dates must be formatted as YYYY-MM-DD."}
+
+    try:
+        tables = {
+            name: get_fact_table(_rag_fact_config.index_dir, KNOWLEDGE_BASES[name]["corpus"])
+            for name in POLICY_FACT_SOURCES
+        }
+    except OSError as exc:
+        return {
+            "bank": bank,
+            "error": f"Fact tables unavailable ({exc}). Build them with fact_index.py.",
+        }
+
+    query = bank.strip()
+    if query.lower() == "all":
+        resolved = None
+    else:
+        known = {b.lower(): b for table in tables.values() for b in table.key_values}
+        resolved = BANK_ALIASES.get(query.lower()) or known.get(query.lower())
+        if resolved is None:
+            return {
+                "bank": bank,
+                "error": f"Unknown bank '{bank}'. Use one of: {', '.join(sorted(known.values()))}.",
+            }
+
+    matches = []
+    for name, table in tables.items():
+        dates = table.columns["date"]
+        for position in table.lookup(resolved, start, end):
+            matches.append((dates[position], name, int(position)))
+    matches.sort(key=lambda m: m[0], reverse=True)
+
+    limit = max(1, min(limit, MAX_POLICY_FACTS))
+    decisions: Dict[str, List[Any]] = {column: [] for column in POLICY_FACT_COLUMNS}
+    for _, name, position in matches[:limit]:
+        row = tables[name].row(position, ["date", "record", *POLICY_FACT_SOURCES[name]])
+        row["knowledge_base"] = KNOWLEDGE_BASES[name]["kb_label"]
+        for column in POLICY_FACT_COLUMNS:
+            decisions[column].append(row.get(column))
+
+    return {
+        "bank": resolved or "all",
+        "count": len(matches),
+        "decisions": decisions,
+        "truncated": len(matches) > limit,
+    }
@@ -0,0 +1,178 @@
+"""
+Resilience primitives for slow or failing upstream calls.
+
+- `LatencyHistogram`: fixed-bucket latency histogram with interpolated
+  quantiles, cheap enough to update on every call.
+- `CircuitBreaker`: closed -> open after consecutive failures; after a cool-down
+  one trial call is let through (half-open) and its outcome closes or re-opens it.
+- `hedged_call`: runs a call and, if it has not finished after a delay (typically
+  the observed p95), races an identical second call; the first success wins.
+- `HedgeBudget`: per-upstream cap on hedges in flight, with its own threads so
+  hedges never queue ahead of (or behind) primary calls.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Upper bounds (ms) of the latency buckets; the last bucket is unbounded
+LATENCY_BUCKETS_MS = (
+    5, 10, 25, 50, 75, 100, 150, 200, 300, 400, 500, 750,
+    1000, 1500, 2000, 3000, 5000, 7500, 10000, 20000,
+)
+
+
+class LatencyHistogram:
+    """Thread-safe latency histogram over `LATENCY_BUCKETS_MS`."""
+
+    def __init__(self, bounds_ms: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.bounds_ms = bounds_ms
+        self._counts = [0] * (len(bounds_ms) + 1)
+        self._sum_ms = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    def observe(self, seconds: float) -> None:
+        ms = seconds * 1000.0
+        with self._lock:
+            self._counts[bisect.bisect_left(self.bounds_ms, ms)] += 1
+            self._sum_ms += ms
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Latency (seconds) at quantile `q`, interpolated within its bucket; None if empty."""
+        with self._lock:
+            counts = list(self._counts)
+        total = sum(counts)
+        if not total:
+            return None
+        rank = q * total
+        cumulative = 0
+        for i, count in enumerate(counts):
+            if count and cumulative + count >= rank:
+                lower = self.bounds_ms[i - 1] if i > 0 else 0.0
+                upper = self.bounds_ms[i] if i < len(self.bounds_ms) else self.bounds_ms[-1] * 2
+                return (lower + (upper - lower) * (rank - cumulative) / count) / 1000.0
+            cumulative += count
+        return self.bounds_ms[-1] / 1000.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Cumulative bucket counts (Prometheus-style `le` bounds), count, sum and p50/p95/p99."""
+        with self._lock:
+            counts, sum_ms = list(self._counts), self._sum_ms
+        cumulative, buckets = 0, {}
+        for bound, count in zip([*self.bounds_ms, "+Inf"], counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        quantiles = {
+            f"p{int(q * 100)}_ms": round(v * 1000.0, 1) if v is not None else None
+            for q, v in ((q, self.quantile(q)) for q in (0.5, 0.95, 0.99))
+        }
+        return {"count": cumulative, "sum_ms": round(sum_ms, 1), **quantiles, "buckets_ms": buckets}
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open trial call."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._clock() - self._opened_at >= self.reset_timeout:
+                return "half_open"
+            return "open"
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now (claims the trial slot when half-open)."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._clock() - self._opened_at < self.reset_timeout or self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._trial_in_flight = False
+
+
+class HedgeBudget:
+    """At most `limit` hedges in flight, run on a pool of their own; over budget, none."""
+
+    def __init__(self, limit: int, thread_name_prefix: str = "hedge"):
+        self.limit = limit
+        self._slots = threading.BoundedSemaphore(max(1, limit))
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, limit), thread_name_prefix=thread_name_prefix
+        )
+
+    def submit(self, fn: Callable[[], Any]) -> Optional[Future]:
+        """Start `fn` as a hedge, or return None when the budget is spent."""
+        if self.limit <= 0 or not self._slots.acquire(blocking=False):
+            return None
+        future = self._pool.submit(fn)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+
+def hedged_call(
+    fn: Callable[[], Any], delay: Optional[float], pool: Executor, hedges: HedgeBudget
+) -> Tuple[Any, bool]:
+    """
+    Run `fn` on `pool`; if it is still running after `delay` seconds and `hedges` has
+    room, start a second identical call there and return whichever succeeds first.
+    Returns (result, hedged). Without a delay `fn` runs on the caller's thread. The
+    slower call is left to finish in the background. A failure before the hedge
+    fires is raised as-is; after it fires, only if both calls fail.
+    """
+    if delay is None:
+        return fn(), False
+
+    primary = pool.submit(fn)
+    done, _ = wait([primary], timeout=delay)
+    if done:
+        return primary.result(), False
+    hedge = hedges.submit(fn)
+    if hedge is None:
+        return primary.result(), False
+
+    pending = {primary, hedge}
+    errors: List[BaseException] = []
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result(), True
+            errors.append(future.exception())
+    raise errors[0]
@@ -0,0 +1,134 @@
+"""
+Single-flight coalescing of identical concurrent upstream calls.
+
+When many sessions ask for the same KB query or ticker at the same moment, the
+first caller for a key (the leader) runs the upstream call and every caller
+arriving while it is in flight waits for and shares that result instead of
+issuing its own request; exceptions are shared the same way. Nothing is kept
+once the call completes - pair it with `cache.TTLCache` for reuse over time.
+
+Keys are tuples whose first element is a namespace (as in `TTLCache`), and
+counters of calls, upstream executions and collapsed calls are kept per
+namespace.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+Key = Tuple[Hashable, ...]
+
+
+class _Call:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one execution."""
+
+    def __init__(self):
+        self._calls: Dict[Key, _Call] = {}
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Counter] = {}
+
+    def _count(self, key: Key, event: str) -> None:
+        counter = self._counters.setdefault(str(key[0]), Counter())
+        counter["calls"] += 1
+        counter[event] += 1
+
+    def _claim(self, keys: Sequence[Key]) -> Tuple[Dict[Key, _Call], Dict[Key, _Call]]:
+        """Split `keys` into calls this caller leads and calls already in flight."""
+        led, joined = {}, {}
+        with self._lock:
+            for key in keys:
+                call = self._calls.get(key)
+                if call is None:
+                    call = self._calls[key] = _Call()
+                    led[key] = call
+                    self._count(key, "executions")
+                else:
+                    joined[key] = call
+                    self._count(key, "collapsed")
+        return led, joined
+
+    def _release(self, led: Dict[Key, _Call]) -> None:
+        with self._lock:
+            for key in led:
+                del self._calls[key]
+        for call in led.values():
+            call.done.set()
+
+    @staticmethod
+    def _wait(call: _Call) -> Any:
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.value
+
+    def do(self, key: Key, fn: Callable[[], Any]) -> Any:
+        """Return `fn()`, sharing one execution with concurrent callers of `key`."""
+        led, joined = self._claim([key])
+        if joined:
+            return self._wait(joined[key])
+
+        call = led[key]
+        try:
+            call.value = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            self._release(led)
+        return call.value
+
+    def do_many(
+        self, keys: Sequence[Key], fn: Callable[[List[Key]], Dict[Key, Any]]
+    ) -> Dict[Key, Any]:
+        """
+        Batch form of `do`: `fn` is called once with the keys not already in flight
+        and returns a value per key (missing keys map to None); keys in flight
+        elsewhere are awaited. Returns a value for every key.
+        """
+        led, joined = self._claim(list(dict.fromkeys(keys)))
+        results: Dict[Key, Any] = {}
+        if led:
+            try:
+                fetched = fn(list(led))
+                for key, call in led.items():
+                    call.value = results[key] = fetched.get(key)
+            except BaseException as exc:
+                for call in led.values():
+                    call.error = exc
+                raise
+            finally:
+                self._release(led)
+
+        for key, call in joined.items():
+            results[key] = self._wait(call)
+        return results
+
+    def stats(self, namespace: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Counters (calls, executions, collapsed, collapse_rate) per namespace, plus
+        the number of keys currently in flight.
+        """
+        with self._lock:
+            namespaces = {}
+            for name, counter in self._counters.items():
+                if namespace is not None and name != namespace:
+                    continue
+                calls = counter["calls"]
+                namespaces[name] = {
+                    "calls": calls,
+                    "executions": counter["executions"],
+                    "collapsed": counter["collapsed"],
+                    "collapse_rate": round(counter["collapsed"] / calls, 4) if calls else 0.0,
+                }
+            return {"in_flight": len(self._calls), "namespaces": namespaces}
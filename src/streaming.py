@@ -0,0 +1,119 @@
+"""
+Incremental agent output for the streaming `invoke` mode.
+
+`stream_agent` runs one agent invocation on a background thread and yields small
+JSON-ready events as they happen, which `BedrockAgentCoreApp` sends as
+server-sent events:
+
+- {"type": "token", "text": ...}: a model text delta
+- {"type": "tool_call", "tool": ..., "id": ..., "input": ...}: the model requested a tool
+- {"type": "tool_result", "tool": ..., "id": ..., "status": ...}: the tool finished
+- {"type": "done", "result": ..., "stop_reason": ..., "ttft_ms": ..., "duration_ms": ...}
+- {"type": "error", "error": ...}
+
+`ttft_ms` is the time from the start of the request to the first token.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from contextlib import AbstractContextManager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_END = object()
+
+
+def _translate(event: Dict[str, Any], tool_names: Dict[str, str]) -> Iterator[Dict[str, Any]]:
+    """Client events for one Strands stream event (most produce none)."""
+    if event.get("data"):
+        yield {"type": "token", "text": event["data"]}
+        return
+
+    message = event.get("message")
+    if not isinstance(message, dict):
+        return
+    for block in message.get("content", []):
+        if "toolUse" in block:
+            tool_use = block["toolUse"]
+            tool_names[tool_use["toolUseId"]] = tool_use["name"]
+            yield {
+                "type": "tool_call",
+                "tool": tool_use["name"],
+                "id": tool_use["toolUseId"],
+                "input": tool_use.get("input"),
+            }
+        elif "toolResult" in block:
+            tool_result = block["toolResult"]
+            yield {
+                "type": "tool_result",
+                "tool": tool_names.get(tool_result["toolUseId"]),
+                "id": tool_result["toolUseId"],
+                "status": tool_result.get("status"),
+            }
+
+
+def stream_agent(
+    lease: Callable[[], AbstractContextManager],
+    prompt: str,
+    on_first_token: Optional[Callable[[float], None]] = None,
+    invocation_state: Optional[Dict[str, Any]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield events of `prompt` run on the agent obtained from `lease()` (a context
+    manager, held for the whole invocation). `on_first_token` receives the
+    time-to-first-token in seconds; `invocation_state` is passed to the agent's
+    hooks and tools. Closing the iterator early (client disconnect) cancels the
+    invocation.
+    """
+    started = time.perf_counter()
+    events: "queue.Queue[Any]" = queue.Queue()
+    cancel = threading.Event()
+
+    async def pump(agent: Any) -> None:
+        tool_names: Dict[str, str] = {}
+        async for event in agent.stream_async(
+            prompt, cancel_signal=cancel, invocation_state=dict(invocation_state or {})
+        ):
+            for item in _translate(event, tool_names):
+                events.put(item)
+            if "result" in event:
+                result = event["result"]
+                events.put(
+                    {"type": "done", "result": str(result), "stop_reason": result.stop_reason}
+                )
+
+    def run() -> None:
+        try:
+            with lease() as agent:
+                asyncio.run(pump(agent))
+        except Exception as exc:
+            logger.exception("Streaming invocation failed")
+            events.put({"type": "error", "error": str(exc)})
+        finally:
+            events.put(_END)
+
+    threading.Thread(target=run, name="agent-stream", daemon=True).start()
+
+    ttft_ms = None
+    try:
+        while True:
+            item = events.get()
+            if item is _END:
+                return
+            if item["type"] == "token" and ttft_ms is None:
+                ttft = time.perf_counter() - started
+                ttft_ms = round(ttft * 1000.0, 1)
+                if on_first_token is not None:
+                    on_first_token(ttft)
+            if item["type"] == "done":
+                item["ttft_ms"] = ttft_ms
+                item["duration_ms"] = round((time.perf_counter() - started) * 1000.0, 1)
+            yield item
+    finally:
+        cancel.set()
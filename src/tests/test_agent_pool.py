@@ -0,0 +1,76 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent_pool import AgentPool, AgentPoolBusy  # noqa: E402
+
+
+def _hold(pool, session_id, release):
+    def run():
+        with pool.lease(session_id):
+            release.wait()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_requests_queued_on_their_session_hold_no_slot():
+    pool = AgentPool(object, max_concurrency=2, queue_timeout=1.0)
+    release = threading.Event()
+    first = _hold(pool, "a", release)
+    time.sleep(0.05)
+    second = _hold(pool, "a", release)  # waits for session "a"
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    with pool.lease("b"):
+        assert time.monotonic() - started < 0.5
+    release.set()
+    first.join()
+    second.join()
+    assert pool.stats()["rejected"] == 0
+
+
+def test_session_wait_times_out():
+    pool = AgentPool(object, max_concurrency=2, queue_timeout=0.1)
+    release = threading.Event()
+    holder = _hold(pool, "a", release)
+    time.sleep(0.05)
+    with pytest.raises(AgentPoolBusy, match="Session a busy"):
+        with pool.lease("a"):
+            pass
+    release.set()
+    holder.join()
+    assert pool.stats()["rejected"] == 1
+
+
+def test_factory_runs_outside_the_pool_lock():
+    building = threading.Event()
+    finish = threading.Event()
+
+    def factory():
+        if not building.is_set():
+            building.set()
+            finish.wait(5)
+        return object()
+
+    pool = AgentPool(factory, max_concurrency=4)
+    release = threading.Event()
+    slow = _hold(pool, "slow", release)
+    building.wait()
+    served = []
+    fast = threading.Thread(target=lambda: served.append(pool.lease("fast").__enter__()))
+    fast.start()
+    fast.join(1.0)
+    # Another session is served while the first agent is still being built
+    assert served
+    finish.set()
+    release.set()
+    slow.join()
+    assert pool.stats()["created"] == 2
@@ -0,0 +1,59 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analytics_tools  # noqa: E402
+from analytics_tools import SCREEN_METRICS, preload_snapshots, screen_universe  # noqa: E402
+from market_tools import load_bars  # noqa: E402
+from universes import UNIVERSES  # noqa: E402
+
+
+def _reference(symbols, metric, period):
+    bars = load_bars(symbols, period=period)
+    close, open_, volume = bars.close, bars.open, bars.volume.astype(np.float64)
+    values = {
+        "return": close[:, -1] / close[:, 0] - 1.0,
+        "volume_surge": volume[:, -1] / volume[:, :-1].mean(axis=1) - 1.0,
+        "gap": open_[:, -1] / close[:, -2] - 1.0,
+    }[metric]
+    order = np.argsort(-values, kind="stable")
+    return [bars.tickers[i] for i in order], values
+
+
+@pytest.mark.parametrize("metric", SCREEN_METRICS)
+@pytest.mark.parametrize("period", ["5d", "1mo"])
+def test_screen_order_matches_argsort(metric, period):
+    top_k = 10
+    result = screen_universe("large_cap", metric, top_k=top_k, period=period)
+    ranked, values = _reference(UNIVERSES["large_cap"], metric, period)
+
+    assert result["size"] == len(UNIVERSES["large_cap"])
+    assert [t for t, _ in result["leaders"]] == ranked[:top_k]
+    assert [t for t, _ in result["laggards"]] == ranked[::-1][:top_k]
+    index = {t: i for i, t in enumerate(load_bars(UNIVERSES["large_cap"], period=period).tickers)}
+    for ticker, pct in result["leaders"] + result["laggards"]:
+        assert pct == pytest.approx(100 * values[index[ticker]], abs=0.005)
+
+
+def test_custom_basket_ranks_like_the_universe():
+    basket = UNIVERSES["semiconductors"]
+    custom = screen_universe(tickers=[t.lower() for t in basket], top_k=3)
+    named = screen_universe("semiconductors", top_k=3)
+    assert custom["leaders"] == named["leaders"]
+    assert custom["laggards"] == named["laggards"]
+
+
+def test_preloaded_total_market_is_screened_without_rebuilding(monkeypatch):
+    assert preload_snapshots(["total_market"], ["5d"]) == 1
+
+    def rebuild(*args, **kwargs):
+        raise AssertionError("snapshot rebuilt")
+
+    monkeypatch.setattr(analytics_tools, "_build_snapshot", rebuild)
+    result = screen_universe("total_market", "return", top_k=5)
+    assert result["size"] == 5000
+    assert len(result["leaders"]) == 5
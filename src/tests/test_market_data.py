@@ -0,0 +1,54 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from market_bars import build_bars  # noqa: E402
+from market_providers import BarStoreProvider, SyntheticProvider  # noqa: E402
+
+
+def test_synthetic_windows_share_one_path():
+    week = build_bars(["AAPL", "MSFT"], period="5d", interval="1d")
+    year = build_bars(["MSFT", "AAPL"], period="1y", interval="1d")
+    for name in ("open", "high", "low", "close", "volume"):
+        np.testing.assert_allclose(getattr(week, name), getattr(year, name)[::-1, -5:])
+    minutes = build_bars(["AAPL"], period="1d", interval="1m")
+    assert np.isclose(minutes.close[0, -1], week.close[0, -1])
+
+
+def test_synthetic_quote_is_last_close():
+    bars = build_bars(["NVDA"], period="5d", interval="1d")
+    quote = SyntheticProvider().quotes(["NVDA"])["NVDA"]
+    assert quote["currentPrice"] == round(float(bars.close[0, -1]), 2)
+    assert quote["previousClose"] == round(float(bars.close[0, -2]), 2)
+
+
+def test_bar_store_earnings_only_for_stored_symbols(tmp_path):
+    store = BarStoreProvider(str(tmp_path))
+    store.write(build_bars(["AAPL"], period="5d", interval="1d"), "1d")
+    assert set(store.earnings("AAPL")) == {"earnings", "calendar"}
+    with pytest.raises(ValueError, match="No stored data for ZZZZ"):
+        store.earnings("ZZZZ")
+
+
+def test_load_bars_aligns_bar_store_histories(tmp_path, monkeypatch):
+    import market_tools
+
+    store = BarStoreProvider(str(tmp_path))
+    full = build_bars(["OLD"], period="1y", interval="1d")
+    store.write(full, "1d")
+    recent = build_bars(["NEW"], period="3mo", interval="1d")  # listed later
+    store.write(recent, "1d")
+    monkeypatch.setattr(market_tools, "_provider", store)
+    monkeypatch.setattr(market_tools, "_market_cache", market_tools.TTLCache(maxsize=64))
+
+    bars = market_tools.load_bars(["OLD", "NEW"], period="1y")
+    np.testing.assert_array_equal(bars.timestamps, recent.timestamps)
+    np.testing.assert_allclose(bars.close[0], full.close[0, -len(recent.timestamps):])
+    np.testing.assert_allclose(bars.close[1], recent.close[0])
+    # Each symbol's own history stays complete for get_price_history
+    history = market_tools.get_price_history("OLD", period="1y", format="columnar")
+    assert len(history["history"]["c"]) == len(full.timestamps)
@@ -0,0 +1,104 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import market_tools  # noqa: E402
+
+SECTIONS = {"quote": ("summary",), "history": ("history",), "earnings": ("earnings", "calendar")}
+SOURCES = {"quote": "get_stock_price", "history": "get_price_history", "earnings": "get_earnings"}
+
+
+def _slow(*args, **kwargs):
+    time.sleep(0.5)
+
+
+def _raise(*args, **kwargs):
+    raise RuntimeError("upstream down")
+
+
+def _error(*args, **kwargs):
+    return {"ticker": "AAPL", "error": "No market data for AAPL."}
+
+
+@pytest.mark.parametrize("failure, message", [
+    (_slow, "Timed out after 0.1s"),
+    (_raise, "upstream down"),
+    (_error, "No market data for AAPL."),
+])
+@pytest.mark.parametrize("source", list(SOURCES))
+def test_stock_report_nulls_failed_source(monkeypatch, source, failure, message):
+    monkeypatch.setattr(market_tools._report_config, f"{source}_timeout", 0.1)
+    monkeypatch.setattr(market_tools, SOURCES[source], failure)
+
+    report = market_tools._build_stock_report("AAPL", "5d", "rows")
+
+    assert report["errors"] == {source: message}
+    for name, sections in SECTIONS.items():
+        for section in sections:
+            assert (report[section] is None) == (name == source), section
+
+
+def test_stock_report_bad_period_is_a_history_error():
+    report = market_tools._build_stock_report("AAPL", "7d", "rows")
+    assert report["history"] is None
+    assert report["errors"]["history"].startswith("Unsupported period '7d'")
+    assert report["summary"] is not None
+
+
+def _decode_rows(history):
+    """Rows-format history from a delta-encoded columnar one."""
+    steps = np.cumsum([0, *history["dt"]])
+    start = np.datetime64(history["t0"], history["unit"])
+    labels = np.datetime_as_string(start + steps.astype(f"timedelta64[{history['unit']}]"))
+    prices = {k: np.round(np.cumsum(history[k]), 2) for k in ("o", "h", "l", "c")}
+    volume = np.cumsum(history["v"])
+    return {
+        label: {
+            "open": prices["o"][i],
+            "high": prices["h"][i],
+            "low": prices["l"][i],
+            "close": prices["c"][i],
+            "volume": volume[i],
+        }
+        for i, label in enumerate(labels.tolist())
+    }
+
+
+@pytest.mark.parametrize("period, interval", [("1mo", "1d"), ("5d", "5m"), ("1y", "1wk")])
+def test_delta_columnar_decodes_to_rows(period, interval):
+    rows = market_tools.get_price_history("MSFT", period, interval)["history"]
+    encoded = market_tools.get_price_history("MSFT", period, interval, "columnar", delta=True)
+
+    assert encoded["history"]["encoding"] == "delta"
+    assert _decode_rows(encoded["history"]) == rows
+
+
+@pytest.mark.parametrize("precision", [0, 1, 2, 4])
+def test_columnar_precision_rounds_prices(precision):
+    columnar = market_tools.get_price_history("MSFT", "1mo", "1d", "columnar", precision)
+    rows = market_tools.get_price_history("MSFT", "1mo", "1d")["history"]
+
+    closes = columnar["history"]["c"]
+    assert closes == [round(c, precision) for c in closes]
+    for close, row in zip(closes, rows.values()):
+        assert abs(close - row["close"]) <= 0.5 * 10**-min(precision, 2) + 1e-9
+    # Volumes are whole shares whatever the precision
+    assert columnar["history"]["v"] == [row["volume"] for row in rows.values()]
+
+
+def test_negative_precision_is_treated_as_zero():
+    clamped = market_tools.get_price_history("MSFT", "5d", "1d", "columnar", -3)
+    whole = market_tools.get_price_history("MSFT", "5d", "1d", "columnar", 0)
+    assert clamped["history"] == whole["history"]
+
+
+def test_unknown_history_format_is_rejected():
+    response = market_tools.get_price_history("msft", "5d", "1d", format="csv")
+    assert "history" not in response
+    assert response["ticker"] == "MSFT"
+    assert response["error"] == "Unsupported format 'csv'. Use one of: rows, columnar."
@@ -0,0 +1,51 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rag_compress import compress_results, estimate_tokens  # noqa: E402
+
+
+def _report(record: int, bank: str, date: str, move: str) -> dict:
+    text = (
+        f"MONETARY POLICY REPORT #{record}\n"
+        f"Institution: {bank}\n"
+        f"Meeting Date: {date}\n"
+        f"Policy Action: raise rates by {move}\n"
+        f"Policy Stance: Hawkish\n"
+        f"The {bank} concluded its monetary policy meeting on {date} with the decision "
+        f"to raise rates by {move}, citing persistent services inflation. "
+        f"Committee members noted that wage growth remained firm across most sectors. "
+        f"Further adjustments will depend on incoming data."
+    )
+    return {"text": text, "score": 1.0 - record / 1000, "source": {"record": record}}
+
+
+REPORTS = [
+    _report(90, "Bank of England", "2024-11-25", "0.50%"),
+    _report(91, "Bank of England", "2025-02-06", "0.25%"),
+    _report(92, "Bank of England", "2025-05-08", "0.25%"),
+    _report(93, "European Central Bank", "2025-04-09", "0.25%"),
+]
+
+
+def test_distinct_same_template_records_survive():
+    results, stats = compress_results("Why did the ECB raise rates?", REPORTS, 10_000)
+    assert stats["duplicates_collapsed"] == 0
+    assert sorted(r["source"]["record"] for r in results) == [90, 91, 92, 93]
+
+
+def test_identical_passages_collapse():
+    copy = {**REPORTS[0], "score": 0.5, "source": {"record": 90, "chunk": 2}}
+    results, stats = compress_results("Bank of England rates", [REPORTS[0], copy], 10_000)
+    assert stats["duplicates_collapsed"] == 1
+    assert results[0]["duplicates"] == [{"record": 90, "chunk": 2}]
+
+
+def test_query_without_matching_terms_keeps_top_passages():
+    budget = estimate_tokens(REPORTS[0]["text"]) * 2
+    results, stats = compress_results("hawkish pivots", REPORTS, budget)
+    assert results, "over budget with no query-term match must still return passages"
+    assert results[0]["source"]["record"] == 90
+    assert results[0]["text"].startswith("MONETARY POLICY REPORT #90\nInstitution: Bank of England")
+    assert 0 < stats["tokens_after"] <= budget
@@ -0,0 +1,73 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rag_tools  # noqa: E402
+
+
+def test_query_all_kbs_reports_stragglers_as_timed_out(monkeypatch):
+    release = threading.Event()
+
+    def retrieve(name, query, max_results, since=None, until=None, **fields):
+        label = rag_tools.KNOWLEDGE_BASES[name]["kb_label"]
+        if name == "regulatory_changes":
+            release.wait(5)
+        return {"knowledge_base": label, "results": [{"text": f"{name} passage", "score": 0.5}]}
+
+    monkeypatch.setattr(rag_tools, "_retrieve_from_kb", retrieve)
+    monkeypatch.setattr(rag_tools._rag_resilience_config, "fanout_timeout", 0.2)
+    try:
+        response = rag_tools.query_all_kbs._tool_func("rates and capital rules")
+    finally:
+        release.set()
+
+    assert response["errors"] == {"kb-regulatory-changes": "Timed out after 0.2s."}
+    assert len(response["knowledge_bases"]) == 4
+    assert {r["knowledge_base"] for r in response["results"]} == {
+        "kb_monetary_policy_summaries",
+        "kb_economic_indicators",
+        "kb_policy_decisions",
+    }
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = 0
+
+    def retrieve(self, **kwargs):
+        self.calls += 1
+        return {
+            "retrievalResults": [
+                {"content": {"text": "The committee held rates at 5.25%."}, "score": 0.82}
+            ]
+        }
+
+
+def test_retrieval_cache_round_trip(monkeypatch, tmp_path):
+    client = FakeClient()
+    path = str(tmp_path / "retrieval_cache.json")
+    monkeypatch.setenv("KB_MONETARY_POLICY_ID", "KB123")
+    monkeypatch.setattr(rag_tools, "_get_bedrock_runtime", lambda: client)
+    monkeypatch.setattr(rag_tools._rag_cache_config, "path", path)
+    monkeypatch.setattr(rag_tools, "_retrieval_cache", rag_tools.TTLCache(maxsize=16))
+
+    def retrieve(query):
+        return rag_tools._retrieve_from_bedrock_kb(
+            "KB_MONETARY_POLICY_ID", "kb_monetary_policy_summaries", query, 3
+        )
+
+    first = retrieve("Where are rates?")
+    assert client.calls == 1 and rag_tools._unsaved_entries >= 1
+    rag_tools.save_retrieval_cache()
+    assert rag_tools._unsaved_entries == 0
+    assert [p.name for p in tmp_path.iterdir()] == ["retrieval_cache.json"]
+
+    # A fresh process: empty cache restored from disk
+    restored = rag_tools.TTLCache(maxsize=16)
+    assert restored.load(path) == 1
+    monkeypatch.setattr(rag_tools, "_retrieval_cache", restored)
+    second = retrieve("where are rates")
+    assert client.calls == 1
+    assert second == {**first, "cached": True}
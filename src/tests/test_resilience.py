@@ -0,0 +1,193 @@
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rag_tools  # noqa: E402
+from resilience import CircuitBreaker, HedgeBudget, hedged_call  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_breaker_opens_then_closes_after_successful_trial():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.state == "closed" and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    clock.now = 10
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()  # one trial at a time
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_breaker_reopens_after_failed_trial():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 10
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+    clock.now = 19
+    assert not breaker.allow()
+    clock.now = 20
+    assert breaker.allow()
+
+
+@pytest.fixture
+def pool():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+def _calls(*behaviours):
+    """Callable whose n-th invocation runs behaviours[n]."""
+    lock, count = threading.Lock(), [0]
+
+    def fn():
+        with lock:
+            n = count[0]
+            count[0] += 1
+        return behaviours[n]()
+
+    fn.count = count
+    return fn
+
+
+def test_hedge_fires_after_delay_and_first_success_wins(pool):
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return "primary"
+
+    fn = _calls(slow, lambda: "hedge")
+    try:
+        assert hedged_call(fn, 0.05, pool, HedgeBudget(1)) == ("hedge", True)
+    finally:
+        release.set()
+    assert fn.count[0] == 2
+
+
+def test_fast_primary_is_not_hedged(pool):
+    fn = _calls(lambda: "primary", lambda: "hedge")
+    assert hedged_call(fn, 1.0, pool, HedgeBudget(1)) == ("primary", False)
+    assert fn.count[0] == 1
+
+
+def test_hedge_raises_only_when_both_calls_fail(pool):
+    release = threading.Event()
+
+    def slow_failure():
+        release.wait(5)
+        raise TimeoutError("primary")
+
+    def failure():
+        release.set()
+        raise ConnectionError("hedge")
+
+    with pytest.raises((TimeoutError, ConnectionError)):
+        hedged_call(_calls(slow_failure, failure), 0.05, pool, HedgeBudget(1))
+
+    recovered = _calls(slow_failure, lambda: "hedge")
+    release.clear()
+    try:
+        assert hedged_call(recovered, 0.05, pool, HedgeBudget(1)) == ("hedge", True)
+    finally:
+        release.set()
+
+
+def test_spent_budget_waits_for_primary(pool):
+    release = threading.Event()
+    hedges = HedgeBudget(1)
+    held = hedges.submit(lambda: release.wait(5))
+    try:
+        fn = _calls(lambda: release.wait(5) and "primary", lambda: "hedge")
+        threading.Timer(0.1, release.set).start()
+        assert hedged_call(fn, 0.01, pool, hedges) == ("primary", False)
+        assert fn.count[0] == 1
+    finally:
+        release.set()
+        held.result(5)
+
+
+def test_without_delay_call_runs_on_caller_thread(pool):
+    caller = threading.current_thread()
+    assert hedged_call(lambda: threading.current_thread(), None, pool, HedgeBudget(1)) == (
+        caller,
+        False,
+    )
+
+
+class FailingClient:
+    def __init__(self):
+        self.calls = 0
+
+    def retrieve(self, **kwargs):
+        self.calls += 1
+        raise ConnectionError("endpoint unreachable")
+
+
+@pytest.fixture
+def failing_kb(monkeypatch):
+    client = FailingClient()
+    clock = FakeClock()
+    label = "kb_monetary_policy_summaries"
+    monkeypatch.setenv("KB_MONETARY_POLICY_ID", "KB123")
+    monkeypatch.setattr(rag_tools, "_get_bedrock_runtime", lambda: client)
+    monkeypatch.setitem(rag_tools._breakers, label, CircuitBreaker(1, 30, clock=clock))
+    monkeypatch.setattr(rag_tools, "_retrieval_cache", rag_tools.TTLCache(maxsize=16))
+    monkeypatch.setattr(rag_tools, "_stale_results", rag_tools.TTLCache(maxsize=16))
+    return client, clock, label
+
+
+def _retrieve(label, query):
+    return rag_tools._retrieve_from_bedrock_kb("KB_MONETARY_POLICY_ID", label, query, 3)
+
+
+def test_open_breaker_fast_fails_to_empty_result(failing_kb):
+    client, _, label = failing_kb
+    failed = rag_tools._latency[label]["error"].count
+
+    assert "error" in _retrieve(label, "rate path")
+    assert client.calls == 1
+    assert rag_tools._latency[label]["error"].count == failed + 1
+    response = _retrieve(label, "rate path")
+    assert client.calls == 1
+    assert response["degraded"] and response["results"] == []
+    assert "cached" not in response
+
+
+def test_open_breaker_fast_fails_to_stale_result(failing_kb):
+    client, clock, label = failing_kb
+    stale = [{"text": "Rates held at 5.25%", "score": 0.9, "source": None}]
+    key = (label, "KB123", "rate path", 3, "")
+    rag_tools._stale_results.set(key, stale, 3600)
+
+    first = _retrieve(label, "Rate path?")
+    assert first["degraded"] and first["results"] == stale
+    assert client.calls == 1
+    second = _retrieve(label, "rate path")
+    assert second["degraded"] and second["cached"] and second["results"] == stale
+    assert client.calls == 1
+
+    clock.now = 30  # half-open: one trial goes upstream again
+    _retrieve(label, "rate path")
+    assert client.calls == 2
@@ -0,0 +1,95 @@
+import asyncio
+import inspect
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strands.tools.executors import ConcurrentToolExecutor  # noqa: E402
+
+from tool_executor import BoundedToolExecutor, _Slots  # noqa: E402
+
+
+def test_concurrent_task_signature_unchanged():
+    # BoundedToolExecutor._task wraps this private method and forwards (agent, tool_use, ...)
+    params = list(inspect.signature(ConcurrentToolExecutor._task).parameters)
+    assert params == [
+        "self",
+        "agent",
+        "tool_use",
+        "tool_results",
+        "cycle_trace",
+        "cycle_span",
+        "invocation_state",
+        "task_id",
+        "task_queue",
+        "task_event",
+        "stop_event",
+        "structured_output_context",
+    ]
+
+
+def _run_calls(monkeypatch, executor, names, seconds=0.05):
+    started = {}
+
+    async def fake_task(self, agent, tool_use, *args, **kwargs):
+        started[tool_use["toolUseId"]] = asyncio.get_running_loop().time()
+        await asyncio.sleep(seconds)
+
+    monkeypatch.setattr(ConcurrentToolExecutor, "_task", fake_task)
+
+    async def main():
+        t0 = asyncio.get_running_loop().time()
+        calls = [{"name": n, "toolUseId": f"{n}-{i}"} for i, n in enumerate(names)]
+        await asyncio.gather(*(executor._task(None, tool_use) for tool_use in calls))
+        return {k: v - t0 for k, v in started.items()}
+
+    return asyncio.run(main())
+
+
+def test_per_tool_cap_does_not_hold_global_slots(monkeypatch):
+    executor = BoundedToolExecutor(max_concurrency=2, per_tool_limits={"slow": 1})
+    started = _run_calls(monkeypatch, executor, ["slow", "slow", "slow", "fast"])
+    # Slow calls queued on their own cap leave the second global slot to "fast"
+    assert started["fast-3"] < 0.03
+    assert executor.stats()["peak_running"] == 2
+    assert executor.stats()["running"] == 0
+
+
+def test_slots_hand_over_across_event_loops():
+    slots = _Slots(1)
+    order = []
+    held = threading.Event()
+
+    async def hold(name, seconds):
+        await slots.acquire()
+        order.append(name)
+        held.set()
+        await asyncio.sleep(seconds)
+        slots.release()
+
+    first = threading.Thread(target=asyncio.run, args=(hold("a", 0.1),))
+    first.start()
+    held.wait()
+    second = threading.Thread(target=asyncio.run, args=(hold("b", 0),))
+    second.start()
+    first.join()
+    second.join()
+    assert order == ["a", "b"]
+    assert slots._free == 1
+
+
+def test_cancelled_waiter_gives_up_its_place():
+    slots = _Slots(1)
+
+    async def main():
+        await slots.acquire()
+        waiter = asyncio.ensure_future(slots.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        slots.release()
+        return await slots.acquire()
+
+    assert asyncio.run(main()) is False
@@ -0,0 +1,130 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tracing import (  # noqa: E402
+    BatchExporter,
+    RemoteParent,
+    Span,
+    Tracer,
+    _UnsampledSpan,
+    parse_traceparent,
+)
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+class Collect:
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, spans):
+        self.batches.append([span.to_otlp() for span in spans])
+
+
+@pytest.fixture
+def exported():
+    collect = Collect()
+    # A long interval keeps the background thread idle; tests flush explicitly
+    return collect, BatchExporter(collect, batch_size=8, interval=3600, max_queue=4)
+
+
+def test_unsampled_parent_yields_unsampled_children(exported):
+    _, exporter = exported
+    tracer = Tracer(sample_rate=1.0, exporter=exporter)
+
+    remote = tracer.start_span("request", parent=RemoteParent(1, 2, sampled=False))
+    assert isinstance(remote, _UnsampledSpan)
+    with remote:
+        child = tracer.start_span("tool.call")
+    assert isinstance(child, _UnsampledSpan) and child.traceparent is None
+    with tracer.start_span("local", parent=child) as grandchild:
+        grandchild.set_attribute("ignored", True)
+    assert isinstance(grandchild, _UnsampledSpan)
+    assert len(exporter._queue) == 0
+
+    unsampled_root = Tracer(sample_rate=0.0, exporter=exporter).start_span("request")
+    assert isinstance(unsampled_root, _UnsampledSpan)
+    assert isinstance(tracer.start_span("child", parent=unsampled_root), _UnsampledSpan)
+
+
+def test_sampled_traceparent_is_continued(exported):
+    _, exporter = exported
+    tracer = Tracer(exporter=exporter)
+    parent = parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-01")
+
+    span = tracer.start_span("request", parent=parent)
+    assert isinstance(span, Span)
+    assert span.traceparent.startswith(f"00-{TRACE_ID}-")
+    assert span.parent_id == int(PARENT_ID, 16)
+
+
+@pytest.mark.parametrize("header", [
+    None,
+    "",
+    "garbage",
+    f"00-{TRACE_ID}-{PARENT_ID}",
+    f"00-{TRACE_ID[:-1]}-{PARENT_ID}-01",
+    f"00-{TRACE_ID}-{PARENT_ID}0-01",
+    f"00-{'z' * 32}-{PARENT_ID}-01",
+    f"00-{TRACE_ID}-{PARENT_ID}-xx",
+    f"00-{'0' * 32}-{PARENT_ID}-01",
+    f"00-{TRACE_ID}-{'0' * 16}-01",
+])
+def test_malformed_traceparent_is_ignored(header):
+    assert parse_traceparent(header) is None
+
+
+def test_traceparent_flags():
+    assert parse_traceparent(f" 00-{TRACE_ID}-{PARENT_ID}-01 ").sampled
+    assert not parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-00").sampled
+
+
+def test_queue_overflow_drops_and_counts(exported):
+    collect, exporter = exported
+    tracer = Tracer(exporter=exporter)
+
+    for i in range(6):
+        tracer.start_span(f"span-{i}").end()
+    assert exporter.dropped == 2
+    assert tracer.stats()["queued"] == 4
+
+    exporter.flush()
+    assert [s["name"] for s in collect.batches[0]] == [f"span-{i}" for i in range(4)]
+    assert tracer.stats()["exported"] == 4 and tracer.stats()["dropped"] == 2
+
+
+def test_lazy_attributes_are_evaluated_at_export(exported):
+    collect, exporter = exported
+    tracer = Tracer(exporter=exporter)
+    calls = []
+
+    def filters():
+        calls.append(1)
+        return "bank=Fed"
+
+    with tracer.start_span("kb.retrieve", **{"econflux.kb.filters": filters}) as span:
+        span.set_attribute("econflux.kb.hits", lambda: calls.append(2) or 3)
+    assert calls == []
+
+    exporter.flush()
+    attributes = {a["key"]: a["value"] for a in collect.batches[0][0]["attributes"]}
+    assert calls == [1, 2]
+    assert attributes == {
+        "econflux.kb.filters": {"stringValue": "bank=Fed"},
+        "econflux.kb.hits": {"intValue": "3"},
+    }
+
+
+def test_failing_lazy_attribute_does_not_break_export(exported):
+    collect, exporter = exported
+    tracer = Tracer(exporter=exporter)
+
+    tracer.start_span("op", broken=lambda: 1 / 0).end()
+    exporter.flush()
+    (attribute,) = collect.batches[0][0]["attributes"]
+    assert attribute["value"]["stringValue"].startswith("<attribute failed:")
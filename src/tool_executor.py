@@ -0,0 +1,141 @@
+"""
+Bounded concurrent execution of the tool calls in one model turn.
+
+When one assistant message asks for several independent tools (price, history
+and earnings for three retailers), Strands' `ConcurrentToolExecutor` runs them
+together, but without any limit: every session's tool calls and every
+fan-out tool compete for threads and upstream connections at once.
+`BoundedToolExecutor` keeps the concurrency while capping it:
+
+- at most `max_concurrency` tool calls run at a time across all agents sharing
+  the executor (sync tools each occupy a worker thread while running);
+- tools listed in `per_tool_limits` run at most that many at a time.
+
+Calls over a limit wait their turn inside the same turn; results keep the order
+the model asked for them. A call takes its per-tool slot before a global one, so
+calls queued behind a per-tool cap never hold global slots other tools could use.
+
+The executor wraps `ConcurrentToolExecutor._task`, a private method; its
+signature is checked by tests/test_tool_executor.py against the pinned
+strands-agents release.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import Counter, deque
+from typing import Any, Dict, Optional
+
+from strands.tools.executors import ConcurrentToolExecutor, SequentialToolExecutor
+
+from config import ToolExecutionConfig
+
+
+class _Slots:
+    """
+    Counting semaphore awaited from several event loops: agents run on their own
+    loops, so a release hands the slot to the oldest waiter through its loop.
+    """
+
+    def __init__(self, limit: int):
+        self._free = limit
+        self._waiters: deque = deque()  # (loop, future)
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> bool:
+        """Take a slot without blocking the event loop; True if the call had to wait."""
+        with self._lock:
+            if self._free and not self._waiters:
+                self._free -= 1
+                return False
+            loop = asyncio.get_running_loop()
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                queued = waiter in self._waiters
+                if queued:
+                    self._waiters.remove(waiter)
+            # Handed over already: give the slot back (a pending hand-over does it itself)
+            if not queued and waiter[1].done() and not waiter[1].cancelled():
+                self.release()
+            raise
+        return True
+
+    def release(self) -> None:
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._free += 1
+                    return
+                loop, future = self._waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(self._hand_over, future)
+                return
+            except RuntimeError:  # the waiter's loop is closed
+                continue
+
+    def _hand_over(self, future: asyncio.Future) -> None:
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+
+class BoundedToolExecutor(ConcurrentToolExecutor):
+    """`ConcurrentToolExecutor` with a global and per-tool cap on running tool calls."""
+
+    def __init__(self, max_concurrency: int = 16, per_tool_limits: Optional[Dict[str, int]] = None):
+        super().__init__()
+        self.max_concurrency = max_concurrency
+        self.per_tool_limits = dict(per_tool_limits or {})
+        self._slots = _Slots(max_concurrency)
+        self._tool_slots = {name: _Slots(limit) for name, limit in self.per_tool_limits.items()}
+        self._counters: Counter = Counter()
+        self._running = 0
+        self._lock = threading.Lock()
+
+    async def _task(self, agent: Any, tool_use: Any, *args: Any, **kwargs: Any) -> None:
+        slots = [self._slots]
+        if tool_use.get("name") in self._tool_slots:
+            slots.insert(0, self._tool_slots[tool_use["name"]])
+
+        acquired = []
+        try:
+            waited = False
+            for slot in slots:
+                waited = await slot.acquire() or waited
+                acquired.append(slot)
+            with self._lock:
+                self._counters["calls"] += 1
+                self._counters["waited"] += waited
+                self._running += 1
+                self._counters["peak_running"] = max(self._counters["peak_running"], self._running)
+            try:
+                await super()._task(agent, tool_use, *args, **kwargs)
+            finally:
+                with self._lock:
+                    self._running -= 1
+        finally:
+            for slot in reversed(acquired):
+                slot.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Limits, tool calls run, calls that waited for a slot, and peak concurrent calls."""
+        with self._lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "per_tool_limits": dict(self.per_tool_limits),
+                "running": self._running,
+                **{name: self._counters[name] for name in ("calls", "waited", "peak_running")},
+            }
+
+
+def build_tool_executor(cfg: ToolExecutionConfig):
+    """Executor for `cfg.mode`: "concurrent" (bounded, default) or "sequential"."""
+    if cfg.mode == "sequential":
+        return SequentialToolExecutor()
+    return BoundedToolExecutor(cfg.max_concurrency, cfg.per_tool_limits)
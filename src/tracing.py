@@ -0,0 +1,541 @@
+"""
+Request tracing with OpenTelemetry-compatible spans.
+
+A trace follows one invocation:
+
+    econflux.request                  app.py (one per invoke, streaming or not)
+      model.turn                      one model call and the tool calls it requested
+        tool.call                     one per tool (see `instrumentation.AgentTracing`)
+          kb.retrieve                 a knowledge-base lookup (any backend)
+            bedrock.retrieve          the Bedrock Retrieve call on a cache miss
+
+Spans carry W3C trace/span ids and are exported in the OTLP/JSON format, so an
+OpenTelemetry collector or tracing backend can ingest them; the OpenTelemetry
+SDK is not needed.
+
+- Head-based sampling: whether a trace is recorded is decided once, when its
+  root span starts (TRACE_SAMPLE_RATE, or the sampled flag of an incoming W3C
+  `traceparent` header); child spans follow their parent. Spans of unsampled
+  traces are inert placeholders.
+- Lazy attributes: an attribute value may be a zero-argument callable; it is only
+  called when the span is exported (on the exporter thread) or logged.
+- Export: finished spans are queued and written in batches by a background thread,
+  as OTLP JSON lines to TRACE_FILE (TRACE_EXPORTER=file) or POSTed to an OTLP/HTTP
+  endpoint (TRACE_EXPORTER=otlp). The queue is bounded; spans over TRACE_MAX_QUEUE
+  are dropped and counted rather than blocking a request. With LOG_LEVEL=TRACE,
+  finished spans are also logged at the TRACE level.
+
+The active span is kept in a context variable. Work handed to a thread pool runs
+outside it; wrap the callable with `bind()` to keep its spans in the trace.
+
+For local runs without a collector:
+
+    python tracing.py collect --port 4318 --out traces.jsonl   # OTLP/HTTP stand-in
+    python tracing.py show traces.jsonl                        # print span trees
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import contextvars
+import json
+import logging
+import random
+import threading
+import time
+import urllib.request
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from config import load_tracing_config
+
+logger = logging.getLogger(__name__)
+
+# Custom log level below DEBUG, used by app.py's --log-level TRACE
+TRACE_LEVEL = 5
+
+# OTLP span kinds
+INTERNAL, SERVER, CLIENT = 1, 2, 3
+
+# invocation_state key carrying the request span into the agent's hooks
+REQUEST_SPAN_KEY = "econflux_span"
+
+_current: contextvars.ContextVar[Optional[Any]] = contextvars.ContextVar(
+    "econflux_span", default=None
+)
+_CURRENT = object()
+
+
+def _random_id(bits: int) -> int:
+    return random.getrandbits(bits) or 1
+
+
+class Span:
+    """A timed, sampled operation. Use as a context manager (activates it) or call `end()`."""
+
+    sampled = True
+    __slots__ = (
+        "_tracer", "_token", "name", "kind", "trace_id", "span_id", "parent_id",
+        "attributes", "error", "start_ns", "end_ns",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: int,
+        parent_id: Optional[int],
+        kind: int,
+        attributes: Dict[str, Any],
+    ):
+        self._tracer = tracer
+        self._token = None
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = _random_id(64)
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.error: Any = None
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set `key`; `value` may be a zero-argument callable evaluated at export."""
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def record_error(self, error: Any) -> None:
+        """Mark the span failed with an exception or message."""
+        self.error = error
+
+    @property
+    def traceparent(self) -> str:
+        """W3C `traceparent` header value for calls made on behalf of this span."""
+        return f"00-{self.trace_id:032x}-{self.span_id:016x}-01"
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self._tracer._on_end(self)
+
+    def __enter__(self) -> "Span":
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _current.reset(self._token)
+        if exc is not None and self.error is None:
+            self.error = exc
+        self.end()
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """The span in OTLP/JSON form, evaluating lazy attributes."""
+        span: Dict[str, Any] = {
+            "traceId": f"{self.trace_id:032x}",
+            "spanId": f"{self.span_id:016x}",
+            "parentSpanId": f"{self.parent_id:016x}" if self.parent_id else "",
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_key_value(k, v) for k, v in self.attributes.items()],
+            "status": {},
+        }
+        if self.error is not None:
+            span["status"] = {"code": 2, "message": str(self.error)}
+            if isinstance(self.error, BaseException):
+                span["events"] = [
+                    {
+                        "name": "exception",
+                        "timeUnixNano": str(self.end_ns),
+                        "attributes": [
+                            _key_value("exception.type", type(self.error).__name__),
+                            _key_value("exception.message", str(self.error)),
+                        ],
+                    }
+                ]
+        return span
+
+    def __str__(self) -> str:
+        duration_ms = ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+        attributes = {k: _evaluate(v) for k, v in self.attributes.items()}
+        status = f" error={self.error}" if self.error is not None else ""
+        return (
+            f"{self.name} trace={self.trace_id:032x} span={self.span_id:016x} "
+            f"parent={self.parent_id or 0:016x} {duration_ms:.1f} ms{status} {attributes}"
+        )
+
+
+class _UnsampledSpan:
+    """Placeholder for spans of unsampled traces; records nothing."""
+
+    sampled = False
+    trace_id = span_id = parent_id = None
+    traceparent = None
+    __slots__ = ("_token",)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+    def record_error(self, error: Any) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> "_UnsampledSpan":
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _current.reset(self._token)
+
+
+class RemoteParent:
+    """Span context received from a caller in a W3C `traceparent` header."""
+
+    __slots__ = ("trace_id", "span_id", "sampled")
+
+    def __init__(self, trace_id: int, span_id: int, sampled: bool):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.sampled = sampled
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[RemoteParent]:
+    """Parse "00-<trace id>-<parent id>-<flags>"; None if absent or malformed."""
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        trace_id, span_id, flags = int(parts[1], 16), int(parts[2], 16), int(parts[3], 16)
+    except ValueError:
+        return None
+    if not trace_id or not span_id:
+        return None
+    return RemoteParent(trace_id, span_id, bool(flags & 1))
+
+
+def _evaluate(value: Any) -> Any:
+    if callable(value):
+        try:
+            return value()
+        except Exception as exc:
+            return f"<attribute failed: {exc}>"
+    return value
+
+
+def _any_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_any_value(item) for item in value]}}
+    return {"stringValue": str(value)}
+
+
+def _key_value(key: str, value: Any) -> Dict[str, Any]:
+    return {"key": key, "value": _any_value(_evaluate(value))}
+
+
+def otlp_payload(spans: List[Span], service_name: str) -> Dict[str, Any]:
+    """OTLP/JSON ExportTraceServiceRequest for `spans`."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [_key_value("service.name", service_name)]},
+                "scopeSpans": [
+                    {"scope": {"name": "econflux"}, "spans": [s.to_otlp() for s in spans]}
+                ],
+            }
+        ]
+    }
+
+
+class FileExporter:
+    """Appends each batch as one OTLP JSON line to `path`."""
+
+    def __init__(self, path: str, service_name: str = "econflux"):
+        self.path = path
+        self.service_name = service_name
+
+    def __call__(self, spans: List[Span]) -> None:
+        line = json.dumps(otlp_payload(spans, self.service_name), separators=(",", ":"))
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class OtlpHttpExporter:
+    """POSTs each batch to an OTLP/HTTP endpoint (JSON encoding)."""
+
+    def __init__(self, endpoint: str, service_name: str = "econflux", timeout: float = 5.0):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+
+    def __call__(self, spans: List[Span]) -> None:
+        body = json.dumps(otlp_payload(spans, self.service_name)).encode("utf-8")
+        request = urllib.request.Request(
+            self.endpoint, data=body, headers={"Content-Type": "application/json"}, method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class BatchExporter:
+    """Queues finished spans and exports them in batches from a background thread."""
+
+    def __init__(
+        self,
+        export: Callable[[List[Span]], None],
+        batch_size: int = 256,
+        interval: float = 2.0,
+        max_queue: int = 4096,
+    ):
+        self._export = export
+        self.batch_size = batch_size
+        self.interval = interval
+        self.max_queue = max_queue
+        self._queue: deque = deque()
+        self._wake = threading.Event()
+        self._flush_lock = threading.Lock()
+        self.exported = 0
+        self.dropped = 0
+        self.failed = 0
+        threading.Thread(target=self._run, name="trace-export", daemon=True).start()
+
+    def add(self, span: Span) -> None:
+        if len(self._queue) >= self.max_queue:
+            self.dropped += 1
+            return
+        self._queue.append(span)
+        if len(self._queue) >= self.batch_size:
+            self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Export everything queued so far."""
+        with self._flush_lock:
+            while self._queue:
+                batch = []
+                while self._queue and len(batch) < self.batch_size:
+                    batch.append(self._queue.popleft())
+                try:
+                    self._export(batch)
+                    self.exported += len(batch)
+                except Exception as exc:
+                    self.failed += len(batch)
+                    logger.warning(f"Trace export of {len(batch)} spans failed: {exc}")
+
+
+class Tracer:
+    """Starts spans, applies head sampling and hands finished spans to the exporter."""
+
+    def __init__(self, sample_rate: float = 1.0, exporter: Optional[BatchExporter] = None):
+        self.sample_rate = sample_rate
+        self.exporter = exporter
+        # Without an exporter, spans are only worth recording for TRACE logging
+        self.enabled = exporter is not None or logger.isEnabledFor(TRACE_LEVEL)
+
+    def start_span(
+        self, name: str, parent: Any = _CURRENT, kind: int = INTERNAL, **attributes: Any
+    ) -> Any:
+        """
+        New span under `parent` (default: the active span; None starts a trace).
+        Returns an inert placeholder if the trace is not sampled. The span is not
+        activated; use it as a context manager for that.
+        """
+        if parent is _CURRENT:
+            parent = _current.get()
+        if not self.enabled:
+            return _UnsampledSpan()
+        if parent is None:
+            if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+                return _UnsampledSpan()
+            return Span(self, name, _random_id(128), None, kind, attributes)
+        if not parent.sampled:
+            return _UnsampledSpan()
+        return Span(self, name, parent.trace_id, parent.span_id, kind, attributes)
+
+    def _on_end(self, span: Span) -> None:
+        if self.exporter is not None:
+            self.exporter.add(span)
+        if logger.isEnabledFor(TRACE_LEVEL):
+            logger.log(TRACE_LEVEL, "span %s", span)
+
+    def stats(self) -> Dict[str, Any]:
+        """Sampling rate and exported/dropped/failed span counters."""
+        exporter = self.exporter
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "queued": len(exporter._queue) if exporter else 0,
+            "exported": exporter.exported if exporter else 0,
+            "dropped": exporter.dropped if exporter else 0,
+            "failed": exporter.failed if exporter else 0,
+        }
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def _build_tracer() -> Tracer:
+    cfg = load_tracing_config()
+    export: Optional[Callable[[List[Span]], None]] = None
+    if cfg.exporter == "file":
+        export = FileExporter(cfg.file_path, cfg.service_name)
+    elif cfg.exporter == "otlp":
+        export = OtlpHttpExporter(cfg.otlp_endpoint, cfg.service_name)
+    elif cfg.exporter != "off":
+        logger.warning(f"Unknown TRACE_EXPORTER {cfg.exporter!r}; tracing disabled")
+    exporter = None
+    if export is not None:
+        exporter = BatchExporter(export, cfg.batch_size, cfg.export_interval, cfg.max_queue)
+        atexit.register(exporter.flush)
+    return Tracer(cfg.sample_rate, exporter)
+
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer configured from the TRACE_* settings on first use."""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = _build_tracer()
+    return _tracer
+
+
+def start_span(name: str, parent: Any = _CURRENT, kind: int = INTERNAL, **attributes: Any) -> Any:
+    """`Tracer.start_span` on the process-wide tracer."""
+    return get_tracer().start_span(name, parent, kind, **attributes)
+
+
+def current_span() -> Optional[Any]:
+    """The active span of this context, if any."""
+    return _current.get()
+
+
+def activate(span: Any) -> contextvars.Token:
+    """Make `span` the active span of the current context (for start/end hook pairs)."""
+    return _current.set(span)
+
+
+@contextmanager
+def use_span(span: Any) -> Iterator[Any]:
+    """Activate `span` for the block without ending it."""
+    token = _current.set(span)
+    try:
+        yield span
+    finally:
+        _current.reset(token)
+
+
+def bind(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """`fn` running in a copy of the current context (keeps the active span across threads)."""
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.run(fn, *args, **kwargs)
+
+
+def serve_collector(port: int, path: str) -> None:
+    """Minimal OTLP/HTTP (JSON) collector stand-in appending received traces to `path`."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                self.send_error(400, "Expected OTLP/JSON")
+                return
+            with lock, open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(payload, separators=(",", ":")) + "\n")
+            spans = sum(
+                len(scope.get("spans", []))
+                for resource in payload.get("resourceSpans", [])
+                for scope in resource.get("scopeSpans", [])
+            )
+            print(f"Received {spans} spans")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    print(f"Collecting OTLP/HTTP traces on http://127.0.0.1:{port}/v1/traces into {path}")
+    ThreadingHTTPServer(("127.0.0.1", port), Handler).serve_forever()
+
+
+def _plain(value: Dict[str, Any]) -> Any:
+    """Python value of an OTLP AnyValue."""
+    kind, inner = next(iter(value.items()))
+    if kind == "arrayValue":
+        return [_plain(item) for item in inner.get("values", [])]
+    return int(inner) if kind == "intValue" else inner
+
+
+def show_traces(path: str) -> None:
+    """Print the span tree of each trace in an OTLP JSON lines file."""
+    spans: List[Dict[str, Any]] = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            for resource in json.loads(line).get("resourceSpans", []):
+                for scope in resource.get("scopeSpans", []):
+                    spans.extend(scope.get("spans", []))
+
+    children: Dict[str, List[Dict[str, Any]]] = {}
+    ids = {span["spanId"] for span in spans}
+    for span in sorted(spans, key=lambda s: int(s["startTimeUnixNano"])):
+        parent = span["parentSpanId"] if span["parentSpanId"] in ids else ""
+        children.setdefault(parent, []).append(span)
+
+    def render(span: Dict[str, Any], depth: int) -> None:
+        ms = (int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])) / 1e6
+        attributes = {a["key"]: _plain(a["value"]) for a in span["attributes"]}
+        error = " ERROR" if span.get("status", {}).get("code") == 2 else ""
+        print(f"{'  ' * depth}{span['name']} {ms:.1f} ms{error} {attributes}")
+        for child in children.get(span["spanId"], []):
+            render(child, depth + 1)
+
+    for root in children.get("", []):
+        print(f"trace {root['traceId']}")
+        render(root, 1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local trace collector and viewer")
+    commands = parser.add_subparsers(dest="command", required=True)
+    collect = commands.add_parser("collect", help="Run a stand-in OTLP/HTTP collector")
+    collect.add_argument("--port", type=int, default=4318)
+    collect.add_argument("--out", default="traces.jsonl")
+    show = commands.add_parser("show", help="Print span trees from an OTLP JSON lines file")
+    show.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "collect":
+        serve_collector(args.port, args.out)
+    else:
+        show_traces(args.path)
@@ -0,0 +1,64 @@
+"""
+Named ticker universes used by the screening and calendar tools.
+
+Sector baskets list representative US large caps; `large_cap` is their union.
+They are static lists, not index memberships, so rebalance them here as needed.
+`total_market` pads `large_cap` with generated four-letter placeholder listings
+to the size of a US total-market index, so screening is exercised at scale.
+"""
+
+from itertools import islice
+from string import ascii_uppercase
+from typing import Dict, Iterator, List
+
+TOTAL_MARKET_SIZE = 5000
+
+SECTOR_UNIVERSES: Dict[str, List[str]] = {
+    "mega_cap_tech": ["AAPL", "MSFT", "GOOGL", "AMZN", "META", "NVDA", "TSLA"],
+    "semiconductors": [
+        "NVDA", "AMD", "INTC", "AVGO", "QCOM", "TXN", "MU", "ASML",
+        "TSM", "AMAT", "LRCX", "KLAC", "ADI", "MRVL", "ON",
+    ],
+    "retail": ["WMT", "TGT", "COST", "HD", "LOW", "TJX", "ROST", "DG", "DLTR", "KR", "BBY", "AMZN"],
+    "banks": ["JPM", "BAC", "WFC", "C", "GS", "MS", "USB", "PNC", "TFC", "SCHW", "BK", "STT"],
+    "autos": ["TSLA", "F", "GM", "TM", "HMC", "STLA", "RIVN", "LCID"],
+    "energy": ["XOM", "CVX", "COP", "EOG", "SLB", "OXY", "PSX", "MPC", "VLO"],
+    "healthcare": ["UNH", "JNJ", "LLY", "PFE", "MRK", "ABBV", "TMO", "ABT", "DHR", "BMY", "AMGN"],
+    "consumer": ["PG", "KO", "PEP", "MCD", "SBUX", "NKE", "DIS", "NFLX", "CMCSA"],
+    "industrials": ["BA", "CAT", "GE", "HON", "UPS", "UNP", "LMT", "RTX", "DE", "MMM", "EADSY"],
+}
+
+LARGE_CAP = list(dict.fromkeys(t for basket in SECTOR_UNIVERSES.values() for t in basket))
+
+
+def _placeholder_listings() -> Iterator[str]:
+    """Four-letter symbols spread evenly over AAAA-ZZZZ."""
+    combinations = len(ascii_uppercase) ** 4
+    for code in range(0, combinations, combinations // TOTAL_MARKET_SIZE):
+        yield "".join(ascii_uppercase[code // 26**k % 26] for k in (3, 2, 1, 0))
+
+
+UNIVERSES: Dict[str, List[str]] = {
+    **SECTOR_UNIVERSES,
+    "large_cap": LARGE_CAP,
+    "total_market": LARGE_CAP
+    + list(
+        islice(
+            (s for s in _placeholder_listings() if s not in LARGE_CAP),
+            TOTAL_MARKET_SIZE - len(LARGE_CAP),
+        )
+    ),
+}
+
+
+def resolve_universe(name: str) -> List[str]:
+    """
+    Return the symbols of a named universe.
+
+    Raises:
+        ValueError: Unknown universe name.
+    """
+    key = name.strip().lower()
+    if key not in UNIVERSES:
+        raise ValueError(f"Unknown universe '{name}'. Use one of: {', '.join(UNIVERSES)}.")
+    return UNIVERSES[key]
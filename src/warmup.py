@@ -0,0 +1,78 @@
+"""
+Startup warm-up state for the AgentCore container.
+
+The first request after a deploy would otherwise pay for imports, credential
+loading, endpoint resolution and TLS handshakes. `app.py` runs a list of named
+warm-up steps once at startup; `Warmup` times each step and records its
+outcome, and `warmup_status()` reports it to the `ping` tool and the `/health`
+route.
+
+Status goes cold -> warming -> warm. A failing step is logged and recorded under
+its name but does not stop the others; the container still becomes warm.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Step = Tuple[str, Callable[[], Any]]
+
+
+class Warmup:
+    """Runs warm-up steps once and keeps their timings."""
+
+    def __init__(self):
+        self.status = "cold"
+        self.duration_ms: Optional[float] = None
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def run(self, steps: List[Step]) -> Dict[str, Any]:
+        """Run `steps` in order (no-op if warm-up already ran) and return the status."""
+        with self._lock:
+            if self.status != "cold":
+                return self.snapshot()
+            self.status = "warming"
+
+        started = time.perf_counter()
+        for name, step in steps:
+            step_started = time.perf_counter()
+            outcome: Dict[str, Any] = {"ok": True}
+            try:
+                step()
+            except Exception as exc:
+                logger.warning(f"Warm-up step {name} failed: {exc}")
+                outcome = {"ok": False, "error": str(exc)}
+            outcome["ms"] = round((time.perf_counter() - step_started) * 1000.0, 1)
+            self.steps[name] = outcome
+
+        self.duration_ms = round((time.perf_counter() - started) * 1000.0, 1)
+        self.status = "warm"
+        logger.info(f"Warm-up finished in {self.duration_ms:.0f} ms: {self.steps}")
+        return self.snapshot()
+
+    def start(self, steps: List[Step]) -> threading.Thread:
+        """Run `steps` on a background thread."""
+        thread = threading.Thread(target=self.run, args=(steps,), name="warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"status": self.status, "duration_ms": self.duration_ms, "steps": dict(self.steps)}
+
+
+_warmup = Warmup()
+
+
+def get_warmup() -> Warmup:
+    return _warmup
+
+
+def warmup_status() -> Dict[str, Any]:
+    """Warm-up status (cold, warming, warm), total duration and per-step timings."""
+    return _warmup.snapshot()